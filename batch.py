@@ -0,0 +1,192 @@
+# batch.py
+# Qt olmadan toplu analiz: python -m batch jobs.json
+#
+# İş tanımı (JSON):
+# {
+#   "workers": 4,                 # süreç sayısı (varsayılan: çekirdek sayısı / blas_threads)
+#   "blas_threads": 1,            # her süreçteki BLAS/OpenMP iş parçacığı sayısı
+#   "output_dir": "results",
+#   "jobs": [{
+#     "name": "kiris_E210",
+#     "mesh": "kiris.vtu",
+#     "material": {"E": 210e9, "nu": 0.3},
+#     "solver": {"method": "iterative", "preconditioner": "block_jacobi", "matrix_free": true},
+#     "fixed": [{"nodes": [0, 1, 2], "components": "xyz"},
+#               {"plane": {"origin": [0, 0, 0], "normal": [1, 0, 0], "tolerance": 1e-6}}],
+#     "loads": {"Yük Durumu 1": [{"box": {"lower": [...], "upper": [...]}, "total_force": [0, 0, -1000]}]},
+#     "outputs": ["npz", "vtu"]
+#   }]
+# }
+# Düğüm kümeleri "nodes", "box", "sphere" veya "plane" ile verilir. Yükler düğüm başına "force"
+# ya da kümeye eşit paylaştırılan "total_force" olabilir.
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pyvista as pv
+
+from bc_store import DEFAULT_LOAD_CASE, BoundaryConditionStore
+from mesh_cache import read_mesh_arrays, write_mesh_arrays
+from selection import distribute_force, nodes_in_box, nodes_in_sphere, nodes_near_plane
+from solver import SolverOptions, solve_load_cases
+
+BLAS_THREAD_VARIABLES = (
+    "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS",
+)
+
+
+def resolve_node_set(points, spec):
+    if "nodes" in spec:
+        return np.unique(np.asarray(spec["nodes"], dtype=np.int64))
+    if "box" in spec:
+        return nodes_in_box(points, spec["box"]["lower"], spec["box"]["upper"])
+    if "sphere" in spec:
+        return nodes_in_sphere(points, spec["sphere"]["center"], spec["sphere"]["radius"])
+    if "plane" in spec:
+        plane = spec["plane"]
+        return nodes_near_plane(points, plane["origin"], plane["normal"], plane.get("tolerance", 1e-9))
+    raise ValueError(f"Düğüm kümesi tanımı anlaşılamadı: {sorted(spec)}")
+
+
+def build_boundary_conditions(mesh, job):
+    points = np.asarray(mesh.points)
+    bcs = BoundaryConditionStore(mesh.n_points)
+    for spec in job.get("fixed", []):
+        components = [axis in spec.get("components", "xyz").lower() for axis in "xyz"]
+        bcs.fix(resolve_node_set(points, spec), components)
+    load_cases = job.get("loads", {})
+    for case, entries in load_cases.items():
+        if case not in bcs.load_cases:
+            bcs.add_load_case(case)
+        bcs.set_active_case(case)
+        for spec in entries:
+            nodes = resolve_node_set(points, spec)
+            if "total_force" in spec:
+                bcs.loads[nodes] += distribute_force(nodes, spec["total_force"])
+            else:
+                bcs.loads[nodes] += np.asarray(spec["force"], dtype=float)
+    if load_cases and DEFAULT_LOAD_CASE not in load_cases:
+        bcs.remove_load_case(DEFAULT_LOAD_CASE)
+    return bcs
+
+
+def solver_options(job):
+    # Kullanıcının "solver" bloğu varsayılanların üzerine yazılır; method verilmezse "auto"
+    return SolverOptions(**job.get("solver", {}))
+
+
+def run_job(job, mesh_dir, output_dir):
+    # Alt süreçte çalışır; mesh, ana sürecin yazdığı .npy dosyalarından bellek eşlemeli okunur
+    start = time.perf_counter()
+    mesh = read_mesh_arrays(mesh_dir)
+    bcs = build_boundary_conditions(mesh, job)
+    options = solver_options(job)
+    results = solve_load_cases(mesh, job["material"], bcs.constrained_dofs(), bcs.load_vectors(), options)
+
+    name = job["name"]
+    written = []
+    outputs = job.get("outputs", ["npz"])
+    if "npz" in outputs:
+        arrays = {}
+        for case, result in results.items():
+            arrays[f"{case}/displacement"] = result.displacements
+            arrays[f"{case}/stress"] = result.stresses
+        path = os.path.join(output_dir, f"{name}.npz")
+        np.savez(path, **arrays)
+        written.append(path)
+    if "vtu" in outputs:
+        for case, result in results.items():
+            mesh.point_data[f"displacement[{case}]"] = result.displacements
+            mesh.cell_data[f"stress[{case}]"] = result.stresses
+        path = os.path.join(output_dir, f"{name}.vtu")
+        mesh.save(path)
+        written.append(path)
+    max_disp = max(float(np.linalg.norm(r.displacements, axis=1).max()) for r in results.values()) if results else 0.0
+    return {"name": name, "seconds": time.perf_counter() - start, "max_displacement": max_disp, "outputs": written}
+
+
+def load_job_spec(path):
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    if isinstance(spec, list):
+        spec = {"jobs": spec}
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for i, job in enumerate(spec["jobs"]):
+        job.setdefault("name", f"job_{i:04d}")
+        job["mesh"] = os.path.join(base_dir, job["mesh"])
+    return spec
+
+
+def run_batch(spec, output_dir=None, workers=None, blas_threads=None):
+    output_dir = output_dir or spec.get("output_dir", "results")
+    blas_threads = blas_threads or spec.get("blas_threads", 1)
+    workers = workers or spec.get("workers") or max(1, (os.cpu_count() or 1) // blas_threads)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Alt süreçler (spawn) bu ortam değişkenlerini numpy'yi içe aktarmadan önce görür; çağıranın
+    # ortamı iş bitince eski haline döner
+    previous = {variable: os.environ.get(variable) for variable in BLAS_THREAD_VARIABLES}
+    for variable in BLAS_THREAD_VARIABLES:
+        os.environ[variable] = str(blas_threads)
+    try:
+        return _run_jobs(spec, output_dir, workers)
+    finally:
+        for variable, value in previous.items():
+            if value is None:
+                os.environ.pop(variable, None)
+            else:
+                os.environ[variable] = value
+
+
+def _run_jobs(spec, output_dir, workers):
+    summaries, failures = [], []
+    with tempfile.TemporaryDirectory(prefix="fea_batch_") as shared_dir:
+        # Her mesh bir kez okunur ve işlerle paylaşılan ham dizilere yazılır
+        mesh_dirs = {}
+        for mesh_path in sorted({job["mesh"] for job in spec["jobs"]}):
+            mesh_dirs[mesh_path] = os.path.join(shared_dir, f"mesh_{len(mesh_dirs):04d}")
+            write_mesh_arrays(mesh_dirs[mesh_path], pv.read(mesh_path))
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {
+                executor.submit(run_job, job, mesh_dirs[job["mesh"]], output_dir): job["name"]
+                for job in spec["jobs"]
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    failures.append((name, str(e)))
+                    print(f"Hata: {name} başarısız - {e}", file=sys.stderr)
+                else:
+                    summaries.append(summary)
+                    print(f"{name}: {summary['seconds']:.2f} s, maksimum yer değiştirme {summary['max_displacement']:.4g}")
+    return summaries, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m batch", description="FEA işlerini Qt olmadan toplu çalıştır.")
+    parser.add_argument("spec", help="İş tanımı JSON dosyası")
+    parser.add_argument("-o", "--output-dir", help="Sonuç klasörü (varsayılan: tanımdaki output_dir veya ./results)")
+    parser.add_argument("-j", "--workers", type=int, help="Paralel süreç sayısı")
+    parser.add_argument("--blas-threads", type=int, help="Süreç başına BLAS iş parçacığı sayısı")
+    args = parser.parse_args(argv)
+
+    spec = load_job_spec(args.spec)
+    start = time.perf_counter()
+    summaries, failures = run_batch(spec, args.output_dir, args.workers, args.blas_threads)
+    print(f"{len(summaries)} iş tamamlandı, {len(failures)} başarısız ({time.perf_counter() - start:.1f} s).")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
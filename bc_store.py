@@ -0,0 +1,120 @@
+# bc_store.py
+# Sınır koşulları ve yükler için yoğun NumPy dizileri: düğüm başına x/y/z sabitlik bayrakları
+# ve her yük durumu için (n_nodes, 3) yük dizisi. Tüm işlemler düğüm indeks dizileri üzerinde toplu çalışır.
+# Sabitlikler tüm yük durumlarında ortaktır; yük işlemleri etkin yük durumuna uygulanır.
+import numpy as np
+
+ALL_COMPONENTS = (True, True, True)
+DEFAULT_LOAD_CASE = "Yük Durumu 1"
+
+
+def _as_nodes(nodes):
+    return np.atleast_1d(np.asarray(nodes, dtype=np.int64))
+
+
+class BoundaryConditionStore:
+    def __init__(self, n_nodes, dtype=np.float64):
+        self.n_nodes = n_nodes
+        self.dtype = dtype
+        self.fixity = np.zeros((n_nodes, 3), dtype=bool)
+        self.load_cases = {DEFAULT_LOAD_CASE: np.zeros((n_nodes, 3), dtype=dtype)}
+        self.active_case = DEFAULT_LOAD_CASE
+
+    @property
+    def loads(self):
+        return self.load_cases[self.active_case]
+
+    def add_load_case(self, name, copy_from=None):
+        if name in self.load_cases:
+            raise ValueError(f"'{name}' adlı yük durumu zaten var.")
+        if copy_from is None:
+            self.load_cases[name] = np.zeros((self.n_nodes, 3), dtype=self.dtype)
+        else:
+            self.load_cases[name] = self.load_cases[copy_from].copy()
+        return name
+
+    def remove_load_case(self, name):
+        if len(self.load_cases) == 1:
+            raise ValueError("En az bir yük durumu kalmalıdır.")
+        del self.load_cases[name]
+        if self.active_case == name:
+            self.active_case = next(iter(self.load_cases))
+
+    def set_active_case(self, name):
+        if name not in self.load_cases:
+            raise KeyError(name)
+        self.active_case = name
+
+    def case_names(self):
+        return list(self.load_cases)
+
+    def fix(self, nodes, components=ALL_COMPONENTS):
+        # Durumu değişen düğümleri döner
+        nodes = _as_nodes(nodes)
+        components = np.asarray(components, dtype=bool)
+        changed = nodes[np.any(components & ~self.fixity[nodes], axis=1)]
+        self.fixity[nodes] |= components
+        return np.unique(changed)
+
+    def unfix(self, nodes, components=ALL_COMPONENTS):
+        nodes = _as_nodes(nodes)
+        components = np.asarray(components, dtype=bool)
+        changed = nodes[np.any(components & self.fixity[nodes], axis=1)]
+        self.fixity[nodes] &= ~components
+        return np.unique(changed)
+
+    def is_fixed(self, nodes):
+        return self.fixity[nodes].any(axis=-1)
+
+    def fixed_nodes(self):
+        return np.flatnonzero(self.fixity.any(axis=1))
+
+    def constrained_dofs(self):
+        # Global serbestlik derecesi numaralandırması: 3 * düğüm + bileşen
+        return np.flatnonzero(self.fixity.ravel())
+
+    def set_loads(self, nodes, vectors):
+        # vectors (3,) ise tüm düğümlere aynı yük yazılır; sıfır vektör yükü kaldırır
+        nodes = _as_nodes(nodes)
+        self.loads[nodes] = vectors
+        return nodes
+
+    def clear_loads(self, nodes=None):
+        if nodes is None:
+            self.loads[:] = 0.0
+        else:
+            self.loads[_as_nodes(nodes)] = 0.0
+
+    def is_loaded(self, nodes):
+        return np.any(self.loads[nodes] != 0.0, axis=-1)
+
+    def loaded_nodes(self):
+        return np.flatnonzero(np.any(self.loads != 0.0, axis=1))
+
+    def load_vector(self, case=None):
+        # Kopyasız görünüm; çözücüye verirken değişmeyecekse kopyalanmalı
+        return self.load_cases[case or self.active_case].reshape(-1)
+
+    def load_vectors(self):
+        # Tüm yük durumlarının kopyaları: {durum adı: (3 * n_nodes,)}
+        return {name: loads.reshape(-1).copy() for name, loads in self.load_cases.items()}
+
+    def copy(self):
+        # Arka planda kaydetmek için bağımsız kopya
+        store = BoundaryConditionStore(self.n_nodes, self.dtype)
+        store.fixity = self.fixity.copy()
+        store.load_cases = {name: loads.copy() for name, loads in self.load_cases.items()}
+        store.active_case = self.active_case
+        return store
+
+    def reorder(self, perm):
+        # Düğümler yeniden numaralandığında: yeni düğüm i, eski perm[i] düğümünün koşullarını alır
+        self.fixity = self.fixity[perm]
+        for name, loads in self.load_cases.items():
+            self.load_cases[name] = loads[perm]
+
+    def clear(self):
+        # Sabitlikler ve tüm yük durumlarındaki yükler silinir; durum adları korunur
+        self.fixity[:] = False
+        for loads in self.load_cases.values():
+            loads[:] = 0.0
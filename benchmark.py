@@ -0,0 +1,368 @@
+# benchmark.py
+# Sıcak yollar için ekransız (off-screen) kıyaslama: mesh okuma/önbellek, düğüm seçimi,
+# sınır koşulu/yük katmanı düzenlemeleri ve çözüm. Sentetik yapılı (hex8) ve düğüm numaraları
+# karıştırılmış yapısız (tet4) mesh'ler üzerinde süre ve tepe bellek ölçülür.
+#
+#   python -m benchmark --sizes 1e4,1e5,1e6,1e7 -o bench.json
+#   python -m benchmark -o yeni.json --baseline bench.json --threshold 0.2
+#
+# Sonuç dosyası {"meta": {...}, "results": [{"benchmark", "mesh", "n_nodes", "seconds", "peak_bytes"}]}
+# biçimindedir. peak_bytes iki ölçümün büyüğüdür: tracemalloc'un ölçüm sırasında yapılan Python/NumPy
+# ayırmaları için bulduğu tepe değer (süreç belleği yeniden kullansa da doğru) ve süreç RSS'inin başlangıca
+# göre en büyük artışı (VTK'nın C++ ayırmalarını da görür; psutil, /proc veya Windows API ile okunur).
+# Her kıyaslama için log(süre) - log(N) eğimi yazdırılır: etkileşim başına yolların eğimi ~0
+# (N'den bağımsız) olmalı, ~1 ise her tıklamada tüm mesh dolaşılıyordur.
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pyvista as pv
+
+from bc_store import BoundaryConditionStore
+from mesh_cache import MeshCache
+from mesh_io import read_mesh
+from overlays import fixed_nodes_overlay, forces_overlay
+from renumbering import renumber
+from selection import nodes_near_plane
+from solver import SolverOptions, clear_factorization_cache, solve_load_cases
+from spatial_index import NodeIndex
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+MESH_KINDS = ("structured", "unstructured")
+# Doğrudan çözücü büyük mesh'lerde saatler sürer; çözüm kıyaslaması bu boyuta kadar yapılır
+DEFAULT_MAX_SOLVE_NODES = 20_000
+N_PICKS = 200
+EDIT_BATCH = 1000
+RSS_SAMPLE_INTERVAL = 0.001
+
+# VTK hex8 köşe sırası (i, j, k) -> yerel indeks; Kuhn bölmesi her küpü 000 -> 111 köşegeni boyunca 6 tet'e ayırır
+_HEX_CORNERS = ((0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1))
+_KUHN_TETS = ((0, 1, 2, 6), (0, 2, 3, 6), (0, 3, 7, 6), (0, 7, 4, 6), (0, 4, 5, 6), (0, 5, 1, 6))
+
+
+def synthetic_mesh(n_nodes, kind="structured", seed=0):
+    # Yaklaşık n_nodes düğümlü birim küp; "unstructured" tet4 hücreler ve rastgele düğüm/hücre sırası kullanır
+    m = max(2, int(round(n_nodes ** (1.0 / 3.0))))
+    axis = np.linspace(0.0, 1.0, m)
+    z, y, x = np.meshgrid(axis, axis, axis, indexing="ij")
+    points = np.column_stack([x.ravel(), y.ravel(), z.ravel()])
+    base = (np.arange(m - 1)[:, None, None] * m * m + np.arange(m - 1)[None, :, None] * m
+            + np.arange(m - 1)[None, None, :]).ravel()
+    corner_offsets = np.array([k * m * m + j * m + i for i, j, k in _HEX_CORNERS])
+    hexes = base[:, None] + corner_offsets
+    if kind == "structured":
+        return pv.UnstructuredGrid({pv.CellType.HEXAHEDRON: hexes}, points)
+    if kind != "unstructured":
+        raise ValueError(f"Bilinmeyen mesh türü: {kind}")
+    rng = np.random.default_rng(seed)
+    tets = hexes[:, np.array(_KUHN_TETS)].reshape(-1, 4)
+    tets = tets[rng.permutation(tets.shape[0])]
+    order = rng.permutation(points.shape[0])
+    new_id = np.empty_like(order)
+    new_id[order] = np.arange(order.size)
+    return pv.UnstructuredGrid({pv.CellType.TETRA: new_id[tets]}, points[order])
+
+
+def _rss_reader():
+    # Sürecin anlık RSS'ini (bayt) dönen fonksiyon; bu platformda okunamıyorsa None
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
+    if os.path.exists("/proc/self/statm"):
+        page_size = os.sysconf("SC_PAGE_SIZE")
+
+        def read_statm():
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * page_size
+        return read_statm
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+
+        def read_working_set():
+            get_memory_info(process, ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize
+        return read_working_set
+    return None
+
+
+read_rss = _rss_reader()
+
+
+class PeakMemory:
+    # Ölçüm süresince tracemalloc ile Python/NumPy ayırmalarının tepesini izler ve arka plan iş parçacığında
+    # RSS örnekler. Yalnızca RSS artışı, önceki ölçümlerin serbest bıraktığı bellek yeniden kullanılınca sıfır
+    # görünür; tracemalloc ise VTK/C++ ayırmalarını görmez. İkisinin büyüğü raporlanır.
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.baseline = self.rss_peak = 0
+        self.traced_peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.rss_peak = max(self.rss_peak, read_rss())
+
+    def __enter__(self):
+        if read_rss is not None:
+            self.baseline = self.rss_peak = read_rss()
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.rss_peak = max(self.rss_peak, read_rss())
+
+    @property
+    def peak(self):
+        return max(self.traced_peak, self.rss_peak - self.baseline)
+
+
+def measure(fn, repeat=1):
+    # En iyi duvar saati süresi ve tepe bellek. İzleme Python ayırmalarını yavaşlattığından, repeat > 1 ise
+    # bellek yalnızca ilk çalıştırmada izlenir ve süre sonraki çalıştırmalardan alınır. Tek çalıştırmalık
+    # (çözüm gibi pahalı) ölçümlerin süresi izleme altındadır; çok sayıda küçük dizi ayıran yollarda birkaç
+    # yüzde yavaş görünür, bu yüzden yalnızca aynı sürümle alınmış taban çizgileriyle karşılaştırılmalıdır.
+    with PeakMemory() as memory:
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+    peak = memory.peak
+    if repeat == 1:
+        return elapsed, peak, result
+    best = float("inf")
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, peak, result
+
+
+def bench_load(mesh, workdir):
+    path = os.path.join(workdir, "mesh.vtu")
+    mesh.save(path)
+    cache = MeshCache(os.path.join(workdir, "cache"))
+    cache.clear()
+    results = {"load_cold": measure(lambda: read_mesh(path))[:2]}
+    read_mesh(path, cache=cache)
+    results["load_cached"] = measure(lambda: read_mesh(path, cache=cache), repeat=3)[:2]
+    results["renumber_rcm"] = measure(lambda: renumber(mesh, "rcm"))[:2]
+    cache.clear()
+    return results
+
+
+def bench_pick(mesh):
+    points = np.asarray(mesh.points)
+    rng = np.random.default_rng(1)
+    lower, upper = points.min(axis=0), points.max(axis=0)
+    clicks = lower + rng.random((N_PICKS, 3)) * (upper - lower)
+    seconds, peak, index = measure(lambda: NodeIndex(points))
+    results = {"pick_index_build": (seconds, peak)}
+    seconds, peak, _ = measure(lambda: [index.nearest(click) for click in clicks], repeat=3)
+    results["pick_nearest"] = (seconds / N_PICKS, peak)
+    brute = clicks[:10]
+    seconds, peak, _ = measure(lambda: [np.argmin(np.linalg.norm(points - click, axis=1)) for click in brute])
+    results["pick_brute_force"] = (seconds / len(brute), peak)
+    return results
+
+
+def bench_overlays(mesh, plotter):
+    points = np.asarray(mesh.points)
+    n = mesh.n_points
+    fixed = fixed_nodes_overlay(plotter, n, mesh.length)
+    forces = forces_overlay(plotter, n, mesh.length)
+    bcs = BoundaryConditionStore(n)
+    rng = np.random.default_rng(2)
+    batch = rng.choice(n, size=min(EDIT_BATCH, n), replace=False)
+    single = int(batch[0])
+
+    def edit_single():
+        bcs.fix(single)
+        fixed.set(single, points[single])
+        bcs.set_loads(single, (0.0, 0.0, -1.0))
+        forces.set(single, points[single], bcs.loads[single])
+        bcs.unfix(single)
+        fixed.remove(single)
+        bcs.clear_loads(single)
+        forces.remove(single)
+
+    def edit_batch():
+        changed = bcs.fix(batch)
+        fixed.set(changed, points[changed])
+        bcs.set_loads(batch, (0.0, 0.0, -1.0))
+        forces.set(batch, points[batch], bcs.loads[batch])
+        fixed.remove(bcs.unfix(batch))
+        bcs.clear_loads(batch)
+        forces.remove(batch)
+
+    results = {
+        "overlay_edit_single": measure(edit_single, repeat=5)[:2],
+        "overlay_edit_batch": measure(edit_batch, repeat=3)[:2],
+    }
+    fixed.set(batch, points[batch])
+    forces.set(batch, points[batch], np.tile((0.0, 0.0, -1.0), (batch.size, 1)))
+    plotter.render()
+    results["overlay_render"] = measure(plotter.render, repeat=3)[:2]
+    fixed.remove_from_scene()
+    forces.remove_from_scene()
+    return results
+
+
+def bench_solve(mesh):
+    points = np.asarray(mesh.points)
+    bcs = BoundaryConditionStore(mesh.n_points)
+    bcs.fix(nodes_near_plane(points, (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), 1e-9))
+    tip = nodes_near_plane(points, (1.0, 0.0, 0.0), (1.0, 0.0, 0.0), 1e-9)
+    bcs.set_loads(tip, (0.0, 0.0, -1.0 / max(tip.size, 1)))
+    material = {"E": 1000.0, "nu": 0.3}
+    clear_factorization_cache()
+    solve = lambda: solve_load_cases(mesh, material, bcs.constrained_dofs(), bcs.load_vectors())
+    results = {"solve_factorize": measure(solve)[:2]}
+    # Aynı model için ikinci çağrı önbellekteki çarpanlara ayırmayı kullanır
+    results["solve_cached"] = measure(solve)[:2]
+    clear_factorization_cache()
+    for preconditioner in ("jacobi", "block_jacobi"):
+        options = SolverOptions(method="iterative", preconditioner=preconditioner, matrix_free=True)
+        results[f"solve_pcg_{preconditioner}"] = measure(
+            lambda: solve_load_cases(mesh, material, bcs.constrained_dofs(), bcs.load_vectors(), options))[:2]
+    clear_factorization_cache()
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, kinds=MESH_KINDS, max_solve_nodes=DEFAULT_MAX_SOLVE_NODES):
+    pv.OFF_SCREEN = True
+    records = []
+    plotter = pv.Plotter(off_screen=True, window_size=(800, 600))
+    # Pencere oluşturulmadan render() hiçbir şey çizmez
+    plotter.show(auto_close=False)
+    with tempfile.TemporaryDirectory(prefix="fea_bench_") as workdir:
+        for kind in kinds:
+            for size in sizes:
+                mesh = synthetic_mesh(size, kind)
+                print(f"{kind} mesh: {mesh.n_points} düğüm, {mesh.n_cells} hücre", flush=True)
+                plotter.clear_actors()
+                plotter.add_mesh(mesh.extract_surface(), reset_camera=True)
+                results = {}
+                results.update(bench_load(mesh, workdir))
+                results.update(bench_pick(mesh))
+                results.update(bench_overlays(mesh, plotter))
+                if mesh.n_points <= max_solve_nodes:
+                    results.update(bench_solve(mesh))
+                for name, (seconds, peak) in results.items():
+                    records.append({"benchmark": name, "mesh": kind, "n_nodes": mesh.n_points,
+                                    "seconds": seconds, "peak_bytes": int(peak)})
+                    print(f"  {name:22s} {seconds * 1e3:12.3f} ms  {peak / 2 ** 20:10.1f} MiB", flush=True)
+                del mesh
+    plotter.close()
+    return records
+
+
+def scaling_exponents(records):
+    # (benchmark, mesh) -> log-log eğimi; en az iki boyut gerekir
+    groups = {}
+    for record in records:
+        groups.setdefault((record["benchmark"], record["mesh"]), []).append(record)
+    exponents = {}
+    for key, group in groups.items():
+        group = [r for r in group if r["seconds"] > 0]
+        if len({r["n_nodes"] for r in group}) >= 2:
+            n = np.log([r["n_nodes"] for r in group])
+            t = np.log([r["seconds"] for r in group])
+            exponents[key] = float(np.polyfit(n, t, 1)[0])
+    return exponents
+
+
+def compare(records, baseline, threshold):
+    # Taban çizgisine göre threshold oranından fazla yavaşlayan ölçümler
+    reference = {(r["benchmark"], r["mesh"], r["n_nodes"]): r["seconds"] for r in baseline}
+    regressions = []
+    for record in records:
+        previous = reference.get((record["benchmark"], record["mesh"], record["n_nodes"]))
+        if previous and record["seconds"] > previous * (1.0 + threshold):
+            regressions.append((record, previous))
+    return regressions
+
+
+def metadata():
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pyvista": pv.__version__,
+        "cpu_count": os.cpu_count(),
+        # Kıyaslamalar bittiğinde sürecin RSS'i (okunamıyorsa None)
+        "rss_bytes": read_rss() if read_rss is not None else None,
+    }
+
+
+def _parse_sizes(text):
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Sıcak yollar için ekransız kıyaslama.")
+    parser.add_argument("--sizes", type=_parse_sizes, default=list(DEFAULT_SIZES), help="Virgülle ayrılmış düğüm sayıları")
+    parser.add_argument("--kinds", default=",".join(MESH_KINDS), help="structured, unstructured")
+    parser.add_argument("--max-solve-nodes", type=int, default=DEFAULT_MAX_SOLVE_NODES)
+    parser.add_argument("-o", "--output", default="bench_output.json", help="Sonuç JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=0.2, help="İzin verilen göreli yavaşlama (0.2 = %%20)")
+    args = parser.parse_args(argv)
+
+    records = run_benchmarks(args.sizes, [kind.strip() for kind in args.kinds.split(",")], args.max_solve_nodes)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"meta": metadata(), "results": records}, f, indent=2)
+    print(f"Sonuçlar {args.output} dosyasına yazıldı.")
+
+    print("Ölçeklenme üsleri (süre ~ N^k):")
+    for (name, kind), exponent in sorted(scaling_exponents(records).items()):
+        print(f"  {name:22s} {kind:13s} k = {exponent:5.2f}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(records, baseline, args.threshold)
+        for record, previous in regressions:
+            print(f"YAVAŞLAMA: {record['benchmark']} ({record['mesh']}, {record['n_nodes']} düğüm): "
+                  f"{previous * 1e3:.3f} ms -> {record['seconds'] * 1e3:.3f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
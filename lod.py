@@ -0,0 +1,166 @@
+# lod.py
+# Kamera etkileşimi sırasında tam çözünürlüklü mesh yerine basitleştirilmiş (decimate) vekil yüzeyler çizilir.
+import time
+
+import numpy as np
+import pyvista as pv
+from PySide6.QtCore import QTimer
+from scipy.spatial import cKDTree
+
+# Her seviye bir öncekinden bu oranlarda azaltılır (tam mesh'e göre ~%50, ~%90, ~%98)
+LOD_REDUCTIONS = (0.5, 0.8, 0.8)
+# Bundan küçük yüzeyler için vekil oluşturmaya değmez
+MIN_LOD_CELLS = 20000
+
+
+def _no_progress(message):
+    pass
+
+
+def _link_to_source(level, source, source_points, source_centers):
+    # decimate kaynak dizilerini taşımaz; her vekil düğüm/hücre en yakın kaynak düğüme/hücreye bağlanır ki
+    # sonuç alanları ana yüzeydeki gibi vtkOriginal*Ids ile eşlenebilsin
+    _, nearest = source_points.query(level.points)
+    level.point_data["vtkOriginalPointIds"] = source.point_data["vtkOriginalPointIds"][nearest]
+    _, nearest = source_centers.query(level.cell_centers().points)
+    level.cell_data["vtkOriginalCellIds"] = source.cell_data["vtkOriginalCellIds"][nearest]
+
+
+def build_lod_levels(render_mesh, reductions=LOD_REDUCTIONS, progress_callback=_no_progress):
+    # Arka planda çalışır; ayrıntılıdan kabaya doğru sıralı PolyData listesi döner
+    surface = render_mesh if isinstance(render_mesh, pv.PolyData) else render_mesh.extract_surface()
+    if surface.n_cells < MIN_LOD_CELLS or surface.GetNumberOfPolys() == 0:
+        return []
+    # Kimlikleri olmayan yüzeyler (doğrudan PolyData mesh) kendi indekslerine bağlanır
+    source = surface.copy(deep=False)
+    if "vtkOriginalPointIds" not in source.point_data:
+        source.point_data["vtkOriginalPointIds"] = np.arange(source.n_points)
+    if "vtkOriginalCellIds" not in source.cell_data:
+        source.cell_data["vtkOriginalCellIds"] = np.arange(source.n_cells)
+    source = source.triangulate()
+    source_points = cKDTree(source.points)
+    source_centers = cKDTree(source.cell_centers().points)
+    current = source
+    levels = []
+    for i, reduction in enumerate(reductions):
+        progress_callback(f"LOD seviyesi {i + 1}/{len(reductions)}")
+        current = current.decimate(reduction)
+        if current.n_cells == 0:
+            break
+        _link_to_source(current, source, source_points, source_centers)
+        levels.append(current)
+        if current.n_cells < MIN_LOD_CELLS:
+            break
+    return levels
+
+
+class LodController:
+    def __init__(self, plotter, frame_time_target=1.0 / 30.0, restore_delay_ms=250):
+        self.plotter = plotter
+        self.frame_time_target = frame_time_target
+        self.full_actor = None
+        self.full_cells = 0
+        self.levels = []  # (actor, hücre sayısı)
+        self.frame_times = {}  # seviye (None = tam mesh) -> ölçülen kare süresi
+        self.active_level = None
+        self._preview = False
+        self._render_start = None
+        self._observer_tags = []
+        self._restore_timer = QTimer()
+        self._restore_timer.setSingleShot(True)
+        self._restore_timer.setInterval(restore_delay_ms)
+        self._restore_timer.timeout.connect(self.restore_full_resolution)
+
+    @property
+    def attached(self):
+        return self.full_actor is not None and bool(self.levels)
+
+    def attach(self, full_actor, full_cells, level_meshes, **mesh_kwargs):
+        self.detach()
+        self.full_actor = full_actor
+        self.full_cells = full_cells
+        for i, level in enumerate(level_meshes):
+            actor = self.plotter.add_mesh(level, name=f"main_mesh_lod{i}", pickable=False,
+                                          reset_camera=False, render=False, **mesh_kwargs)
+            actor.SetVisibility(False)
+            self.levels.append((actor, level.n_cells))
+        render_window = self.plotter.render_window
+        self._observer_tags = [
+            render_window.AddObserver("StartEvent", self._on_render_start),
+            render_window.AddObserver("EndEvent", self._on_render_end),
+        ]
+
+    def detach(self):
+        self._restore_timer.stop()
+        if self._observer_tags and self.plotter.render_window is not None:
+            for tag in self._observer_tags:
+                self.plotter.render_window.RemoveObserver(tag)
+        self._observer_tags = []
+        for actor, _ in self.levels:
+            self.plotter.remove_actor(actor, render=False)
+        if self.full_actor is not None:
+            self.full_actor.SetVisibility(True)
+        self.full_actor = None
+        self.levels = []
+        self.frame_times = {}
+        self.active_level = None
+        self._preview = False
+
+    def preview(self):
+        # Görünüm ön ayarları gibi tek seferlik kamera değişimlerinde bir sonraki kare vekil ile çizilir
+        if self.attached:
+            self._preview = True
+
+    def _interacting(self):
+        iren = self.plotter.iren.interactor if self.plotter.iren else None
+        style = iren.GetInteractorStyle() if iren else None
+        return style is not None and style.GetState() != 0
+
+    def choose_level(self):
+        # Hedef kare süresine sığan en ayrıntılı seviye; tam mesh sığıyorsa None
+        full_time = self.frame_times.get(None)
+        if full_time is not None and full_time <= self.frame_time_target:
+            return None
+        for i, (_, n_cells) in enumerate(self.levels):
+            estimate = self.frame_times.get(i)
+            if estimate is None and full_time is not None:
+                estimate = full_time * n_cells / max(self.full_cells, 1)
+            if estimate is not None and estimate <= self.frame_time_target:
+                return i
+        return len(self.levels) - 1 if full_time is not None else 0
+
+    def _show_level(self, level):
+        if level == self.active_level:
+            return
+        self.full_actor.SetVisibility(level is None)
+        for i, (actor, _) in enumerate(self.levels):
+            actor.SetVisibility(i == level)
+        self.active_level = level
+
+    def _on_render_start(self, obj, event):
+        if not self.attached:
+            return
+        if self._interacting() or self._preview:
+            self._restore_timer.stop()
+            self._show_level(self.choose_level())
+        self._render_start = time.perf_counter()
+
+    def _on_render_end(self, obj, event):
+        if self._render_start is None:
+            return
+        elapsed = time.perf_counter() - self._render_start
+        self._render_start = None
+        previous = self.frame_times.get(self.active_level)
+        self.frame_times[self.active_level] = elapsed if previous is None else 0.7 * previous + 0.3 * elapsed
+        self._preview = False
+        if self.active_level is not None:
+            self._restore_timer.start()
+
+    def restore_full_resolution(self):
+        if not self.attached or self.active_level is None:
+            return
+        if self._interacting():
+            self._restore_timer.start()
+            return
+        self._show_level(None)
+        self.plotter.render()
@@ -1,15 +1,34 @@
 # main.py
+import os
 import sys
+from dataclasses import replace
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QFileDialog, QMessageBox,
     QLabel, QInputDialog, QHBoxLayout, QPushButton, QLineEdit # QLineEdit eklenmişti
 )
-from PySide6.QtGui import QAction, QIcon
-from PySide6.QtCore import Slot, Qt
+from PySide6.QtGui import QAction, QActionGroup, QIcon
+from PySide6.QtCore import Slot, Qt, QThreadPool, QSettings, QStandardPaths
 import pyvista as pv
 from pyvistaqt import QtInteractor
 import numpy as np
 
+from mesh_cache import MeshCache
+from bc_store import BoundaryConditionStore
+from lod import LodController, build_lod_levels
+from mesh_io import read_mesh, renumber_mesh
+from overlays import fixed_nodes_overlay, forces_overlay, selection_overlay
+from postprocessing import COLORMAPS, RESULT_FIELDS, ResultFields, show_result_scalars, surface_source_ids, value_range
+from profiler_dock import ProfilerDock
+from project import PROJECT_EXTENSION, ProjectState, is_project, open_project, save_project
+from profiling import FrameTimer, dataset_memory, span
+from renumbering import ORIGINAL_IDS, describe
+from selection import (
+    distribute_force, nodes_in_box, nodes_in_screen_rect, nodes_in_sphere, nodes_near_plane, surface_patch
+)
+from solver import SolverOptions, clear_factorization_cache, solve_load_cases
+from spatial_index import NodeIndex
+from workers import Worker
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -19,14 +38,38 @@ class MainWindow(QMainWindow):
 
         # Veri saklama
         self.material_properties = {"E": None, "nu": None}
-        self.fixed_nodes_indices = []
-        self.applied_forces = {}
+        self.bcs = BoundaryConditionStore(0)
+        self.results = {}
+        self.result_case = None
+        # Projeden açılan sonuçlar kullanıcı bir yük durumu veya alan seçene kadar gösterilmez (bellek eşlemeli
+        # diziler o zamana dek diskten okunmaz)
+        self.result_displayed = False
+        self.result_material = None
+        self.result_fields = ResultFields()
+        self._result_scalar_bar = None
         self.current_mesh = None
+        self.mesh_path = None
+        self.project_path = None
         self.selected_point_actor = None
-        self.fixed_nodes_actor = None
-        self.force_arrows_actor = None
+        self.fixed_nodes_overlay = None
+        self.forces_overlay = None
+        self.selection_overlay = None
+        self.selected_nodes = np.empty(0, dtype=np.int64)
+        self._surface_nodes = None
         self.last_picked_point_coords = None
         self.last_picked_node_index = None
+        self.node_index = None
+        self._node_index_worker = None
+        self._solve_worker = None
+        self._load_worker = None
+        self._lod_worker = None
+        self._renumber_worker = None
+        self._save_worker = None
+        self.main_mesh_actor = None
+        self.thread_pool = QThreadPool.globalInstance()
+        self.settings = QSettings("FEA-Viewer", "FEA-Viewer")
+        self.mesh_cache = None
+        self.configure_mesh_cache()
 
         # --- Menü Çubuğu ---
         menubar = self.menuBar()
@@ -37,6 +80,68 @@ class MainWindow(QMainWindow):
         open_action.setStatusTip("Bir mesh dosyası aç (.STL, .VTK vb.)")
         open_action.triggered.connect(self.open_file_dialog)
         file_menu.addAction(open_action)
+        self.cancel_load_action = QAction("Yüklemeyi İptal Et", self)
+        self.cancel_load_action.setStatusTip("Devam eden mesh yüklemesini iptal et")
+        self.cancel_load_action.setEnabled(False)
+        self.cancel_load_action.triggered.connect(self.cancel_mesh_load)
+        file_menu.addAction(self.cancel_load_action)
+        file_menu.addSeparator()
+        open_project_action = QAction("Proje Aç...", self)
+        open_project_action.setStatusTip("Kaydedilmiş bir projeyi (mesh, malzeme, sınır koşulları, yükler, sonuçlar) aç")
+        open_project_action.triggered.connect(self.open_project_dialog)
+        file_menu.addAction(open_project_action)
+        self.save_project_action = QAction("Projeyi Kaydet", self)
+        self.save_project_action.setShortcut("Ctrl+S")
+        self.save_project_action.triggered.connect(self.save_project)
+        file_menu.addAction(self.save_project_action)
+        save_project_as_action = QAction("Projeyi Farklı Kaydet...", self)
+        save_project_as_action.triggered.connect(self.save_project_as)
+        file_menu.addAction(save_project_as_action)
+        self.embed_mesh_action = QAction("Mesh Kopyasını Projeye Ekle", self, checkable=True)
+        self.embed_mesh_action.setChecked(self.settings.value("project/embed_mesh", False, type=bool))
+        self.embed_mesh_action.setStatusTip("Mesh'i projeye ham dizi olarak kopyala; kapalıyken yalnızca dosya yolu saklanır")
+        self.embed_mesh_action.triggered.connect(lambda checked: self.settings.setValue("project/embed_mesh", checked))
+        file_menu.addAction(self.embed_mesh_action)
+        file_menu.addSeparator()
+        cache_submenu = file_menu.addMenu("Mesh Önbelleği")
+        self.cache_enabled_action = QAction("Önbelleği Kullan", self, checkable=True)
+        self.cache_enabled_action.setChecked(self.settings.value("cache/enabled", True, type=bool))
+        self.cache_enabled_action.setStatusTip("Açılan mesh'leri hızlı yeniden açma için diske önbellekle")
+        self.cache_enabled_action.triggered.connect(lambda checked: self.set_cache_setting("cache/enabled", checked))
+        cache_submenu.addAction(self.cache_enabled_action)
+        self.cache_hash_action = QAction("İçerik Özeti ile Doğrula", self, checkable=True)
+        self.cache_hash_action.setChecked(self.settings.value("cache/hash_content", False, type=bool))
+        self.cache_hash_action.setStatusTip("Önbellek anahtarına dosya içeriğinin özetini de ekle (daha yavaş, daha güvenli)")
+        self.cache_hash_action.triggered.connect(lambda checked: self.set_cache_setting("cache/hash_content", checked))
+        cache_submenu.addAction(self.cache_hash_action)
+        cache_location_action = QAction("Önbellek Konumu...", self)
+        cache_location_action.triggered.connect(self.choose_cache_location)
+        cache_submenu.addAction(cache_location_action)
+        cache_size_action = QAction("Önbellek Boyut Sınırı...", self)
+        cache_size_action.triggered.connect(self.choose_cache_size_limit)
+        cache_submenu.addAction(cache_size_action)
+        clear_cache_action = QAction("Önbelleği Temizle", self)
+        clear_cache_action.triggered.connect(self.clear_mesh_cache)
+        cache_submenu.addAction(clear_cache_action)
+        renumber_submenu = file_menu.addMenu("Düğüm Numaralandırma")
+        renumber_group = QActionGroup(self)
+        current_renumber = self.settings.value("mesh/renumber", "none")
+        for method, label, tip in (
+            ("none", "Dosyadaki Sıra", "Düğümler dosyadaki sırayla kullanılır"),
+            ("rcm", "Ters Cuthill-McKee (RCM)", "Açılışta düğümleri bant genişliğini azaltacak şekilde yeniden numarala"),
+            ("morton", "Morton (Z-Eğrisi)", "Açılışta düğümleri uzayda yakın olanlar bellekte de yakın olacak şekilde sırala"),
+        ):
+            action = QAction(label, self, checkable=True)
+            action.setStatusTip(tip)
+            action.setChecked(method == current_renumber)
+            action.triggered.connect(lambda checked, m=method: self.settings.setValue("mesh/renumber", m))
+            renumber_group.addAction(action)
+            renumber_submenu.addAction(action)
+        renumber_submenu.addSeparator()
+        renumber_now_action = QAction("Yüklü Mesh'i Şimdi Yeniden Numarala", self)
+        renumber_now_action.setStatusTip("Seçili yöntemi yüklü mesh'e uygula; sınır koşulları ve yükler korunur")
+        renumber_now_action.triggered.connect(self.renumber_current_mesh)
+        renumber_submenu.addAction(renumber_now_action)
         file_menu.addSeparator()
         exit_action = QAction(QIcon.fromTheme("application-exit"), "&Çıkış", self)
         exit_action.setStatusTip("Uygulamadan çık")
@@ -66,6 +171,16 @@ class MainWindow(QMainWindow):
         self.box_zoom_action.setStatusTip("Kutu çizerek zoom yapma modunu etkinleştir/devre dışı bırak (genellikle 'b' tuşu ile)")
         self.box_zoom_action.triggered.connect(self.toggle_box_zoom_mode)
         view_menu.addAction(self.box_zoom_action)
+        view_menu.addSeparator()
+        self.lod_action = QAction("Etkileşimde Basitleştirilmiş Görünüm (LOD)", self, checkable=True)
+        self.lod_action.setChecked(self.settings.value("lod/enabled", True, type=bool))
+        self.lod_action.setStatusTip("Kamera hareket ederken büyük mesh'lerin basitleştirilmiş kopyasını çiz")
+        self.lod_action.triggered.connect(self.toggle_lod)
+        view_menu.addAction(self.lod_action)
+        frame_time_action = QAction("Hedef Kare Süresi...", self)
+        frame_time_action.setStatusTip("LOD seviyesi seçimi için hedef kare süresi (ms)")
+        frame_time_action.triggered.connect(self.choose_frame_time_target)
+        view_menu.addAction(frame_time_action)
 
         # Analiz Ayarları Menüsü
         settings_menu = menubar.addMenu("&Analiz Ayarları")
@@ -85,16 +200,128 @@ class MainWindow(QMainWindow):
         fix_node_action = QAction("Seçili Düğümü Sabitle", self)
         fix_node_action.triggered.connect(self.fix_selected_node_action)
         bc_load_submenu.addAction(fix_node_action)
+        fix_components_action = QAction("Seçili Düğümü Bileşen Bazında Sabitle...", self)
+        fix_components_action.setStatusTip("Yalnızca seçilen x/y/z yönlerini sabitle")
+        fix_components_action.triggered.connect(self.fix_selected_node_components_dialog)
+        bc_load_submenu.addAction(fix_components_action)
         unfix_node_action = QAction("Seçili Düğümün Sabitlemesini Kaldır", self)
         unfix_node_action.triggered.connect(self.unfix_selected_node_action)
         bc_load_submenu.addAction(unfix_node_action)
         apply_force_action = QAction("Seçili Düğüm(ler)e Kuvvet Uygula...", self)
         apply_force_action.triggered.connect(self.apply_force_dialog)
         bc_load_submenu.addAction(apply_force_action)
+        distribute_force_action = QAction("Seçili Bölgeye Toplam Kuvvet Dağıt...", self)
+        distribute_force_action.setStatusTip("Toplam kuvveti seçili düğümlere eşit olarak paylaştır")
+        distribute_force_action.triggered.connect(self.distribute_force_dialog)
+        bc_load_submenu.addAction(distribute_force_action)
+        load_case_submenu = settings_menu.addMenu("Yük Durumları")
+        new_case_action = QAction("Yeni Yük Durumu...", self)
+        new_case_action.setStatusTip("Aynı sabitlemeleri paylaşan yeni bir yük durumu ekle")
+        new_case_action.triggered.connect(self.new_load_case_dialog)
+        load_case_submenu.addAction(new_case_action)
+        select_case_action = QAction("Etkin Yük Durumunu Seç...", self)
+        select_case_action.triggered.connect(self.select_load_case_dialog)
+        load_case_submenu.addAction(select_case_action)
+        remove_case_action = QAction("Etkin Yük Durumunu Sil", self)
+        remove_case_action.triggered.connect(self.remove_active_load_case)
+        load_case_submenu.addAction(remove_case_action)
+        region_submenu = settings_menu.addMenu("Bölge Seçimi")
+        box_select_action = QAction("Ekranda Kutu ile Seç", self)
+        box_select_action.setStatusTip("Ekranda sürüklenen dikdörtgenin içindeki yüzey düğümlerini seç")
+        box_select_action.triggered.connect(self.start_box_selection)
+        region_submenu.addAction(box_select_action)
+        plane_select_action = QAction("Düzleme Yakın Düğümler...", self)
+        plane_select_action.triggered.connect(self.select_near_plane_dialog)
+        region_submenu.addAction(plane_select_action)
+        sphere_select_action = QAction("Küre İçindeki Düğümler...", self)
+        sphere_select_action.triggered.connect(self.select_in_sphere_dialog)
+        region_submenu.addAction(sphere_select_action)
+        aabb_select_action = QAction("Kutu (Eksen Hizalı) İçindeki Düğümler...", self)
+        aabb_select_action.triggered.connect(self.select_in_box_dialog)
+        region_submenu.addAction(aabb_select_action)
+        patch_select_action = QAction("Seçili Düğümden Yüzey Yaması...", self)
+        patch_select_action.setStatusTip("Özellik açısına göre bağlı yüzey bölgesini seç")
+        patch_select_action.triggered.connect(self.select_surface_patch_dialog)
+        region_submenu.addAction(patch_select_action)
+        region_submenu.addSeparator()
+        clear_selection_action = QAction("Bölge Seçimini Temizle", self)
+        clear_selection_action.triggered.connect(self.clear_region_selection)
+        region_submenu.addAction(clear_selection_action)
         settings_menu.addSeparator()
         clear_bc_action = QAction("Tüm Sınır Koşullarını ve Yükleri Temizle", self)
         clear_bc_action.triggered.connect(self.clear_all_bcs_and_loads)
         settings_menu.addAction(clear_bc_action)
+        settings_menu.addSeparator()
+        solver_submenu = settings_menu.addMenu("Çözücü")
+        method_group = QActionGroup(self)
+        current_method = self.settings.value("solver/method", "auto")
+        for method, label, tip in (
+            ("auto", "Otomatik", "Tahmini LU belleği sınırı aşarsa yinelemeli çözücüye geç"),
+            ("direct", "Doğrudan (LU)", "Seyrek LU ayrıştırması; yük durumu değişince çarpanlar yeniden kullanılır"),
+            ("iterative", "Yinelemeli (PCG)", "Ön koşullandırılmış eşlenik gradyan; büyük modellerde az bellek"),
+        ):
+            action = QAction(label, self, checkable=True)
+            action.setStatusTip(tip)
+            action.setChecked(method == current_method)
+            action.triggered.connect(lambda checked, m=method: self.settings.setValue("solver/method", m))
+            method_group.addAction(action)
+            solver_submenu.addAction(action)
+        solver_submenu.addSeparator()
+        preconditioner_group = QActionGroup(self)
+        current_preconditioner = self.settings.value("solver/preconditioner", "block_jacobi")
+        for preconditioner, label in (
+            ("jacobi", "Ön Koşullandırıcı: Jacobi"),
+            ("block_jacobi", "Ön Koşullandırıcı: Blok Jacobi (3x3)"),
+            ("ilu", "Ön Koşullandırıcı: Eksik LU (ILU)"),
+        ):
+            action = QAction(label, self, checkable=True)
+            action.setChecked(preconditioner == current_preconditioner)
+            action.triggered.connect(lambda checked, p=preconditioner: self.settings.setValue("solver/preconditioner", p))
+            preconditioner_group.addAction(action)
+            solver_submenu.addAction(action)
+        self.matrix_free_action = QAction("Matris İçermeyen (Eleman Bazlı) Operatör", self, checkable=True)
+        self.matrix_free_action.setChecked(self.settings.value("solver/matrix_free", False, type=bool))
+        self.matrix_free_action.setStatusTip("Global rijitlik matrisini kurmadan eleman matrisleriyle çarp (ILU ile kullanılamaz)")
+        self.matrix_free_action.triggered.connect(lambda checked: self.settings.setValue("solver/matrix_free", checked))
+        solver_submenu.addAction(self.matrix_free_action)
+        tolerance_action = QAction("Yakınsama Toleransı...", self)
+        tolerance_action.triggered.connect(self.choose_solver_tolerance)
+        solver_submenu.addAction(tolerance_action)
+        self.solve_action = QAction("Çöz", self)
+        self.solve_action.setStatusTip("Lineer elastik statik analizi çalıştır")
+        self.solve_action.triggered.connect(self.run_solver)
+        settings_menu.addAction(self.solve_action)
+
+        # Sonuçlar Menüsü
+        results_menu = menubar.addMenu("&Sonuçlar")
+        result_case_action = QAction("Gösterilecek Yük Durumu...", self)
+        result_case_action.setStatusTip("Hangi yük durumunun sonuçlarının mesh üzerinde gösterileceğini seç")
+        result_case_action.triggered.connect(self.select_result_case_dialog)
+        results_menu.addAction(result_case_action)
+        results_menu.addSeparator()
+        field_submenu = results_menu.addMenu("Gösterilecek Alan")
+        field_group = QActionGroup(self)
+        current_field = self.settings.value("results/field", "von_mises")
+        for field_name, label in [("none", "Alan Yok (Düz Renk)")] + [(name, label) for name, (label, _) in RESULT_FIELDS.items()]:
+            action = QAction(label, self, checkable=True)
+            action.setChecked(field_name == current_field)
+            action.triggered.connect(lambda checked, f=field_name: self.set_result_display_setting("results/field", f))
+            field_group.addAction(action)
+            field_submenu.addAction(action)
+        colormap_submenu = results_menu.addMenu("Renk Haritası")
+        colormap_group = QActionGroup(self)
+        current_colormap = self.settings.value("results/colormap", "viridis")
+        for colormap in COLORMAPS:
+            action = QAction(colormap, self, checkable=True)
+            action.setChecked(colormap == current_colormap)
+            action.triggered.connect(lambda checked, c=colormap: self.set_result_display_setting("results/colormap", c))
+            colormap_group.addAction(action)
+            colormap_submenu.addAction(action)
+        self.nodal_average_action = QAction("Düğümlerde Ortala", self, checkable=True)
+        self.nodal_average_action.setChecked(self.settings.value("results/nodal_average", True, type=bool))
+        self.nodal_average_action.setStatusTip("Eleman gerilmelerini düğümlerde ortalayarak sürekli göster; kapalıyken eleman başına sabit renk")
+        self.nodal_average_action.triggered.connect(lambda checked: self.set_result_display_setting("results/nodal_average", checked))
+        results_menu.addAction(self.nodal_average_action)
 
         # Durum Çubuğu
         self.statusBar().showMessage("Hazır")
@@ -111,6 +338,18 @@ class MainWindow(QMainWindow):
         # Başlangıçta sahne
         self.plotter.add_axes()
         self.plotter.camera_position = 'iso'
+        self.lod = LodController(self.plotter, self.settings.value("lod/frame_time_ms", 33, type=int) / 1000.0)
+
+        # Profil paneli: görünürken aşama ve kare süreleri kaydedilir
+        self.frame_timer = FrameTimer(self.plotter.render_window)
+        self.profiler_dock = ProfilerDock(self, memory_report=self.memory_report)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.profiler_dock)
+        self.profiler_dock.hide()
+        view_menu.addSeparator()
+        profiler_action = self.profiler_dock.toggleViewAction()
+        profiler_action.setText("Profil Paneli")
+        profiler_action.setStatusTip("Kare sürelerini, aşama sürelerini ve bellek kullanımını göster")
+        view_menu.addAction(profiler_action)
 
     @Slot()
     def open_file_dialog(self):
@@ -124,28 +363,351 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Dosya seçimi iptal edildi.")
 
     def load_mesh(self, file_path):
-        try:
-            self.current_mesh = pv.read(file_path)
-            if not self.current_mesh or not self.current_mesh.points.size:
-                raise ValueError("Mesh dosyası geçerli noktalar içermiyor veya okunamadı.")
-            self.plotter.clear_actors()
-            self.plotter.add_mesh(self.current_mesh, name="main_mesh", show_edges=True, color="lightblue")
-            self.reset_camera_for_mesh()
-            self.statusBar().showMessage(f"{file_path} başarıyla yüklendi.")
-            self.clear_all_bcs_and_loads(inform_user=False)
-            self.last_picked_node_index = None
-            self.last_picked_point_coords = None
-            self.remove_selection_marker()
-            if self.select_mode_action.isChecked():
-                self.plotter.enable_point_picking(
-                    callback=self.on_raw_point_picked,
-                    show_message=False
-                )
-        except Exception as e:
-            self.current_mesh = None
-            self.statusBar().showMessage(f"Hata: Mesh yüklenemedi - {e}")
-            QMessageBox.critical(self, "Yükleme Hatası", f"Mesh dosyası yüklenirken bir hata oluştu:\n{e}")
-            print(f"Hata: {e}")
+        # Okuma arka planda yapılır; mevcut mesh ve sınır koşulları yeni mesh hazır olana kadar kullanılabilir kalır
+        self.cancel_mesh_load(silent=True)
+        renumber_method = self.settings.value("mesh/renumber", "none")
+        worker = Worker(read_mesh, file_path, progress=True, cache=self.mesh_cache,
+                        renumber_method=None if renumber_method == "none" else renumber_method)
+        worker.signals.progress.connect(lambda stage, p=file_path: self.statusBar().showMessage(f"{p} yükleniyor: {stage}..."))
+        worker.signals.finished.connect(lambda result, w=worker, p=file_path: self.on_mesh_loaded(w, p, result))
+        worker.signals.error.connect(lambda message, w=worker: self.on_mesh_load_failed(w, message))
+        self._load_worker = worker
+        self.cancel_load_action.setEnabled(True)
+        self.thread_pool.start(worker)
+
+    @Slot()
+    def cancel_mesh_load(self, silent=False):
+        if self._load_worker is None:
+            return
+        self._load_worker.cancel()
+        self._load_worker = None
+        self.cancel_load_action.setEnabled(False)
+        if not silent:
+            self.statusBar().showMessage("Mesh yüklemesi iptal edildi.")
+
+    def configure_mesh_cache(self):
+        if not self.settings.value("cache/enabled", True, type=bool):
+            self.mesh_cache = None
+            return
+        default_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation) + "/mesh_cache"
+        self.mesh_cache = MeshCache(
+            self.settings.value("cache/directory", default_dir),
+            max_bytes=self.settings.value("cache/max_size_mb", 10240, type=int) * 1024 ** 2,
+            hash_content=self.settings.value("cache/hash_content", False, type=bool),
+        )
+
+    def set_cache_setting(self, key, value):
+        self.settings.setValue(key, value)
+        self.configure_mesh_cache()
+
+    @Slot()
+    def choose_cache_location(self):
+        current_dir = self.mesh_cache.root if self.mesh_cache else ""
+        directory = QFileDialog.getExistingDirectory(self, "Önbellek Konumu Seç", current_dir)
+        if directory:
+            self.set_cache_setting("cache/directory", directory)
+            self.statusBar().showMessage(f"Önbellek konumu: {directory}")
+
+    @Slot()
+    def choose_cache_size_limit(self):
+        current_mb = self.settings.value("cache/max_size_mb", 10240, type=int)
+        size_mb, ok = QInputDialog.getInt(self, "Önbellek Boyut Sınırı", "En fazla boyut (MB):", current_mb, 1, 10 ** 7)
+        if ok:
+            self.set_cache_setting("cache/max_size_mb", size_mb)
+            if self.mesh_cache:
+                self.mesh_cache.evict()
+            self.statusBar().showMessage(f"Önbellek boyut sınırı: {size_mb} MB")
+
+    @Slot()
+    def clear_mesh_cache(self):
+        if self.mesh_cache is None:
+            self.statusBar().showMessage("Mesh önbelleği devre dışı.")
+            return
+        size_mb = self.mesh_cache.total_size() / 1024 ** 2
+        self.mesh_cache.clear()
+        self.statusBar().showMessage(f"Mesh önbelleği temizlendi ({size_mb:.1f} MB).")
+
+    def on_mesh_loaded(self, worker, file_path, result):
+        if worker is not self._load_worker:
+            return
+        self._load_worker = None
+        self.cancel_load_action.setEnabled(False)
+        mesh, render_mesh, renumbering, cache_error = result
+        self.show_new_mesh(mesh, render_mesh)
+        self.mesh_path = file_path
+        self.set_project_path(None)
+        message = f"{file_path} başarıyla yüklendi." + (f" {describe(renumbering)}" if renumbering else "")
+        if cache_error:
+            message += f" (Uyarı: {cache_error})"
+        self.statusBar().showMessage(message)
+
+    def show_new_mesh(self, mesh, render_mesh):
+        # Sahne, sınır koşulları, sonuçlar ve seçimler yeni mesh için sıfırlanır
+        self.current_mesh = mesh
+        self.lod.detach()
+        self.remove_result_scalar_bar()
+        self.plotter.clear_actors()
+        with span("actor.create", n_cells=render_mesh.n_cells):
+            self.main_mesh_actor = self.plotter.add_mesh(render_mesh, name="main_mesh", show_edges=True, color="lightblue")
+        self.reset_camera_for_mesh()
+        self.rebuild_node_index()
+        self.rebuild_lod(render_mesh)
+        self.bcs = BoundaryConditionStore(self.current_mesh.n_points)
+        self.results = {}
+        self.result_case = None
+        self.result_displayed = False
+        self.result_fields.clear()
+        clear_factorization_cache()
+        self._surface_nodes = None
+        self.selected_nodes = np.empty(0, dtype=np.int64)
+        self.create_bc_overlays()
+        self.clear_all_bcs_and_loads(inform_user=False)
+        self.last_picked_node_index = None
+        self.last_picked_point_coords = None
+        self.remove_selection_marker()
+        if self.select_mode_action.isChecked():
+            self.plotter.enable_point_picking(
+                callback=self.on_raw_point_picked,
+                show_message=False
+            )
+
+    @Slot()
+    def open_project_dialog(self):
+        path = QFileDialog.getExistingDirectory(self, f"Proje Aç ({PROJECT_EXTENSION} dizini)")
+        if not path:
+            return
+        if not is_project(path):
+            QMessageBox.warning(self, "Uyarı", "Seçilen dizin bir FEA projesi değil.")
+            return
+        self.load_project(path)
+
+    def load_project(self, path):
+        # Mesh ve sınır koşulları arka planda okunur; sonuç dizileri bellek eşlemeli açılır
+        self.cancel_mesh_load(silent=True)
+        worker = Worker(open_project, path, progress=True, cache=self.mesh_cache)
+        worker.signals.progress.connect(lambda stage, p=path: self.statusBar().showMessage(f"{p} açılıyor: {stage}..."))
+        worker.signals.finished.connect(lambda state, w=worker, p=path: self.on_project_loaded(w, p, state))
+        worker.signals.error.connect(lambda message, w=worker: self.on_project_load_failed(w, message))
+        self._load_worker = worker
+        self.cancel_load_action.setEnabled(True)
+        self.thread_pool.start(worker)
+
+    def on_project_loaded(self, worker, path, state):
+        if worker is not self._load_worker:
+            return
+        self._load_worker = None
+        self.cancel_load_action.setEnabled(False)
+        self.show_new_mesh(state.mesh, state.render_mesh)
+        self.mesh_path = state.mesh_path
+        self.set_project_path(path)
+        self.material_properties = {"E": state.material.get("E"), "nu": state.material.get("nu")}
+        self.bcs = state.bcs
+        fixed = self.bcs.fixed_nodes()
+        self.fixed_nodes_overlay.set(fixed, self.current_mesh.points[fixed])
+        self.refresh_forces_visualization()
+        self.results = state.results
+        self.result_material = state.result_material
+        # Yalnızca gösterilen durumun adı geri yüklenir; alan ilk seçimde hesaplanır
+        self.result_case = state.result_case if state.result_case in self.results else None
+        message = f"Proje açıldı: {path}"
+        if self.result_case is not None:
+            message += f" Kayıtlı sonuçlar ({self.result_case}) Sonuçlar menüsünden gösterilebilir."
+        if state.source_changed:
+            message += " (Uyarı: mesh dosyası proje kaydedildikten sonra değişmiş.)"
+        if state.cache_error:
+            message += f" (Uyarı: {state.cache_error})"
+        self.statusBar().showMessage(message)
+
+    def on_project_load_failed(self, worker, message):
+        if worker is not self._load_worker:
+            return
+        self._load_worker = None
+        self.cancel_load_action.setEnabled(False)
+        self.statusBar().showMessage(f"Hata: Proje açılamadı - {message}")
+        QMessageBox.critical(self, "Proje Hatası", f"Proje açılırken bir hata oluştu:\n{message}")
+        print(f"Hata: {message}")
+
+    @Slot()
+    def save_project(self):
+        if self.project_path is None:
+            self.save_project_as()
+        else:
+            self.start_project_save(self.project_path)
+
+    @Slot()
+    def save_project_as(self):
+        if not self._require_mesh(): return
+        path, _ = QFileDialog.getSaveFileName(self, "Projeyi Farklı Kaydet", "", f"FEA Projesi (*{PROJECT_EXTENSION})")
+        if not path:
+            return
+        if not path.endswith(PROJECT_EXTENSION):
+            path += PROJECT_EXTENSION
+        self.start_project_save(path)
+
+    def start_project_save(self, path):
+        if not self._require_mesh(): return
+        if self._save_worker is not None:
+            self.statusBar().showMessage("Proje kaydı zaten devam ediyor...")
+            return
+        # Kayıt sürerken kullanıcı düzenlemeye devam edebilir: sınır koşulları kopyalanır, mesh'in
+        # sığ kopyası alınır; sonuç dizileri hiç yerinde değiştirilmediği için paylaşılır
+        mesh = self.current_mesh
+        state = ProjectState(
+            mesh_path=self.mesh_path, mesh=mesh.copy(deep=False), material=dict(self.material_properties),
+            bcs=self.bcs.copy(), results=dict(self.results), result_case=self.result_case,
+            result_material=self.result_material,
+        )
+        worker = Worker(save_project, path, state, self.embed_mesh_action.isChecked(), progress=True)
+        worker.signals.progress.connect(lambda stage: self.statusBar().showMessage(f"Proje kaydediliyor: {stage}..."))
+        worker.signals.finished.connect(lambda saved_path, m=mesh: self.on_project_saved(m, saved_path))
+        worker.signals.error.connect(self.on_project_save_failed)
+        self._save_worker = worker
+        self.save_project_action.setEnabled(False)
+        self.thread_pool.start(worker)
+
+    def on_project_saved(self, mesh, path):
+        self._save_worker = None
+        self.save_project_action.setEnabled(True)
+        if mesh is self.current_mesh:
+            self.set_project_path(path)
+        self.statusBar().showMessage(f"Proje kaydedildi: {path}")
+
+    def on_project_save_failed(self, message):
+        self._save_worker = None
+        self.save_project_action.setEnabled(True)
+        self.statusBar().showMessage(f"Hata: Proje kaydedilemedi - {message}")
+        QMessageBox.critical(self, "Kayıt Hatası", f"Proje kaydedilirken bir hata oluştu:\n{message}")
+
+    def set_project_path(self, path):
+        self.project_path = path
+        title = "FEA Uygulaması MVP"
+        self.setWindowTitle(f"{title} - {os.path.basename(path)}" if path else title)
+
+    def rebuild_lod(self, render_mesh):
+        # Vekil yüzeyler arka planda hazırlanır; hazır olana kadar her zaman tam mesh çizilir
+        self._lod_worker = None
+        if not self.lod_action.isChecked():
+            return
+        worker = Worker(build_lod_levels, render_mesh)
+        worker.signals.finished.connect(lambda levels, w=worker, m=render_mesh: self.on_lod_built(w, m, levels))
+        worker.signals.error.connect(lambda msg: print(f"Hata: LOD seviyeleri oluşturulamadı - {msg}"))
+        self._lod_worker = worker
+        self.thread_pool.start(worker)
+
+    def on_lod_built(self, worker, render_mesh, levels):
+        if worker is not self._lod_worker:
+            return
+        self._lod_worker = None
+        if levels and self.lod_action.isChecked():
+            self.lod.attach(self.main_mesh_actor, render_mesh.n_cells, levels, color="lightblue")
+            # Vekiller etkileşimde ana yüzeyin yerine çizilir; gösterilen sonuç alanı onlara da eşlenir
+            self.update_result_display()
+
+    @Slot(bool)
+    def toggle_lod(self, checked):
+        self.settings.setValue("lod/enabled", checked)
+        if checked:
+            if self.main_mesh_actor is not None:
+                self.rebuild_lod(self.main_mesh_actor.mapper.dataset)
+        else:
+            self._lod_worker = None
+            self.lod.detach()
+            self.plotter.render()
+
+    @Slot()
+    def choose_frame_time_target(self):
+        current_ms = self.settings.value("lod/frame_time_ms", 33, type=int)
+        frame_ms, ok = QInputDialog.getInt(self, "Hedef Kare Süresi", "Hedef kare süresi (ms):", current_ms, 1, 1000)
+        if ok:
+            self.settings.setValue("lod/frame_time_ms", frame_ms)
+            self.lod.frame_time_target = frame_ms / 1000.0
+            self.statusBar().showMessage(f"Hedef kare süresi: {frame_ms} ms (~{1000.0 / frame_ms:.0f} FPS)")
+
+    @Slot()
+    def renumber_current_mesh(self):
+        if not self._require_mesh(): return
+        method = self.settings.value("mesh/renumber", "none")
+        if method == "none":
+            method, ok = QInputDialog.getItem(self, "Düğüm Numaralandırma", "Yöntem:", ["rcm", "morton"], 0, False)
+            if not ok: return
+        mesh = self.current_mesh
+        worker = Worker(renumber_mesh, mesh, method, progress=True)
+        worker.signals.progress.connect(lambda stage: self.statusBar().showMessage(f"Numaralandırma: {stage}..."))
+        worker.signals.finished.connect(lambda result, w=worker, m=mesh: self.on_mesh_renumbered(w, m, result))
+        worker.signals.error.connect(lambda message: self.statusBar().showMessage(f"Hata: Numaralandırma başarısız - {message}"))
+        self._renumber_worker = worker
+        self.thread_pool.start(worker)
+
+    def on_mesh_renumbered(self, worker, mesh, result):
+        # Sınır koşulları, yükler, sonuçlar ve seçimler yeni numaralara taşınır; kamera korunur
+        if worker is not self._renumber_worker:
+            return
+        self._renumber_worker = None
+        if mesh is not self.current_mesh:
+            return
+        new_mesh, render_mesh, renumbering = result
+        perm, iperm = renumbering.perm, renumbering.iperm
+        self.current_mesh = new_mesh
+        self.bcs.reorder(perm)
+        self.results = {case: replace(r, displacements=r.displacements[perm]) for case, r in self.results.items()}
+        self.selected_nodes = np.sort(iperm[self.selected_nodes])
+        if self.last_picked_node_index is not None:
+            self.last_picked_node_index = int(iperm[self.last_picked_node_index])
+        self.lod.detach()
+        self.remove_result_scalar_bar()
+        with span("actor.create", n_cells=render_mesh.n_cells):
+            self.main_mesh_actor = self.plotter.add_mesh(render_mesh, name="main_mesh", show_edges=True,
+                                                         color="lightblue", reset_camera=False)
+        self.rebuild_node_index()
+        self.rebuild_lod(render_mesh)
+        self._surface_nodes = None
+        clear_factorization_cache()
+        self.create_bc_overlays()
+        fixed = self.bcs.fixed_nodes()
+        self.fixed_nodes_overlay.set(fixed, new_mesh.points[fixed])
+        self.selection_overlay.set(self.selected_nodes, new_mesh.points[self.selected_nodes])
+        self.refresh_forces_visualization()
+        if self.result_displayed and self.result_case in self.results:
+            self.show_result_case(self.result_case)
+        self.statusBar().showMessage(f"Düğümler yeniden numaralandırıldı. {describe(renumbering)}")
+
+    def on_mesh_load_failed(self, worker, message):
+        if worker is not self._load_worker:
+            return
+        self._load_worker = None
+        self.cancel_load_action.setEnabled(False)
+        self.statusBar().showMessage(f"Hata: Mesh yüklenemedi - {message}")
+        QMessageBox.critical(self, "Yükleme Hatası", f"Mesh dosyası yüklenirken bir hata oluştu:\n{message}")
+        print(f"Hata: {message}")
+
+    def invalidate_node_index(self):
+        self.node_index = None
+        self._node_index_worker = None
+
+    def rebuild_node_index(self):
+        # KD-tree UI thread'ini bloklamadan arka planda kurulur; hazır olana kadar kaba tarama kullanılır
+        self.invalidate_node_index()
+        if self.current_mesh is None:
+            return
+        worker = Worker(NodeIndex, self.current_mesh.points)
+        worker.signals.finished.connect(lambda index, w=worker: self.on_node_index_built(w, index))
+        worker.signals.error.connect(lambda msg: print(f"Hata: Düğüm indeksi kurulamadı - {msg}"))
+        self._node_index_worker = worker
+        self.thread_pool.start(worker)
+
+    def on_node_index_built(self, worker, index):
+        # Bu arada mesh değiştiyse eski indeks atılır
+        if worker is not self._node_index_worker:
+            return
+        self._node_index_worker = None
+        self.node_index = index
+
+    def find_nearest_node(self, point):
+        if self.node_index is not None:
+            return self.node_index.nearest(point)
+        distances = np.linalg.norm(self.current_mesh.points - point, axis=1)
+        node_index = int(np.argmin(distances))
+        return node_index, float(distances[node_index])
 
     def get_material_property(self, prop_key, title, label):
         current_val_str = str(self.material_properties.get(prop_key, "0.0"))
@@ -176,7 +738,6 @@ class MainWindow(QMainWindow):
             self.remove_selection_marker()
 
     def on_raw_point_picked(self, picked_3d_point_coords):
-        print(f"DEBUG: on_raw_point_picked çağrıldı. Gelen 3D koordinat: {picked_3d_point_coords}")
         if not self.current_mesh or not hasattr(self.current_mesh, 'points'):
             return
         clicked_point = None
@@ -187,18 +748,18 @@ class MainWindow(QMainWindow):
                 elif len(picked_3d_point_coords) == 3 and all(isinstance(x, (int, float)) for x in picked_3d_point_coords):
                     clicked_point = np.array(picked_3d_point_coords)
         if clicked_point is not None:
-            distances = np.linalg.norm(self.current_mesh.points - clicked_point, axis=1)
-            node_index = np.argmin(distances)
-            if distances[node_index] > (self.current_mesh.length * 0.1):
-                print(f"DEBUG: En yakın düğüm çok uzak (mesafe: {distances[node_index]:.3f}). Seçim yapılmadı.")
+            with span("pick.nearest_node"):
+                node_index, distance = self.find_nearest_node(clicked_point)
+            if distance > (self.current_mesh.length * 0.1):
                 self.last_picked_node_index = None
                 self.last_picked_point_coords = None
                 self.remove_selection_marker()
-                self.statusBar().showMessage("Mesh üzerinde bir düğüme yakın tıklayın.")
+                self.statusBar().showMessage(f"Mesh üzerinde bir düğüme yakın tıklayın (en yakın düğüm {distance:.3g} uzakta).")
                 return
             self.last_picked_point_coords = self.current_mesh.points[node_index].copy()
             self.last_picked_node_index = int(node_index)
-            self.statusBar().showMessage(f"Düğüm {self.last_picked_node_index} seçildi ({self.last_picked_point_coords[0]:.2f}, {self.last_picked_point_coords[1]:.2f}, {self.last_picked_point_coords[2]:.2f}).")
+            self.clear_region_selection()
+            self.statusBar().showMessage(f"Düğüm {self.display_node_id(self.last_picked_node_index)} seçildi ({self.last_picked_point_coords[0]:.2f}, {self.last_picked_point_coords[1]:.2f}, {self.last_picked_point_coords[2]:.2f}).")
             self.update_selection_marker()
         else:
             self.last_picked_node_index = None
@@ -224,149 +785,451 @@ class MainWindow(QMainWindow):
             self.selected_point_actor = None
             self.plotter.render()
 
-    def update_fixed_nodes_visualization(self):
-        if self.fixed_nodes_actor:
-            self.plotter.remove_actor(self.fixed_nodes_actor, render=False)
-            self.fixed_nodes_actor = None
-        if self.fixed_nodes_indices and self.current_mesh:
-            points_to_mark = self.current_mesh.points[self.fixed_nodes_indices]
-            if points_to_mark.size > 0:
-                bounds = self.current_mesh.bounds
-                if not all(np.isfinite(bounds)): marker_radius = 0.015
-                else:
-                    diag_length = np.sqrt((bounds[1]-bounds[0])**2 + (bounds[3]-bounds[2])**2 + (bounds[5]-bounds[4])**2)
-                    marker_radius = diag_length * 0.01
-                    if marker_radius < 1e-6 : marker_radius = 0.015
-                cloud = pv.PolyData(points_to_mark)
-                glyphs = cloud.glyph(geom=pv.Sphere(radius=marker_radius), scale=False, orient=False)
-                self.fixed_nodes_actor = self.plotter.add_mesh(glyphs, color="red", name="fixed_nodes_markers", pickable=False)
+    def create_bc_overlays(self):
+        # Mesh başına bir kez oluşturulur; düzenlemelerde yalnızca ilgili düğümler güncellenir
+        for overlay in (self.fixed_nodes_overlay, self.forces_overlay, self.selection_overlay):
+            if overlay is not None:
+                overlay.remove_from_scene()
+        n_nodes = self.current_mesh.n_points
+        diag_length = self.current_mesh.length if np.isfinite(self.current_mesh.length) else 0.0
+        self.fixed_nodes_overlay = fixed_nodes_overlay(self.plotter, n_nodes, diag_length)
+        self.forces_overlay = forces_overlay(self.plotter, n_nodes, diag_length)
+        self.selection_overlay = selection_overlay(self.plotter, n_nodes, diag_length)
+
+    def update_fixed_nodes_visualization(self, nodes):
+        nodes = np.atleast_1d(np.asarray(nodes, dtype=np.int64))
+        with span("overlay.fixed", n_nodes=int(nodes.size)):
+            fixed = self.bcs.is_fixed(nodes)
+            self.fixed_nodes_overlay.set(nodes[fixed], self.current_mesh.points[nodes[fixed]])
+            self.fixed_nodes_overlay.remove(nodes[~fixed])
         self.plotter.render()
 
-    # ---- update_forces_visualization METODU GÜNCELLENDİ ----
-    def update_forces_visualization(self):
-        if self.force_arrows_actor:
-            self.plotter.remove_actor(self.force_arrows_actor, render=False)
-            self.force_arrows_actor = None
-
-        if self.applied_forces and self.current_mesh:
-            starts = []
-            directions = []
-            magnitudes = [] 
-
-            for node_idx, force_vector_list in self.applied_forces.items():
-                if 0 <= node_idx < len(self.current_mesh.points):
-                    force_vector = np.array(force_vector_list)
-                    force_mag = np.linalg.norm(force_vector)
-                    if force_mag < 1e-9: # Çok küçük kuvvetleri gösterme
-                        continue
-                    starts.append(self.current_mesh.points[node_idx])
-                    directions.append(force_vector / force_mag) # Normalize et
-                    magnitudes.append(force_mag)
-
-            if starts:
-                points_pd = pv.PolyData(np.array(starts))
-                points_pd['vectors'] = np.array(directions) 
-                points_pd['magnitudes'] = np.array(magnitudes)
-
-                bounds = self.current_mesh.bounds
-                if not all(np.isfinite(bounds)):
-                    base_shaft_radius = 0.005
-                    base_tip_length = 0.02
-                    base_tip_radius = 0.01
-                    scale_factor = 0.1 
-                else:
-                    diag_length = np.sqrt((bounds[1]-bounds[0])**2 + (bounds[3]-bounds[2])**2 + (bounds[5]-bounds[4])**2)
-                    base_shaft_radius = diag_length * 0.0025
-                    base_tip_length = diag_length * 0.01
-                    base_tip_radius = diag_length * 0.005
-                    
-                    max_mag = np.max(magnitudes) if magnitudes else 1.0
-                    if max_mag < 1e-6: max_mag = 1.0
-                    scale_factor = (diag_length * 0.05) / max_mag
-
-                arrow_prototype = pv.Arrow(
-                    direction=[0,0,1], 
-                    shaft_radius=base_shaft_radius,
-                    tip_length=base_tip_length,
-                    tip_radius=base_tip_radius
-                )
-                
-                glyphs = points_pd.glyph(
-                    orient='vectors',      
-                    scale='magnitudes',    
-                    factor=scale_factor,   
-                    geom=arrow_prototype,  
-                )
-
-                if glyphs.n_points > 0: 
-                    self.force_arrows_actor = self.plotter.add_mesh(glyphs, color="blue", name="force_arrows", pickable=False)
-                else:
-                    print("DEBUG: Kuvvetler için glif oluşturulamadı.")
-        
+    def update_forces_visualization(self, nodes):
+        nodes = np.atleast_1d(np.asarray(nodes, dtype=np.int64))
+        with span("overlay.forces", n_nodes=int(nodes.size)):
+            loaded = self.bcs.is_loaded(nodes)
+            self.forces_overlay.set(nodes[loaded], self.current_mesh.points[nodes[loaded]], self.bcs.loads[nodes[loaded]])
+            self.forces_overlay.remove(nodes[~loaded])
         self.plotter.render()
-    # ---- GÜNCELLENEN METOD SONU ----
+
+    def target_nodes(self):
+        # Bölge seçimi varsa o, yoksa son tıklanan düğüm; hiçbiri yoksa None
+        if self.selected_nodes.size:
+            return self.selected_nodes
+        if self.last_picked_node_index is not None:
+            return np.array([self.last_picked_node_index], dtype=np.int64)
+        return None
+
+    def display_node_id(self, node):
+        # Yeniden numaralandırılmış mesh'lerde kullanıcıya dosyadaki düğüm numarası gösterilir
+        if ORIGINAL_IDS in self.current_mesh.point_data:
+            return int(self.current_mesh.point_data[ORIGINAL_IDS][node])
+        return int(node)
+
+    def nodes_label(self, nodes):
+        return f"Düğüm {self.display_node_id(nodes[0])}" if len(nodes) == 1 else f"{len(nodes)} düğüm"
 
     @Slot()
     def fix_selected_node_action(self):
-        if self.last_picked_node_index is None:
+        nodes = self.target_nodes()
+        if nodes is None:
             QMessageBox.warning(self, "Uyarı", "Lütfen önce sabitlemek için bir düğüm seçin.")
             return
-        if self.last_picked_node_index not in self.fixed_nodes_indices:
-            self.fixed_nodes_indices.append(self.last_picked_node_index)
-            self.fixed_nodes_indices.sort()
-            self.statusBar().showMessage(f"Düğüm {self.last_picked_node_index} sabitlendi.")
-            self.update_fixed_nodes_visualization()
+        changed = self.bcs.fix(nodes)
+        if changed.size:
+            self.statusBar().showMessage(f"{self.nodes_label(changed)} sabitlendi.")
+            self.update_fixed_nodes_visualization(changed)
         else:
-            self.statusBar().showMessage(f"Düğüm {self.last_picked_node_index} zaten sabitlenmiş.")
+            self.statusBar().showMessage(f"{self.nodes_label(nodes)} zaten sabitlenmiş.")
             
+    @Slot()
+    def fix_selected_node_components_dialog(self):
+        nodes = self.target_nodes()
+        if nodes is None:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce sabitlemek için bir düğüm seçin.")
+            return
+        current = "".join(axis for axis, fixed in zip("xyz", self.bcs.fixity[nodes[0]]) if fixed) or "xyz"
+        text, ok = QInputDialog.getText(self, f"Bileşen Sabitle ({self.nodes_label(nodes)})", "Sabitlenecek bileşenler (x, y, z):", QLineEdit.Normal, current)
+        if not ok: return
+        components = [axis in text.lower() for axis in "xyz"]
+        # Listelenmeyen bileşenlerin sabitlemesi kaldırılır
+        self.bcs.unfix(nodes, [not c for c in components])
+        self.bcs.fix(nodes, components)
+        fixed_axes = "".join(axis for axis, c in zip("xyz", components) if c)
+        self.statusBar().showMessage(f"{self.nodes_label(nodes)} sabit bileşenler: {fixed_axes or 'yok'}.")
+        self.update_fixed_nodes_visualization(nodes)
+
     @Slot()
     def unfix_selected_node_action(self):
-        if self.last_picked_node_index is None:
+        nodes = self.target_nodes()
+        if nodes is None:
             QMessageBox.warning(self, "Uyarı", "Lütfen önce sabitlemesini kaldırmak için bir düğüm seçin.")
             return
-        if self.last_picked_node_index in self.fixed_nodes_indices:
-            self.fixed_nodes_indices.remove(self.last_picked_node_index)
-            self.statusBar().showMessage(f"Düğüm {self.last_picked_node_index} sabitlemesi kaldırıldı.")
-            self.update_fixed_nodes_visualization()
+        changed = self.bcs.unfix(nodes)
+        if changed.size:
+            self.statusBar().showMessage(f"{self.nodes_label(changed)} sabitlemesi kaldırıldı.")
+            self.update_fixed_nodes_visualization(changed)
         else:
-            self.statusBar().showMessage(f"Düğüm {self.last_picked_node_index} zaten sabit değil.")
+            self.statusBar().showMessage(f"{self.nodes_label(nodes)} zaten sabit değil.")
+
+    def ask_vector(self, title, label, default):
+        text, ok = QInputDialog.getText(self, title, label, QLineEdit.Normal, ", ".join(f"{v:g}" for v in default))
+        if not ok:
+            return None
+        try:
+            values = [float(v) for v in text.replace(";", ",").replace(",", " ").split()]
+            if len(values) != 3:
+                raise ValueError
+        except ValueError:
+            QMessageBox.warning(self, "Geçersiz Değer", "Lütfen virgülle ayrılmış üç sayı girin (ör. 0, 0, 1).")
+            return None
+        return np.array(values)
 
     @Slot()
     def apply_force_dialog(self):
-        if self.last_picked_node_index is None:
+        nodes = self.target_nodes()
+        if nodes is None:
             QMessageBox.warning(self, "Uyarı", "Lütfen önce kuvvet uygulamak için bir düğüm seçin.")
             return
-        node_idx = self.last_picked_node_index
-        current_force_str = [str(f) for f in self.applied_forces.get(node_idx, [0.0, 0.0, 0.0])]
-        fx_str, ok_fx = QInputDialog.getText(self, f"Kuvvet Uygula (Düğüm {node_idx})", "Fx:", QLineEdit.Normal, current_force_str[0])
+        label = self.nodes_label(nodes)
+        current_force_str = [str(f) for f in self.bcs.loads[nodes[0]].tolist()]
+        fx_str, ok_fx = QInputDialog.getText(self, f"Kuvvet Uygula ({label})", "Fx:", QLineEdit.Normal, current_force_str[0])
         if not ok_fx: return
-        fy_str, ok_fy = QInputDialog.getText(self, f"Kuvvet Uygula (Düğüm {node_idx})", "Fy:", QLineEdit.Normal, current_force_str[1])
+        fy_str, ok_fy = QInputDialog.getText(self, f"Kuvvet Uygula ({label})", "Fy:", QLineEdit.Normal, current_force_str[1])
         if not ok_fy: return
-        fz_str, ok_fz = QInputDialog.getText(self, f"Kuvvet Uygula (Düğüm {node_idx})", "Fz:", QLineEdit.Normal, current_force_str[2])
+        fz_str, ok_fz = QInputDialog.getText(self, f"Kuvvet Uygula ({label})", "Fz:", QLineEdit.Normal, current_force_str[2])
         if not ok_fz: return
         try:
             fx, fy, fz = float(fx_str), float(fy_str), float(fz_str)
             if abs(fx) < 1e-9 and abs(fy) < 1e-9 and abs(fz) < 1e-9:
-                if node_idx in self.applied_forces: del self.applied_forces[node_idx]
-                self.statusBar().showMessage(f"Düğüm {node_idx} üzerindeki kuvvet kaldırıldı.")
+                self.bcs.clear_loads(nodes)
+                self.statusBar().showMessage(f"{label} üzerindeki kuvvet kaldırıldı.")
             else:
-                self.applied_forces[node_idx] = [fx, fy, fz]
-                self.statusBar().showMessage(f"Düğüm {node_idx}'e kuvvet uygulandı: [{fx:.2f}, {fy:.2f}, {fz:.2f}]")
-            self.update_forces_visualization()
+                self.bcs.set_loads(nodes, [fx, fy, fz])
+                self.statusBar().showMessage(f"{label} için kuvvet uygulandı: [{fx:.2f}, {fy:.2f}, {fz:.2f}]")
+            self.update_forces_visualization(nodes)
         except ValueError:
             QMessageBox.warning(self, "Geçersiz Değer", "Lütfen kuvvet bileşenleri için geçerli sayılar girin.")
-        
+
+    @Slot()
+    def distribute_force_dialog(self):
+        if not self.selected_nodes.size:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce bir bölge seçin.")
+            return
+        nodes = self.selected_nodes
+        total = self.ask_vector("Toplam Kuvvet Dağıt", f"Toplam kuvvet (Fx, Fy, Fz), {len(nodes)} düğüme eşit paylaştırılır:", (0.0, 0.0, 0.0))
+        if total is None: return
+        self.bcs.set_loads(nodes, distribute_force(nodes, total))
+        self.statusBar().showMessage(f"[{total[0]:.2f}, {total[1]:.2f}, {total[2]:.2f}] toplam kuvvet {len(nodes)} düğüme dağıtıldı.")
+        self.update_forces_visualization(nodes)
+
+    # Bölge seçimi
+    def surface_nodes(self):
+        # Görüntülenen yüzeydeki düğümler (asıl mesh numaralandırmasında); mesh başına bir kez hesaplanır
+        if self._surface_nodes is None:
+            render_mesh = self.main_mesh_actor.mapper.dataset
+            if "vtkOriginalPointIds" in render_mesh.point_data:
+                self._surface_nodes = np.unique(render_mesh.point_data["vtkOriginalPointIds"]).astype(np.int64)
+            else:
+                self._surface_nodes = np.arange(self.current_mesh.n_points)
+        return self._surface_nodes
+
+    def set_region_selection(self, nodes, description):
+        nodes = np.asarray(nodes, dtype=np.int64)
+        with span("overlay.selection", n_nodes=int(nodes.size)):
+            self.selection_overlay.clear()
+            self.selected_nodes = nodes
+            self.selection_overlay.set(nodes, self.current_mesh.points[nodes])
+        self.plotter.render()
+        self.statusBar().showMessage(f"{description}: {len(nodes)} düğüm seçildi.")
+
+    @Slot()
+    def clear_region_selection(self):
+        self.selected_nodes = np.empty(0, dtype=np.int64)
+        if self.selection_overlay:
+            self.selection_overlay.clear()
+            self.plotter.render()
+
+    def memory_report(self):
+        # Profil paneli için (etiket, bayt) listesi
+        entries = []
+        if self.current_mesh is not None:
+            entries.append(("Mesh", dataset_memory(self.current_mesh)))
+        if self.main_mesh_actor is not None:
+            entries.append(("Görüntülenen yüzey", dataset_memory(self.main_mesh_actor.mapper.dataset)))
+        if self.lod.levels:
+            entries.append(("LOD vekilleri", sum(dataset_memory(actor.mapper.dataset) for actor, _ in self.lod.levels)))
+        overlays = [o for o in (self.fixed_nodes_overlay, self.forces_overlay, self.selection_overlay) if o is not None]
+        if overlays:
+            entries.append(("Sınır koşulu / yük katmanları", sum(o.nbytes for o in overlays)))
+        entries.append(("Sınır koşulları ve yükler", self.bcs.fixity.nbytes + sum(a.nbytes for a in self.bcs.load_cases.values())))
+        if self.results:
+            entries.append(("Sonuçlar", sum(r.displacements.nbytes + r.stresses.nbytes for r in self.results.values())))
+        if self.result_fields.nbytes:
+            entries.append(("Türetilmiş sonuç alanları", self.result_fields.nbytes))
+        return entries
+
+    def _require_mesh(self):
+        if not self.current_mesh:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce bir mesh dosyası yükleyin.")
+            return False
+        return True
+
+    @Slot()
+    def start_box_selection(self):
+        if not self._require_mesh(): return
+        if self.select_mode_action.isChecked():
+            self.select_mode_action.setChecked(False)
+        self.box_zoom_action.setChecked(False)
+        self.plotter.disable_picking()
+        self.plotter.enable_rectangle_picking(callback=self.on_rectangle_selected, show_message=False, start=True)
+        self.statusBar().showMessage("Seçmek istediğiniz bölgenin etrafına bir kutu sürükleyin.")
+
+    def on_rectangle_selected(self, selection):
+        self.plotter.disable_picking()
+        self.plotter.enable_trackball_style()
+        nodes = nodes_in_screen_rect(self.current_mesh.points, self.plotter.renderer, selection.viewport, self.surface_nodes())
+        self.set_region_selection(nodes, "Kutu seçimi")
+
+    @Slot()
+    def select_near_plane_dialog(self):
+        if not self._require_mesh(): return
+        origin_default = self.last_picked_point_coords if self.last_picked_point_coords is not None else self.current_mesh.center
+        origin = self.ask_vector("Düzleme Yakın Düğümler", "Düzlem üzerindeki bir nokta (x, y, z):", origin_default)
+        if origin is None: return
+        normal = self.ask_vector("Düzleme Yakın Düğümler", "Düzlem normali (x, y, z):", (1.0, 0.0, 0.0))
+        if normal is None: return
+        tolerance, ok = QInputDialog.getDouble(self, "Düzleme Yakın Düğümler", "Tolerans:", self.current_mesh.length * 1e-3, 0.0, 1e12, 6)
+        if not ok: return
+        try:
+            self.set_region_selection(nodes_near_plane(self.current_mesh.points, origin, normal, tolerance), "Düzlem seçimi")
+        except ValueError as e:
+            QMessageBox.warning(self, "Geçersiz Değer", str(e))
+
+    @Slot()
+    def select_in_sphere_dialog(self):
+        if not self._require_mesh(): return
+        center_default = self.last_picked_point_coords if self.last_picked_point_coords is not None else self.current_mesh.center
+        center = self.ask_vector("Küre İçindeki Düğümler", "Küre merkezi (x, y, z):", center_default)
+        if center is None: return
+        radius, ok = QInputDialog.getDouble(self, "Küre İçindeki Düğümler", "Yarıçap:", self.current_mesh.length * 0.05, 0.0, 1e12, 6)
+        if not ok: return
+        nodes = nodes_in_sphere(self.current_mesh.points, center, radius, self.node_index)
+        self.set_region_selection(nodes, "Küre seçimi")
+
+    @Slot()
+    def select_in_box_dialog(self):
+        if not self._require_mesh(): return
+        bounds = self.current_mesh.bounds
+        lower = self.ask_vector("Kutu İçindeki Düğümler", "Alt köşe (x, y, z):", bounds[0::2])
+        if lower is None: return
+        upper = self.ask_vector("Kutu İçindeki Düğümler", "Üst köşe (x, y, z):", bounds[1::2])
+        if upper is None: return
+        self.set_region_selection(nodes_in_box(self.current_mesh.points, lower, upper), "Kutu (eksen hizalı) seçimi")
+
+    @Slot()
+    def select_surface_patch_dialog(self):
+        if not self._require_mesh(): return
+        if self.last_picked_node_index is None:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce yama üzerindeki bir düğümü seçin.")
+            return
+        angle, ok = QInputDialog.getDouble(self, "Yüzey Yaması", "Özellik açısı (derece):", 30.0, 0.0, 180.0, 1)
+        if not ok: return
+        nodes = surface_patch(self.main_mesh_actor.mapper.dataset, self.last_picked_node_index, angle)
+        self.set_region_selection(nodes, "Yüzey yaması seçimi")
+
     @Slot()
     def clear_all_bcs_and_loads(self, inform_user=True):
-        self.fixed_nodes_indices.clear()
-        self.applied_forces.clear()
-        if self.fixed_nodes_actor: self.plotter.remove_actor(self.fixed_nodes_actor, render=False); self.fixed_nodes_actor = None
-        if self.force_arrows_actor: self.plotter.remove_actor(self.force_arrows_actor, render=False); self.force_arrows_actor = None
+        self.bcs.clear()
+        if self.fixed_nodes_overlay: self.fixed_nodes_overlay.clear()
+        if self.forces_overlay: self.forces_overlay.clear()
         self.plotter.render()
         if inform_user:
             self.statusBar().showMessage("Tüm sınır koşulları ve yükler temizlendi.")
             QMessageBox.information(self, "Temizlendi", "Tüm sınır koşulları ve yükler temizlendi.")
 
+    @Slot()
+    def run_solver(self):
+        if not self.current_mesh:
+            QMessageBox.warning(self, "Uyarı", "Lütfen önce bir mesh dosyası yükleyin.")
+            return
+        if self._solve_worker is not None:
+            self.statusBar().showMessage("Çözüm zaten devam ediyor...")
+            return
+        mesh = self.current_mesh
+        material = dict(self.material_properties)
+        # Tüm yük durumları tek çarpanlara ayırma ile çözülür; yalnızca yük değiştiyse çarpanlar önbellekten gelir
+        worker = Worker(solve_load_cases, mesh, material,
+                        self.bcs.constrained_dofs(), self.bcs.load_vectors(), self.solver_options(), progress=True)
+        worker.signals.progress.connect(lambda message: self.statusBar().showMessage(f"Çözülüyor: {message}"))
+        worker.signals.finished.connect(lambda results, m=mesh, mat=material: self.on_solve_finished(m, mat, results))
+        worker.signals.error.connect(self.on_solve_failed)
+        self._solve_worker = worker
+        self.solve_action.setEnabled(False)
+        self.statusBar().showMessage("Çözülüyor...")
+        self.thread_pool.start(worker)
+
+    def solver_options(self):
+        return SolverOptions(
+            method=self.settings.value("solver/method", "auto"),
+            preconditioner=self.settings.value("solver/preconditioner", "block_jacobi"),
+            matrix_free=self.settings.value("solver/matrix_free", False, type=bool),
+            tolerance=self.settings.value("solver/tolerance", 1e-8, type=float),
+        )
+
+    @Slot()
+    def choose_solver_tolerance(self):
+        current = self.settings.value("solver/tolerance", 1e-8, type=float)
+        text, ok = QInputDialog.getText(self, "Yakınsama Toleransı", "Göreli artık toleransı (yinelemeli çözücü):", QLineEdit.Normal, f"{current:g}")
+        if not ok: return
+        try:
+            tolerance = float(text)
+            if not 0.0 < tolerance < 1.0:
+                raise ValueError
+        except ValueError:
+            QMessageBox.warning(self, "Geçersiz Değer", "Tolerans 0 ile 1 arasında bir sayı olmalıdır (ör. 1e-8).")
+            return
+        self.settings.setValue("solver/tolerance", tolerance)
+        self.statusBar().showMessage(f"Yakınsama toleransı: {tolerance:g}")
+
+    def on_solve_finished(self, mesh, material, results):
+        self._solve_worker = None
+        self.solve_action.setEnabled(True)
+        if mesh is not self.current_mesh:
+            return
+        self.results = results
+        self.result_material = (float(material["E"]), float(material["nu"]))
+        case = self.bcs.active_case if self.bcs.active_case in results else next(iter(results))
+        self.show_result_case(case)
+        if len(results) > 1:
+            self.statusBar().showMessage(f"{len(results)} yük durumu çözüldü. {self.statusBar().currentMessage()}")
+
+    def show_result_case(self, case):
+        result = self.results[case]
+        self.result_case = case
+        self.result_displayed = True
+        self.current_mesh.point_data["displacement"] = result.displacements
+        self.current_mesh.cell_data["stress"] = result.stresses
+        max_disp = np.linalg.norm(result.displacements, axis=1).max()
+        message = f"Sonuçlar: {case}. Maksimum yer değiştirme: {max_disp:.4g}"
+        if result.residual_history:
+            iterations, residual = result.residual_history[-1]
+            message += f" ({iterations} yineleme, göreli artık {residual:.1e})"
+        self.update_result_display()
+        self.statusBar().showMessage(message)
+
+    def set_result_display_setting(self, key, value):
+        self.settings.setValue(key, value)
+        if not self.result_displayed and self.result_case in self.results:
+            # Projeden açılmış, henüz gösterilmemiş sonuçlar: alan seçimi gösterme isteğidir
+            self.show_result_case(self.result_case)
+        else:
+            self.update_result_display()
+
+    def update_result_display(self):
+        # Mesh yeniden eklenmez: mevcut main_mesh aktörünün ve LOD vekillerinin yüzeyine tek bir skaler dizi
+        # yazılır ve eşleyicilerin dizi adı, renk tablosu ve aralığı güncellenir
+        if self.main_mesh_actor is None:
+            return
+        mapper = self.main_mesh_actor.mapper
+        mappers = [mapper] + [actor.mapper for actor, _ in self.lod.levels]
+        field_name = self.settings.value("results/field", "von_mises")
+        if not self.result_displayed or self.result_case not in self.results or field_name not in RESULT_FIELDS:
+            for m in mappers:
+                m.scalar_visibility = False
+            self.remove_result_scalar_bar()
+            self.plotter.render()
+            return
+        location = "point" if self.nodal_average_action.isChecked() else "cell"
+        self.result_fields.set_inputs(self.current_mesh, self.results[self.result_case], *self.result_material)
+        values = self.result_fields.get(field_name, location)
+        if RESULT_FIELDS[field_name][1]:
+            location = "point"
+
+        # Görüntülenen yüzey asıl mesh'in alt kümesidir; değerler vtkOriginal*Ids ile eşlenir
+        clim = value_range(values)
+        colormap = self.settings.value("results/colormap", "viridis")
+        with span("post.map_to_surface", field=field_name, location=location, clim=clim, n_lod=len(mappers) - 1):
+            for m in mappers:
+                show_result_scalars(m, values, location, colormap, clim, surface_source_ids(m.dataset, location))
+        title = f"{RESULT_FIELDS[field_name][0]} [{self.result_case}]"
+        self.remove_result_scalar_bar()
+        self.plotter.add_scalar_bar(title=title, mapper=mapper, render=False)
+        self._result_scalar_bar = title
+        self.plotter.render()
+
+    def remove_result_scalar_bar(self):
+        # Aktör değiştirilirken PyVista çubuğu kendisi kaldırmış olabilir
+        if self._result_scalar_bar in self.plotter.scalar_bars:
+            self.plotter.remove_scalar_bar(self._result_scalar_bar, render=False)
+        self._result_scalar_bar = None
+
+    @Slot()
+    def select_result_case_dialog(self):
+        if not self.results:
+            QMessageBox.warning(self, "Uyarı", "Henüz çözüm sonucu yok. Önce analizi çözün.")
+            return
+        cases = list(self.results)
+        current = cases.index(self.result_case) if self.result_case in cases else 0
+        case, ok = QInputDialog.getItem(self, "Sonuç Yük Durumu", "Gösterilecek yük durumu:", cases, current, False)
+        if ok:
+            self.show_result_case(case)
+
+    def refresh_forces_visualization(self):
+        # Etkin yük durumu değişince ok katmanı baştan doldurulur
+        if self.forces_overlay is None:
+            return
+        nodes = self.bcs.loaded_nodes()
+        self.forces_overlay.clear()
+        self.forces_overlay.set(nodes, self.current_mesh.points[nodes], self.bcs.loads[nodes])
+        self.plotter.render()
+
+    @Slot()
+    def new_load_case_dialog(self):
+        if not self._require_mesh(): return
+        default_name = f"Yük Durumu {len(self.bcs.load_cases) + 1}"
+        name, ok = QInputDialog.getText(self, "Yeni Yük Durumu", "Yük durumu adı:", QLineEdit.Normal, default_name)
+        if not ok or not name.strip(): return
+        try:
+            self.bcs.add_load_case(name.strip())
+        except ValueError as e:
+            QMessageBox.warning(self, "Geçersiz Değer", str(e))
+            return
+        self.bcs.set_active_case(name.strip())
+        self.refresh_forces_visualization()
+        self.statusBar().showMessage(f"Etkin yük durumu: {name.strip()}")
+
+    @Slot()
+    def select_load_case_dialog(self):
+        if not self._require_mesh(): return
+        cases = self.bcs.case_names()
+        case, ok = QInputDialog.getItem(self, "Etkin Yük Durumu", "Yük durumu:", cases, cases.index(self.bcs.active_case), False)
+        if ok:
+            self.bcs.set_active_case(case)
+            self.refresh_forces_visualization()
+            self.statusBar().showMessage(f"Etkin yük durumu: {case}")
+
+    @Slot()
+    def remove_active_load_case(self):
+        if not self._require_mesh(): return
+        case = self.bcs.active_case
+        try:
+            self.bcs.remove_load_case(case)
+        except ValueError as e:
+            QMessageBox.warning(self, "Uyarı", str(e))
+            return
+        self.results.pop(case, None)
+        if case == self.result_case:
+            self.update_result_display()
+        self.refresh_forces_visualization()
+        self.statusBar().showMessage(f"'{case}' silindi. Etkin yük durumu: {self.bcs.active_case}")
+
+    def on_solve_failed(self, message):
+        self._solve_worker = None
+        self.solve_action.setEnabled(True)
+        self.statusBar().showMessage(f"Hata: Çözüm başarısız - {message}")
+        QMessageBox.critical(self, "Çözüm Hatası", f"Analiz çözülürken bir hata oluştu:\n{message}")
+
     @Slot(bool)
     def toggle_box_zoom_mode(self, checked):
         if not self.plotter or not self.plotter.iren: return
@@ -401,19 +1264,22 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Kutu Zoom Modu", "Kutu Zoom Modu devre dışı bırakıldı.")
 
     # Kamera Kontrolleri
+    # Ön ayarlar da etkileşim gibi önce LOD vekiliyle çizilir, tam mesh kısa süre sonra geri gelir
     def view_front(self):
-        if self.current_mesh: self.plotter.view_vector((0,0,-1), viewup=(0,1,0))
+        if self.current_mesh: self.lod.preview(); self.plotter.view_vector((0,0,-1), viewup=(0,1,0))
     def view_top(self):
-        if self.current_mesh: self.plotter.view_vector((0,1,0), viewup=(0,0,-1))
+        if self.current_mesh: self.lod.preview(); self.plotter.view_vector((0,1,0), viewup=(0,0,-1))
     def view_right(self):
-        if self.current_mesh: self.plotter.view_vector((1,0,0), viewup=(0,1,0))
+        if self.current_mesh: self.lod.preview(); self.plotter.view_vector((1,0,0), viewup=(0,1,0))
     def view_isometric(self):
-        if self.current_mesh: self.plotter.view_isometric()
+        if self.current_mesh: self.lod.preview(); self.plotter.view_isometric()
     def reset_camera_for_mesh(self):
-        if self.current_mesh: self.plotter.reset_camera()
+        if self.current_mesh: self.lod.preview(); self.plotter.reset_camera()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setOrganizationName("FEA-Viewer")
+    app.setApplicationName("FEA-Viewer")
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
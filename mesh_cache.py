@@ -0,0 +1,208 @@
+# mesh_cache.py
+# Ayrıştırılmış mesh'lerin diskte ham .npy dizileri olarak saklandığı önbellek.
+# Tekrar açılışta diziler bellek eşlemeli (mmap) okunur; pv.read ayrıştırması tamamen atlanır.
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+
+import numpy as np
+import pyvista as pv
+from vtkmodules.util.numpy_support import numpy_to_vtk
+
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+POLY_CELL_KINDS = ("verts", "lines", "polys", "strips")
+MESH_KINDS = ("unstructured", "polydata")
+# Kayıtlar kullanıcının seçtiği kökün altında yalnızca bu alt dizinde tutulur; kökteki başka dizinlere dokunulmaz
+CACHE_DIR_NAME = f"fea-mesh-cache-v{FORMAT_VERSION}"
+ENTRY_NAME = re.compile(r"[0-9a-f]{40}")
+TMP_PREFIX = ".tmp-"
+
+
+class CacheError(Exception):
+    pass
+
+
+def file_fingerprint(file_path, hash_content=False):
+    stat = os.stat(file_path)
+    fingerprint = {
+        "path": os.path.abspath(file_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if hash_content:
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 22), b""):
+                digest.update(block)
+        fingerprint["content"] = digest.hexdigest()
+    return fingerprint
+
+
+def _cell_array_arrays(vtk_cell_array):
+    return pv.convert_array(vtk_cell_array.GetOffsetsArray()), pv.convert_array(vtk_cell_array.GetConnectivityArray())
+
+
+def write_mesh_arrays(directory, mesh):
+    # Mesh'i directory altına manifest + .npy dosyaları olarak yazar; manifest sözlüğünü döner
+    if isinstance(mesh, pv.UnstructuredGrid):
+        kind = "unstructured"
+        topology = {
+            "celltypes": np.asarray(mesh.celltypes),
+            "offsets": np.asarray(mesh.offset),
+            "connectivity": np.asarray(mesh.cell_connectivity),
+        }
+    elif isinstance(mesh, pv.PolyData):
+        kind = "polydata"
+        topology = {}
+        for cell_kind in POLY_CELL_KINDS:
+            cells = getattr(mesh, "Get" + cell_kind.capitalize())()
+            if cells.GetNumberOfCells():
+                topology[f"{cell_kind}_offsets"], topology[f"{cell_kind}_connectivity"] = _cell_array_arrays(cells)
+    else:
+        raise TypeError(f"Önbellek bu mesh tipini desteklemiyor: {type(mesh).__name__}")
+
+    os.makedirs(directory, exist_ok=True)
+    arrays = {"points": np.asarray(mesh.points), **topology}
+    field_names = {"point_data": [], "cell_data": []}
+    for association in field_names:
+        for i, (name, values) in enumerate(getattr(mesh, association).items()):
+            values = np.asarray(values)
+            if values.dtype.kind not in "biuf":
+                continue
+            arrays[f"{association}_{i}"] = values
+            field_names[association].append([name, f"{association}_{i}"])
+    for name, values in arrays.items():
+        np.save(os.path.join(directory, name + ".npy"), np.ascontiguousarray(values))
+    manifest = {"version": FORMAT_VERSION, "kind": kind, "arrays": sorted(arrays), **field_names}
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def read_mesh_arrays(directory, mmap=True):
+    with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError("Önbellek kaydı eski bir biçimde.")
+    # 'c' (copy-on-write): VTK dizileri dosyaya dokunmadan değiştirebilir
+    mmap_mode = "c" if mmap else None
+
+    def load(name):
+        return np.load(os.path.join(directory, name + ".npy"), mmap_mode=mmap_mode)
+
+    if manifest["kind"] == "unstructured":
+        mesh = pv.UnstructuredGrid()
+        mesh.points = load("points")
+        cells = pv.CellArray.from_arrays(load("offsets"), load("connectivity"), deep=False)
+        mesh.SetCells(numpy_to_vtk(load("celltypes"), deep=False), cells)
+    else:
+        mesh = pv.PolyData()
+        mesh.points = load("points")
+        for cell_kind in POLY_CELL_KINDS:
+            if f"{cell_kind}_offsets" in manifest["arrays"]:
+                cells = pv.CellArray.from_arrays(load(f"{cell_kind}_offsets"), load(f"{cell_kind}_connectivity"), deep=False)
+                getattr(mesh, "Set" + cell_kind.capitalize())(cells)
+    for association in ("point_data", "cell_data"):
+        for name, file_name in manifest[association]:
+            getattr(mesh, association)[name] = load(file_name)
+    return mesh
+
+
+def _directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def _is_cache_manifest(manifest_path):
+    # Proje manifest'leri de aynı adı taşır; yalnızca önbelleğin yazdığı manifest'ler kabul edilir
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(manifest, dict) and manifest.get("version") == FORMAT_VERSION and manifest.get("kind") in MESH_KINDS
+
+
+class MeshCache:
+    def __init__(self, root, max_bytes=10 * 1024 ** 3, hash_content=False):
+        self.root = root
+        self.directory = os.path.join(root, CACHE_DIR_NAME)
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+
+    def key(self, file_path):
+        fingerprint = file_fingerprint(file_path, self.hash_content)
+        return hashlib.sha1(json.dumps(fingerprint, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _entry_dir(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, file_path, key=None):
+        # key: önceden hesaplanmış anahtar (hash_content açıkken dosyanın ikinci kez okunmaması için)
+        entry = self._entry_dir(key or self.key(file_path))
+        manifest_path = os.path.join(entry, MANIFEST_NAME)
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            mesh = read_mesh_arrays(entry)
+        except (OSError, ValueError, KeyError) as e:
+            # Bozuk kayıt silinir; çağıran dosyadan okumaya devam edip hatayı kullanıcıya gösterir
+            shutil.rmtree(entry, ignore_errors=True)
+            raise CacheError(f"Önbellek kaydı okunamadı ve silindi - {e}") from e
+        # LRU: son erişim zamanı manifest'in mtime'ı ile tutulur
+        os.utime(manifest_path)
+        return mesh
+
+    def put(self, file_path, mesh, key=None):
+        if not isinstance(mesh, (pv.UnstructuredGrid, pv.PolyData)):
+            return False
+        key = key or self.key(file_path)
+        entry = self._entry_dir(key)
+        if os.path.exists(entry):
+            return True
+        # Önce geçici dizine yazılır; yarım kalan kayıtlar hiçbir zaman geçerli görünmez
+        tmp_dir = os.path.join(self.directory, f"{TMP_PREFIX}{key}-{uuid.uuid4().hex}")
+        try:
+            write_mesh_arrays(tmp_dir, mesh)
+            os.rename(tmp_dir, entry)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not os.path.exists(entry):
+                raise
+        self.evict(keep=key)
+        return True
+
+    def entries(self):
+        # (son erişim zamanı, boyut, dizin) listesi; en eski önce
+        if not os.path.isdir(self.directory):
+            return []
+        result = []
+        for entry in os.scandir(self.directory):
+            manifest_path = os.path.join(entry.path, MANIFEST_NAME)
+            if entry.is_dir() and ENTRY_NAME.fullmatch(entry.name) and _is_cache_manifest(manifest_path):
+                result.append((os.stat(manifest_path).st_mtime_ns, _directory_size(entry.path), entry.path))
+        return sorted(result)
+
+    def total_size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if keep is not None and os.path.basename(path) == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        # Yalnızca önbelleğin oluşturduğu kayıt ve geçici dizinler silinir
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.is_dir() and (ENTRY_NAME.fullmatch(entry.name) or entry.name.startswith(TMP_PREFIX)):
+                    shutil.rmtree(entry.path, ignore_errors=True)
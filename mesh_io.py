@@ -0,0 +1,80 @@
+# mesh_io.py
+import os
+
+import numpy as np
+import pyvista as pv
+
+from mesh_cache import CacheError
+from profiling import span
+from renumbering import renumber
+
+
+def _no_progress(message):
+    pass
+
+
+def read_mesh(file_path, progress_callback=_no_progress, cache=None, renumber_method=None):
+    # Arka planda çalışır: okuma, doğrulama, isteğe bağlı düğüm yeniden numaralandırma ve görüntülenecek
+    # yüzey verisinin hazırlanması. (mesh, görüntü yüzeyi, Renumbering veya None, önbellek hatası veya None) döner.
+    mesh, cache_error = load_mesh_file(file_path, progress_callback, cache)
+    if renumber_method:
+        return (*renumber_mesh(mesh, renumber_method, progress_callback), cache_error)
+    progress_callback("görüntüleme verisi hazırlanıyor")
+    with span("mesh.render_surface"):
+        render_mesh = build_render_mesh(mesh)
+    return mesh, render_mesh, None, cache_error
+
+
+def load_mesh_file(file_path, progress_callback=_no_progress, cache=None):
+    # Önbellekten veya dosyadan okunmuş ve doğrulanmış mesh (dosyadaki düğüm sırasıyla) ile önbellek hatası.
+    # Önbellek hataları yüklemeyi durdurmaz; mesaj çağırana döner.
+    mesh = None
+    cache_error = None
+    cache_key = None
+    if cache is not None and os.path.isfile(file_path):
+        progress_callback("önbellek kontrol ediliyor")
+        try:
+            with span("mesh.cache_lookup"):
+                # Anahtar bir kez hesaplanır; içerik özeti açıkken dosya yalnızca bir kez okunur
+                cache_key = cache.key(file_path)
+                mesh = cache.get(file_path, cache_key)
+        except CacheError as e:
+            cache_error = str(e)
+    from_cache = mesh is not None
+    if not from_cache:
+        progress_callback("okunuyor")
+        with span("mesh.read", path=os.path.basename(file_path)):
+            mesh = pv.read(file_path)
+
+    progress_callback("doğrulanıyor")
+    if not mesh or not mesh.points.size:
+        raise ValueError("Mesh dosyası geçerli noktalar içermiyor veya okunamadı.")
+    if not np.all(np.isfinite(mesh.bounds)):
+        raise ValueError("Mesh geçersiz (sonsuz veya NaN) koordinatlar içeriyor.")
+
+    if cache is not None and not from_cache:
+        progress_callback("önbelleğe yazılıyor")
+        try:
+            with span("mesh.cache_write"):
+                cache.put(file_path, mesh, cache_key)
+        except OSError as e:
+            cache_error = f"Mesh önbelleğe yazılamadı - {e}"
+    return mesh, cache_error
+
+
+def renumber_mesh(mesh, method, progress_callback=_no_progress):
+    # Önbellekte dosyadaki sıra saklanır; yeniden numaralandırma her açılışta önbellekten sonra uygulanır
+    progress_callback("düğümler yeniden numaralandırılıyor")
+    with span("mesh.renumber", method=method):
+        mesh, renumbering = renumber(mesh, method)
+    progress_callback("görüntüleme verisi hazırlanıyor")
+    with span("mesh.render_surface"):
+        render_mesh = build_render_mesh(mesh)
+    return mesh, render_mesh, renumbering
+
+
+def build_render_mesh(mesh):
+    # Hacimsel mesh'lerin yalnızca dış yüzeyi çizilir; vtkOriginalPointIds ile asıl düğümlere bağlanır
+    if isinstance(mesh, pv.PolyData):
+        return mesh
+    return mesh.extract_surface(pass_pointid=True, pass_cellid=True)
@@ -0,0 +1,158 @@
+# overlays.py
+# Sınır koşulu / yük işaretleri için kalıcı, dizi tabanlı katmanlar. Glifler GPU'da
+# vtkGlyph3DMapper ile çoğaltılır; bir düğüm eklemek/çıkarmak tüm işaretleri yeniden üretmez.
+import numpy as np
+import pyvista as pv
+from vtkmodules.util.numpy_support import numpy_to_vtk
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkRenderingCore import vtkActor, vtkGlyph3DMapper
+
+_INITIAL_CAPACITY = 64
+
+
+class GlyphOverlay:
+    # Düğüm başına bir glif. Düğüm -> yuva eşlemesi dizi ile tutulur; silmede son yuva boşluğa taşınır.
+    def __init__(self, plotter, n_nodes, glyph_source, name, color, oriented=False):
+        self.plotter = plotter
+        self.name = name
+        self.oriented = oriented
+        self.n = 0
+        self.slot_of_node = np.full(n_nodes, -1, dtype=np.int64)
+        self.node_of_slot = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self.positions = np.empty((_INITIAL_CAPACITY, 3))
+        self.vectors = np.empty((_INITIAL_CAPACITY, 3))
+        self.magnitudes = np.empty(_INITIAL_CAPACITY)
+        self.max_magnitude = 0.0
+        self.scale_length = 1.0
+
+        self.polydata = vtkPolyData()
+        self.polydata.SetPoints(vtkPoints())
+        self.mapper = vtkGlyph3DMapper()
+        self.mapper.SetInputData(self.polydata)
+        self.mapper.SetSourceData(glyph_source)
+        self.mapper.ScalarVisibilityOff()
+        if oriented:
+            self.mapper.SetOrientationArray("vectors")
+            self.mapper.SetOrientationModeToDirection()
+            self.mapper.SetScaleArray("vectors")
+            self.mapper.SetScaleModeToScaleByMagnitude()
+        else:
+            self.mapper.SetScaleModeToNoDataScaling()
+        self.actor = vtkActor()
+        self.actor.SetMapper(self.mapper)
+        self.actor.GetProperty().SetColor(pv.Color(color).float_rgb)
+        self._sync()
+        plotter.add_actor(self.actor, name=name, pickable=False, render=False)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, attr).nbytes
+                   for attr in ("slot_of_node", "node_of_slot", "positions", "vectors", "magnitudes"))
+
+    def _reserve(self, size):
+        capacity = self.positions.shape[0]
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for attr in ("node_of_slot", "positions", "vectors", "magnitudes"):
+            old = getattr(self, attr)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, attr, new)
+
+    def _sync(self):
+        # Tampon dizilerin ilk n elemanı kopyalanmadan VTK'ya bağlanır
+        self.polydata.GetPoints().SetData(numpy_to_vtk(self.positions[:self.n], deep=False))
+        if self.oriented:
+            vectors = numpy_to_vtk(self.vectors[:self.n], deep=False)
+            vectors.SetName("vectors")
+            self.polydata.GetPointData().AddArray(vectors)
+            self.mapper.SetScaleFactor(self.scale_length / self.max_magnitude if self.max_magnitude > 0 else 1.0)
+        self.polydata.Modified()
+        self.actor.SetVisibility(self.n > 0)
+
+    def _recompute_max_magnitude(self):
+        self.max_magnitude = float(self.magnitudes[:self.n].max()) if self.n else 0.0
+
+    def set(self, nodes, positions, vectors=None):
+        nodes = np.atleast_1d(np.asarray(nodes, dtype=np.int64))
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        nodes, first = np.unique(nodes, return_index=True)
+        if not nodes.size:
+            return
+        positions = positions[first]
+        slots = self.slot_of_node[nodes]
+        new = slots < 0
+        n_new = int(new.sum())
+        if n_new:
+            self._reserve(self.n + n_new)
+            slots[new] = np.arange(self.n, self.n + n_new)
+            self.slot_of_node[nodes[new]] = slots[new]
+            self.node_of_slot[slots[new]] = nodes[new]
+            self.n += n_new
+        self.positions[slots] = positions
+        if self.oriented:
+            vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)[first]
+            magnitudes = np.linalg.norm(vectors, axis=1)
+            lowered_max = np.any(self.magnitudes[slots[~new]] >= self.max_magnitude) and magnitudes.max() < self.max_magnitude
+            self.vectors[slots] = vectors
+            self.magnitudes[slots] = magnitudes
+            if lowered_max:
+                self._recompute_max_magnitude()
+            else:
+                self.max_magnitude = max(self.max_magnitude, float(magnitudes.max()))
+        self._sync()
+
+    def remove(self, nodes):
+        nodes = np.unique(np.atleast_1d(np.asarray(nodes, dtype=np.int64)))
+        nodes = nodes[self.slot_of_node[nodes] >= 0]
+        if not nodes.size:
+            return
+        removed_max = self.oriented and np.any(self.magnitudes[self.slot_of_node[nodes]] >= self.max_magnitude)
+        # Silinen yuvalara sondaki (silinmeyen) yuvalar taşınır
+        keep_n = self.n - nodes.size
+        holes = np.sort(self.slot_of_node[nodes])
+        holes = holes[holes < keep_n]
+        tail = np.arange(keep_n, self.n)
+        movers = tail[np.isin(self.node_of_slot[tail], nodes, invert=True)]
+        for attr in ("node_of_slot", "positions", "vectors", "magnitudes"):
+            buffer = getattr(self, attr)
+            buffer[holes] = buffer[movers]
+        self.slot_of_node[nodes] = -1
+        self.slot_of_node[self.node_of_slot[holes]] = holes
+        self.n = keep_n
+        if removed_max:
+            self._recompute_max_magnitude()
+        self._sync()
+
+    def clear(self):
+        self.slot_of_node[self.node_of_slot[:self.n]] = -1
+        self.n = 0
+        self.max_magnitude = 0.0
+        self._sync()
+
+    def remove_from_scene(self):
+        self.plotter.remove_actor(self.actor, render=False)
+
+
+def fixed_nodes_overlay(plotter, n_nodes, diag_length):
+    marker_radius = diag_length * 0.01 if diag_length * 0.01 >= 1e-6 else 0.015
+    return GlyphOverlay(plotter, n_nodes, pv.Sphere(radius=marker_radius), "fixed_nodes_markers", "red")
+
+
+def forces_overlay(plotter, n_nodes, diag_length):
+    # En büyük kuvvet okunun boyu köşegenin %5'i; ok oranları eski CPU glif sürümüyle aynı
+    arrow = pv.Arrow(tip_length=0.2, tip_radius=0.1, shaft_radius=0.05)
+    overlay = GlyphOverlay(plotter, n_nodes, arrow, "force_arrows", "blue", oriented=True)
+    overlay.scale_length = diag_length * 0.05 if diag_length > 0 else 0.1
+    return overlay
+
+
+def selection_overlay(plotter, n_nodes, diag_length):
+    marker_radius = diag_length * 0.004 if diag_length * 0.004 >= 1e-6 else 0.006
+    return GlyphOverlay(plotter, n_nodes, pv.Sphere(radius=marker_radius, theta_resolution=8, phi_resolution=8),
+                        "selection_markers", "yellow")
@@ -0,0 +1,178 @@
+# postprocessing.py
+# Çözüm sonuçlarından türetilen görüntüleme alanları. Tüm hesaplar elemanlar üzerinde toplu NumPy
+# işlemleridir; düğüm ortalaması seyrek düğüm-eleman geliş matrisi ile tek çarpımda yapılır.
+import numpy as np
+import pyvista as pv
+import scipy.sparse as sp
+
+from profiling import span
+from solver import elasticity_matrix
+
+# alan anahtarı -> (menü etiketi, yalnızca düğümde tanımlı mı)
+RESULT_FIELDS = {
+    "displacement_magnitude": ("Yer Değiştirme Büyüklüğü", True),
+    "von_mises": ("von Mises Gerilmesi", False),
+    "principal_1": ("Asal Gerilme σ1 (En Büyük)", False),
+    "principal_2": ("Asal Gerilme σ2", False),
+    "principal_3": ("Asal Gerilme σ3 (En Küçük)", False),
+    "strain_energy_density": ("Şekil Değiştirme Enerjisi Yoğunluğu", False),
+}
+COLORMAPS = ("viridis", "jet", "turbo", "coolwarm", "plasma", "gray")
+# Gösterilen yüzeye yazılan tek skaler dizinin adı
+RESULT_ARRAY = "result_field"
+
+
+def displacement_magnitude(displacements):
+    return np.linalg.norm(displacements, axis=1)
+
+
+def von_mises(stresses):
+    # stresses: (n, 6) Voigt: xx, yy, zz, xy, yz, zx
+    sxx, syy, szz, sxy, syz, szx = np.asarray(stresses).T
+    return np.sqrt(0.5 * ((sxx - syy) ** 2 + (syy - szz) ** 2 + (szz - sxx) ** 2)
+                   + 3.0 * (sxy ** 2 + syz ** 2 + szx ** 2))
+
+
+def stress_tensors(stresses):
+    # (n, 6) Voigt -> (n, 3, 3) simetrik tensörler
+    s = np.asarray(stresses)
+    tensors = np.empty((s.shape[0], 3, 3))
+    for (i, j), k in (((0, 0), 0), ((1, 1), 1), ((2, 2), 2), ((0, 1), 3), ((1, 2), 4), ((0, 2), 5)):
+        tensors[:, i, j] = s[:, k]
+        tensors[:, j, i] = s[:, k]
+    return tensors
+
+
+def principal_stresses(stresses):
+    # (n, 3) büyükten küçüğe asal gerilmeler; tanımsız (NaN) satırlar NaN kalır
+    stresses = np.asarray(stresses)
+    principals = np.full((stresses.shape[0], 3), np.nan)
+    valid = np.all(np.isfinite(stresses), axis=1)
+    principals[valid] = np.linalg.eigvalsh(stress_tensors(stresses[valid]))[:, ::-1]
+    return principals
+
+
+def strain_energy_density(stresses, E, nu):
+    # 1/2 σ:ε, ε = D⁻¹σ (mühendislik kayma şekil değiştirmeleri Voigt sırasıyla uyumlu)
+    compliance = np.linalg.inv(elasticity_matrix(E, nu))
+    stresses = np.asarray(stresses)
+    return 0.5 * np.einsum("ek,ek->e", stresses, stresses @ compliance.T)
+
+
+def node_cell_incidence(mesh):
+    # (n_points, n_cells) seyrek matris; her hücrenin düğümlerinde 1
+    offsets = np.asarray(mesh.offset)
+    connectivity = np.asarray(mesh.cell_connectivity)
+    cells = np.repeat(np.arange(mesh.n_cells), np.diff(offsets))
+    return sp.csr_matrix((np.ones(connectivity.size), (connectivity, cells)), shape=(mesh.n_points, mesh.n_cells))
+
+
+def nodal_average(incidence, cell_values):
+    # Her düğüme bağlı (tanımlı) hücre değerlerinin ortalaması; hiçbir hücreye bağlı olmayan düğümler NaN
+    values = np.asarray(cell_values, dtype=float)
+    valid = np.isfinite(values) if values.ndim == 1 else np.all(np.isfinite(values), axis=1)
+    masked = np.where(valid.reshape((-1,) + (1,) * (values.ndim - 1)), values, 0.0)
+    counts = incidence @ valid.astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        averaged = (incidence @ masked) / (counts if values.ndim == 1 else counts[:, None])
+    return averaged
+
+
+class ResultFields:
+    # Türetilmiş alanlar ilk istendiğinde hesaplanıp saklanır. Mesh, sonuç veya malzeme değişince
+    # (set_inputs) önbellek boşaltılır; geliş matrisi yalnızca mesh değişince yeniden kurulur.
+    def __init__(self):
+        self.mesh = None
+        self.result = None
+        self.material = None
+        self._fields = {}
+        self._incidence = None
+
+    def set_inputs(self, mesh, result, E, nu):
+        if mesh is not self.mesh:
+            self._incidence = None
+        if mesh is not self.mesh or result is not self.result or (E, nu) != self.material:
+            self._fields = {}
+        self.mesh, self.result, self.material = mesh, result, (E, nu)
+
+    def clear(self):
+        self.mesh = self.result = self.material = None
+        self._fields = {}
+        self._incidence = None
+
+    @property
+    def nbytes(self):
+        total = sum(values.nbytes for values in self._fields.values())
+        if self._incidence is not None:
+            total += self._incidence.data.nbytes + self._incidence.indices.nbytes + self._incidence.indptr.nbytes
+        return total
+
+    def incidence(self):
+        if self._incidence is None:
+            with span("post.incidence", n_cells=self.mesh.n_cells):
+                self._incidence = node_cell_incidence(self.mesh)
+        return self._incidence
+
+    def get(self, name, location="point"):
+        # location: "point" (düğüm ortalaması) veya "cell"; yer değiştirme büyüklüğü her zaman düğümdedir
+        if RESULT_FIELDS[name][1]:
+            location = "point"
+        key = (name, location)
+        if key not in self._fields:
+            with span("post.field", field=name, location=location):
+                self._fields[key] = self._compute(name, location)
+        return self._fields[key]
+
+    def _stress(self, location):
+        if location == "cell":
+            return self.result.stresses
+        if ("stress", "point") not in self._fields:
+            self._fields[("stress", "point")] = nodal_average(self.incidence(), self.result.stresses)
+        return self._fields[("stress", "point")]
+
+    def _principal(self, location):
+        if ("principal", location) not in self._fields:
+            self._fields[("principal", location)] = principal_stresses(self._stress(location))
+        return self._fields[("principal", location)]
+
+    def _compute(self, name, location):
+        # Düğümde gerilme değişmezleri ortalanmış tensörden hesaplanır; enerji yoğunluğu hücre değerlerinin ortalamasıdır
+        if name == "displacement_magnitude":
+            return displacement_magnitude(self.result.displacements)
+        if name == "von_mises":
+            return von_mises(self._stress(location))
+        if name.startswith("principal_"):
+            return self._principal(location)[:, int(name[-1]) - 1]
+        if name == "strain_energy_density":
+            density = strain_energy_density(self.result.stresses, *self.material)
+            return density if location == "cell" else nodal_average(self.incidence(), density)
+        raise ValueError(f"Bilinmeyen sonuç alanı: {name}")
+
+
+def value_range(values):
+    finite = values[np.isfinite(values)]
+    clim = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 1.0)
+    return clim if clim[0] != clim[1] else (clim[0], clim[0] + 1.0)
+
+
+def surface_source_ids(surface, location):
+    # extract_surface ile üretilmiş yüzeyde her düğümün/hücrenin asıl mesh'teki indeksi; yoksa None (aynı mesh)
+    data, name = ((surface.point_data, "vtkOriginalPointIds") if location == "point"
+                  else (surface.cell_data, "vtkOriginalCellIds"))
+    return np.asarray(data[name]) if name in data else None
+
+
+def show_result_scalars(mapper, values, location, colormap, clim, source_ids=None):
+    # values[source_ids] eşleyicinin veri kümesine RESULT_ARRAY olarak yazılır. Eşleyici "*_field" kipinde
+    # bu diziyi adıyla seçer; dosyadan gelen etkin skalerler renklendirmeyi etkilemez.
+    dataset = mapper.dataset
+    data, other = (dataset.point_data, dataset.cell_data) if location == "point" else (dataset.cell_data, dataset.point_data)
+    data[RESULT_ARRAY] = values if source_ids is None else values[source_ids]
+    if RESULT_ARRAY in other:
+        other.remove(RESULT_ARRAY)
+    mapper.lookup_table = pv.LookupTable(colormap)
+    mapper.scalar_map_mode = f"{location}_field"
+    # SelectColorArray diziyi adıyla seçme kipini de açar (yalnızca array_name, kimlikle seçimde kalır)
+    mapper.SelectColorArray(RESULT_ARRAY)
+    mapper.scalar_range = clim
+    mapper.scalar_visibility = True
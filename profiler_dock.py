@@ -0,0 +1,98 @@
+# profiler_dock.py
+# Son kare sürelerini, aşama sürelerini ve bellek kullanımını gösteren yerleştirilebilir panel.
+# Panel görünürken kayıt açıktır; kapanınca (FEA_PROFILE ile açılmadıysa) kayıt durur.
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtWidgets import (
+    QDockWidget, QFileDialog, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QVBoxLayout, QWidget
+)
+
+from profiling import format_bytes, profiler
+
+REFRESH_INTERVAL_MS = 500
+
+
+def _no_memory_report():
+    return []
+
+
+class ProfilerDock(QDockWidget):
+    def __init__(self, parent=None, memory_report=_no_memory_report):
+        super().__init__("Profil", parent)
+        self.setObjectName("profiler_dock")
+        self.memory_report = memory_report
+        self._always_enabled = profiler.enabled
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        self.frame_label = QLabel()
+        layout.addWidget(self.frame_label)
+        self.stage_table = QTableWidget(0, 5)
+        self.stage_table.setHorizontalHeaderLabels(["Aşama", "Sayı", "Son (ms)", "Ortalama (ms)", "En Büyük (ms)"])
+        self.stage_table.verticalHeader().setVisible(False)
+        self.stage_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.stage_table, 1)
+        self.memory_label = QLabel()
+        self.memory_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.memory_label)
+        buttons = QHBoxLayout()
+        clear_button = QPushButton("Temizle")
+        clear_button.clicked.connect(self.clear)
+        buttons.addWidget(clear_button)
+        export_button = QPushButton("Trace Dışa Aktar...")
+        export_button.clicked.connect(self.export_trace)
+        buttons.addWidget(export_button)
+        layout.addLayout(buttons)
+        self.setWidget(widget)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(self.on_visibility_changed)
+
+    @Slot(bool)
+    def on_visibility_changed(self, visible):
+        profiler.enabled = visible or self._always_enabled
+        if visible:
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    @Slot()
+    def refresh(self):
+        frames = profiler.frame_summary()
+        if frames is None:
+            self.frame_label.setText("Kare süresi: henüz ölçüm yok")
+        else:
+            last, mean, p95, fps = frames
+            self.frame_label.setText(
+                f"Kare süresi: son {last * 1e3:.1f} ms, ortalama {mean * 1e3:.1f} ms, %95 {p95 * 1e3:.1f} ms (~{fps:.0f} FPS)"
+            )
+
+        summary = sorted(profiler.stage_summary().items())
+        self.stage_table.setRowCount(len(summary))
+        for row, (name, (count, last, mean, longest)) in enumerate(summary):
+            values = (name, str(count), f"{last * 1e3:.2f}", f"{mean * 1e3:.2f}", f"{longest * 1e3:.2f}")
+            for column, value in enumerate(values):
+                self.stage_table.setItem(row, column, QTableWidgetItem(value))
+        self.stage_table.resizeColumnsToContents()
+
+        entries = self.memory_report()
+        total = sum(size for _, size in entries)
+        lines = [f"{label}: {format_bytes(size)}" for label, size in entries]
+        lines.append(f"Toplam: {format_bytes(total)}")
+        self.memory_label.setText("\n".join(lines))
+
+    @Slot()
+    def clear(self):
+        profiler.clear()
+        self.refresh()
+
+    @Slot()
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Trace Dışa Aktar", "fea_trace.json", "Chrome Trace (*.json)")
+        if not path:
+            return
+        n_events = profiler.export_chrome_trace(path)
+        self.parent().statusBar().showMessage(f"{n_events} olay {path} dosyasına yazıldı.")
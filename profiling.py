@@ -0,0 +1,141 @@
+# profiling.py
+# Hafif zamanlama altyapısı: kapalıyken span() paylaşılan boş bir bağlam döner, açıkken olaylar
+# sabit boyutlu bir halka tampona yazılır. Kare süreleri render penceresi olaylarıyla ölçülür.
+# Oturum Chrome-trace (chrome://tracing, Perfetto) JSON'u olarak dışa aktarılabilir.
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+EVENT_CAPACITY = 20000
+FRAME_CAPACITY = 600
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "args", "start")
+
+    def __init__(self, profiler, name, args):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start, self.args)
+        return False
+
+
+class Profiler:
+    def __init__(self, capacity=EVENT_CAPACITY, frame_capacity=FRAME_CAPACITY):
+        self.enabled = False
+        # (ad, başlangıç, süre, thread kimliği, argümanlar); deque.append thread'ler arasında güvenlidir
+        self.events = deque(maxlen=capacity)
+        self.frame_times = deque(maxlen=frame_capacity)
+        self.origin = time.perf_counter()
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def record(self, name, start, duration, args=None):
+        self.events.append((name, start, duration, threading.get_ident(), args))
+
+    def record_frame(self, start, duration):
+        self.frame_times.append(duration)
+        self.record("render", start, duration)
+
+    def clear(self):
+        self.events.clear()
+        self.frame_times.clear()
+
+    def stage_summary(self):
+        # {ad: (sayı, son, ortalama, en büyük)} saniye cinsinden; tampondaki son olaylar üzerinden
+        durations = {}
+        for name, _, duration, _, _ in list(self.events):
+            durations.setdefault(name, []).append(duration)
+        return {name: (len(values), values[-1], sum(values) / len(values), max(values))
+                for name, values in durations.items()}
+
+    def frame_summary(self):
+        # (son, ortalama, %95'lik, FPS) veya kare yoksa None
+        if not self.frame_times:
+            return None
+        frames = np.fromiter(self.frame_times, dtype=float)
+        mean = float(frames.mean())
+        return float(frames[-1]), mean, float(np.percentile(frames, 95)), 1.0 / mean if mean > 0 else 0.0
+
+    def export_chrome_trace(self, path):
+        pid = os.getpid()
+        trace = [
+            {"name": name, "ph": "X", "ts": (start - self.origin) * 1e6, "dur": duration * 1e6,
+             "pid": pid, "tid": tid, "args": args or {}}
+            for name, start, duration, tid, args in list(self.events)
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        return len(trace)
+
+
+profiler = Profiler()
+profiler.enabled = os.environ.get("FEA_PROFILE", "") not in ("", "0")
+
+
+def span(name, **args):
+    return profiler.span(name, **args)
+
+
+class FrameTimer:
+    # Render penceresinin StartEvent/EndEvent olayları arasında geçen süreyi kare süresi olarak kaydeder
+    def __init__(self, render_window, profiler=profiler):
+        self.profiler = profiler
+        self.render_window = render_window
+        self._start = None
+        self._tags = [
+            render_window.AddObserver("StartEvent", self._on_start),
+            render_window.AddObserver("EndEvent", self._on_end),
+        ]
+
+    def _on_start(self, obj, event):
+        self._start = time.perf_counter() if self.profiler.enabled else None
+
+    def _on_end(self, obj, event):
+        if self._start is not None:
+            self.profiler.record_frame(self._start, time.perf_counter() - self._start)
+            self._start = None
+
+    def detach(self):
+        for tag in self._tags:
+            self.render_window.RemoveObserver(tag)
+        self._tags = []
+
+
+def dataset_memory(dataset):
+    # VTK'nın bildirdiği gerçek bellek kullanımı, bayt
+    return dataset.actual_memory_size * 1024 if dataset is not None else 0
+
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
@@ -0,0 +1,200 @@
+# project.py
+# Proje/oturum kaydı: ".feaproj" uzantılı bir dizin. Küçük bir manifest.json (mesh kaynağı, malzeme, yük durumu
+# adları, sonuç listesi) ve her büyük dizi için ayrı bir .npy dosyası. Açılışta sınır koşulları belleğe okunur,
+# sonuç dizileri ise bellek eşlemeli açılır; diskten ancak gösterildiklerinde sayfalanır.
+# Her kayıt dizilerini yeni bir "data-*" alt dizinine yazar ve en son manifest'i atomik olarak değiştirir. Açık
+# oturumun bellek eşlediği eski dosyalara dokunulmaz (Windows'ta eşlenmiş dosyalar taşınamaz/silinemez).
+import json
+import os
+import shutil
+import uuid
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from bc_store import BoundaryConditionStore
+from mesh_cache import MANIFEST_NAME, file_fingerprint, read_mesh_arrays, write_mesh_arrays
+from mesh_io import build_render_mesh, load_mesh_file
+from profiling import span
+from renumbering import ORIGINAL_IDS, permute_mesh
+from solver import LinearElasticResult
+
+PROJECT_EXTENSION = ".feaproj"
+PROJECT_VERSION = 1
+MESH_DIR = "mesh"
+DATA_DIR_PREFIX = "data-"
+# Sonuç gösterimi için mesh'e yazılan diziler; sonuçlar projede ayrıca saklanır
+TRANSIENT_MESH_ARRAYS = ("displacement", "stress")
+
+
+@dataclass
+class ProjectState:
+    mesh_path: str
+    mesh: object
+    material: dict
+    bcs: BoundaryConditionStore
+    results: dict = field(default_factory=dict)
+    result_case: str = None
+    result_material: tuple = None
+    render_mesh: object = None   # yalnızca açılışta doldurulur
+    source_changed: bool = False  # mesh dosyası proje kaydedildikten sonra değişmiş
+    cache_error: str = None       # mesh önbelleği okunamadı/yazılamadı (yükleme yine de tamamlandı)
+
+
+def _no_progress(message):
+    pass
+
+
+def is_project(path):
+    return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+
+
+def _save_array(path, data_dir, name, values):
+    # Manifest'e proje dizinine göreli yol yazılır
+    relative = f"{data_dir}/{name}.npy"
+    np.save(os.path.join(path, relative), np.ascontiguousarray(values))
+    return relative
+
+
+def _optional_float(value):
+    return None if value is None else float(value)
+
+
+def _write_arrays(path, data_dir, state, embed_mesh, progress_callback):
+    # Diziler path/data_dir altına tek tek yazılır; manifest sözlüğü döner (diske save_project yazar)
+    mesh = state.mesh
+    mesh_info = {"source": os.path.abspath(state.mesh_path) if state.mesh_path else None,
+                 "n_points": mesh.n_points, "n_cells": mesh.n_cells, "embedded": embed_mesh}
+    if embed_mesh:
+        progress_callback("mesh kopyası yazılıyor")
+        mesh_copy = mesh.copy(deep=False)
+        for name in TRANSIENT_MESH_ARRAYS:
+            mesh_copy.point_data.pop(name, None)
+            mesh_copy.cell_data.pop(name, None)
+        with span("project.write_mesh", n_points=mesh.n_points):
+            write_mesh_arrays(os.path.join(path, data_dir, MESH_DIR), mesh_copy)
+        mesh_info["directory"] = f"{data_dir}/{MESH_DIR}"
+    else:
+        if not mesh_info["source"] or not os.path.isfile(mesh_info["source"]):
+            raise ValueError("Mesh dosyası bulunamadı; projeye mesh kopyası eklenmelidir.")
+        mesh_info["fingerprint"] = file_fingerprint(mesh_info["source"])
+        if ORIGINAL_IDS in mesh.point_data:
+            # Yeniden numaralandırılmış mesh açılışta yöntem yeniden çalıştırılmadan bu sırayla kurulur
+            mesh_info["node_order"] = _save_array(path, data_dir, "node_order", mesh.point_data[ORIGINAL_IDS])
+
+    progress_callback("sınır koşulları yazılıyor")
+    bcs = state.bcs
+    load_cases = [{"name": name, "file": _save_array(path, data_dir, f"loads_{i}", loads)}
+                  for i, (name, loads) in enumerate(bcs.load_cases.items())]
+    fixity_file = _save_array(path, data_dir, "fixity", bcs.fixity)
+
+    results = []
+    for i, (case, result) in enumerate(state.results.items()):
+        progress_callback(f"sonuçlar yazılıyor ({i + 1}/{len(state.results)})")
+        with span("project.write_result", case=case):
+            results.append({
+                "name": case,
+                "displacements": _save_array(path, data_dir, f"result_{i}_displacements", result.displacements),
+                "stresses": _save_array(path, data_dir, f"result_{i}_stresses", result.stresses),
+                "residual_history": [[int(it), float(res)] for it, res in result.residual_history],
+            })
+
+    return {
+        "version": PROJECT_VERSION,
+        "mesh": mesh_info,
+        "material": {key: _optional_float(value) for key, value in state.material.items()},
+        "fixity": fixity_file,
+        "load_cases": load_cases,
+        "active_case": bcs.active_case,
+        "results": results,
+        "result_case": state.result_case,
+        "result_material": list(state.result_material) if state.result_material else None,
+    }
+
+
+def save_project(path, state, embed_mesh=False, progress_callback=_no_progress):
+    # Arka planda çalışır. Yarım kalan bir kayıt yalnızca başvurulmayan bir data-* dizini bırakır;
+    # geçerli manifest her zaman eksiksiz bir kayda işaret eder.
+    path = os.path.abspath(path)
+    if os.path.exists(path) and not is_project(path):
+        raise ValueError(f"{path} bir proje dizini değil; üzerine yazılmadı.")
+    data_dir = DATA_DIR_PREFIX + uuid.uuid4().hex
+    os.makedirs(os.path.join(path, data_dir))
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    tmp_manifest = os.path.join(path, f".{MANIFEST_NAME}.{data_dir}")
+    try:
+        with span("project.save", embed_mesh=embed_mesh):
+            manifest = _write_arrays(path, data_dir, state, embed_mesh, progress_callback)
+            progress_callback("manifest yazılıyor")
+            with open(tmp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_manifest, manifest_path)
+    except Exception:
+        shutil.rmtree(os.path.join(path, data_dir), ignore_errors=True)
+        if os.path.exists(tmp_manifest):
+            os.remove(tmp_manifest)
+        raise
+    remove_stale_data(path, keep=data_dir)
+    return path
+
+
+def remove_stale_data(path, keep):
+    # Önceki kayıtların dizinleri; hâlâ bellek eşlemeli açık olanlar (Windows) silinemez ve sonraki kayda kalır
+    for entry in os.scandir(path):
+        if entry.is_dir() and entry.name.startswith(DATA_DIR_PREFIX) and entry.name != keep:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def open_project(path, progress_callback=_no_progress, cache=None):
+    # Arka planda çalışır; ProjectState döner
+    with open(os.path.join(path, MANIFEST_NAME), encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != PROJECT_VERSION:
+        raise ValueError("Proje dosyası desteklenmeyen bir sürümde.")
+
+    def load(name, mmap_mode=None):
+        return np.load(os.path.join(path, name), mmap_mode=mmap_mode)
+
+    mesh_info = manifest["mesh"]
+    source_changed = False
+    cache_error = None
+    if mesh_info["embedded"]:
+        progress_callback("mesh kopyası okunuyor")
+        with span("project.read_mesh"):
+            mesh = read_mesh_arrays(os.path.join(path, mesh_info.get("directory", MESH_DIR)))
+    else:
+        source = mesh_info["source"]
+        if not source or not os.path.isfile(source):
+            raise ValueError(f"Projenin mesh dosyası bulunamadı: {source}")
+        source_changed = file_fingerprint(source) != mesh_info["fingerprint"]
+        mesh, cache_error = load_mesh_file(source, progress_callback, cache)
+        if "node_order" in mesh_info:
+            progress_callback("düğüm sırası uygulanıyor")
+            with span("project.node_order"):
+                mesh = permute_mesh(mesh, load(mesh_info["node_order"]).astype(np.int64))
+    if mesh.n_points != mesh_info["n_points"] or mesh.n_cells != mesh_info["n_cells"]:
+        raise ValueError("Mesh, proje kaydedildikten sonra değişmiş (düğüm/hücre sayısı farklı).")
+
+    # Sınır koşulları küçük ve değiştirilebilir olmalı; belleğe okunur
+    progress_callback("sınır koşulları okunuyor")
+    bcs = BoundaryConditionStore(mesh.n_points)
+    bcs.fixity = load(manifest["fixity"])
+    bcs.load_cases = {case["name"]: load(case["file"]) for case in manifest["load_cases"]}
+    bcs.active_case = manifest["active_case"]
+
+    # Sonuçlar salt okunur bellek eşlemesi; türetilmiş alanlar ilk gösterimde hesaplanır
+    results = {
+        entry["name"]: LinearElasticResult(load(entry["displacements"], "r"), load(entry["stresses"], "r"),
+                                           [tuple(h) for h in entry["residual_history"]])
+        for entry in manifest["results"]
+    }
+
+    progress_callback("görüntüleme verisi hazırlanıyor")
+    with span("mesh.render_surface"):
+        render_mesh = build_render_mesh(mesh)
+    result_material = manifest.get("result_material")
+    return ProjectState(
+        mesh_path=mesh_info["source"], mesh=mesh, material=manifest["material"], bcs=bcs, results=results,
+        result_case=manifest.get("result_case"), result_material=tuple(result_material) if result_material else None,
+        render_mesh=render_mesh, source_changed=source_changed, cache_error=cache_error,
+    )
@@ -0,0 +1,187 @@
+# renumbering.py
+# Düğüm yeniden numaralandırma: ters Cuthill-McKee (bant genişliği/profil azaltma) veya
+# Morton (Z-eğrisi) uzay doldurma sırası. perm[yeni] = eski, iperm[eski] = yeni.
+# Dosyadaki asıl düğüm numaraları point_data["original_node_ids"] içinde taşınır.
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pyvista as pv
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from vtkmodules.util.numpy_support import numpy_to_vtk
+
+ORIGINAL_IDS = "original_node_ids"
+RENUMBER_METHODS = ("rcm", "morton")
+POLY_CELL_KINDS = ("verts", "lines", "polys", "strips")
+# Komşuluk grafı bu kadar hücrelik parçalarla kurulur; düğüm çifti dizilerinin belleğini sınırlar
+GRAPH_CHUNK_CELLS = 200000
+MORTON_BITS = 21
+
+
+@dataclass
+class Renumbering:
+    method: str
+    perm: np.ndarray   # yeni düğüm -> eski düğüm
+    iperm: np.ndarray  # eski düğüm -> yeni düğüm
+    bandwidth_before: int
+    bandwidth_after: int
+    profile_before: int
+    profile_after: int
+    spmv_before: float  # komşuluk grafı üzerinde seyrek matris-vektör çarpımı süresi, saniye
+    spmv_after: float
+    seconds: float
+
+
+def _cell_blocks(mesh):
+    # (offsets, connectivity) çiftleri; PolyData'da her hücre türü ayrı bir bloktur
+    if isinstance(mesh, pv.UnstructuredGrid):
+        return [(np.asarray(mesh.offset), np.asarray(mesh.cell_connectivity))]
+    blocks = []
+    for cell_kind in POLY_CELL_KINDS:
+        cells = getattr(mesh, "Get" + cell_kind.capitalize())()
+        if cells.GetNumberOfCells():
+            blocks.append((pv.convert_array(cells.GetOffsetsArray()), pv.convert_array(cells.GetConnectivityArray())))
+    return blocks
+
+
+def node_graph(mesh):
+    # Aynı hücreyi paylaşan düğümler arasında simetrik komşuluk grafı (CSR, köşegensiz)
+    n = mesh.n_points
+    graph = sp.csr_matrix((n, n), dtype=np.int8)
+    for offsets, connectivity in _cell_blocks(mesh):
+        sizes = np.diff(offsets)
+        for size in np.unique(sizes):
+            if size < 2:
+                continue
+            starts = offsets[:-1][sizes == size]
+            a, b = np.triu_indices(size, k=1)
+            for chunk in range(0, starts.size, GRAPH_CHUNK_CELLS):
+                conn = connectivity[starts[chunk:chunk + GRAPH_CHUNK_CELLS, None] + np.arange(size)]
+                rows, cols = conn[:, a].ravel(), conn[:, b].ravel()
+                distinct = rows != cols
+                rows, cols = rows[distinct], cols[distinct]
+                part = sp.coo_matrix((np.ones(rows.size, dtype=np.int8), (rows, cols)), shape=(n, n)).tocsr()
+                graph = graph + part + part.T
+                # Tekrarlanan kenarların toplamı int8'i taşırmasın
+                graph.data[:] = 1
+    return graph
+
+
+def bandwidth_and_profile(graph, iperm=None):
+    # Bant genişliği: en büyük |i - j|; profil: her satırda köşegen ile en soldaki komşu arasındaki mesafelerin toplamı
+    rows = np.repeat(np.arange(graph.shape[0]), np.diff(graph.indptr))
+    cols = graph.indices
+    if iperm is not None:
+        rows, cols = iperm[rows], iperm[cols]
+    if rows.size == 0:
+        return 0, 0
+    leftmost = np.arange(graph.shape[0])
+    np.minimum.at(leftmost, rows, cols)
+    return int(np.abs(rows - cols).max()), int((np.arange(graph.shape[0]) - leftmost).sum())
+
+
+def rcm_permutation(graph):
+    return reverse_cuthill_mckee(graph.tocsr(), symmetric_mode=True).astype(np.int64)
+
+
+def _spread_bits(values):
+    # 21 bitlik tamsayıların bitlerini aralarında iki boş bit kalacak şekilde yayar
+    v = values.astype(np.uint64) & np.uint64(0x1FFFFF)
+    v = (v | v << np.uint64(32)) & np.uint64(0x1F00000000FFFF)
+    v = (v | v << np.uint64(16)) & np.uint64(0x1F0000FF0000FF)
+    v = (v | v << np.uint64(8)) & np.uint64(0x100F00F00F00F00F)
+    v = (v | v << np.uint64(4)) & np.uint64(0x10C30C30C30C30C3)
+    v = (v | v << np.uint64(2)) & np.uint64(0x1249249249249249)
+    return v
+
+
+def morton_permutation(points):
+    points = np.asarray(points, dtype=float)
+    lower = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lower, 1e-300)
+    scale = (1 << MORTON_BITS) - 1
+    q = ((points - lower) / extent * scale).astype(np.uint64)
+    codes = _spread_bits(q[:, 0]) | (_spread_bits(q[:, 1]) << np.uint64(1)) | (_spread_bits(q[:, 2]) << np.uint64(2))
+    return np.argsort(codes, kind="stable").astype(np.int64)
+
+
+def inverse_permutation(perm):
+    iperm = np.empty_like(perm)
+    iperm[perm] = np.arange(perm.size, dtype=perm.dtype)
+    return iperm
+
+
+def permute_mesh(mesh, perm, iperm=None):
+    # Hücre sırası ve cell_data korunur; yalnızca düğümler ve point_data yeniden sıralanır.
+    # Kaynak mesh önbellekten bellek eşlemeli okunmuş olabilir; yeni mesh ona ait hiçbir belleği paylaşmaz.
+    iperm = inverse_permutation(perm) if iperm is None else iperm
+    points = np.asarray(mesh.points)[perm]
+    if isinstance(mesh, pv.UnstructuredGrid):
+        new_mesh = pv.UnstructuredGrid()
+        new_mesh.points = points
+        (offsets, connectivity), = _cell_blocks(mesh)
+        cells = pv.CellArray.from_arrays(np.array(offsets), iperm[connectivity])
+        new_mesh.SetCells(numpy_to_vtk(np.asarray(mesh.celltypes), deep=True), cells)
+    elif isinstance(mesh, pv.PolyData):
+        new_mesh = pv.PolyData()
+        new_mesh.points = points
+        for cell_kind in POLY_CELL_KINDS:
+            cells = getattr(mesh, "Get" + cell_kind.capitalize())()
+            if cells.GetNumberOfCells():
+                offsets = pv.convert_array(cells.GetOffsetsArray())
+                connectivity = pv.convert_array(cells.GetConnectivityArray())
+                cells = pv.CellArray.from_arrays(np.array(offsets), iperm[connectivity])
+                getattr(new_mesh, "Set" + cell_kind.capitalize())(cells)
+    else:
+        raise TypeError(f"Yeniden numaralandırma bu mesh tipini desteklemiyor: {type(mesh).__name__}")
+
+    original_ids = np.asarray(mesh.point_data[ORIGINAL_IDS]) if ORIGINAL_IDS in mesh.point_data else np.arange(mesh.n_points)
+    for name, values in mesh.point_data.items():
+        if name != ORIGINAL_IDS:
+            new_mesh.point_data[name] = np.asarray(values)[perm]
+    new_mesh.point_data[ORIGINAL_IDS] = original_ids[perm]
+    for name, values in mesh.cell_data.items():
+        new_mesh.cell_data[name] = np.array(values)
+    for name, values in mesh.field_data.items():
+        new_mesh.field_data[name] = np.array(values)
+    return new_mesh
+
+
+def _spmv_time(graph, repeat=5):
+    x = np.ones(graph.shape[0])
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        graph @ x
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def renumber(mesh, method="rcm"):
+    # (yeniden numaralanmış mesh, Renumbering) döner
+    start = time.perf_counter()
+    graph = node_graph(mesh)
+    if method == "rcm":
+        perm = rcm_permutation(graph)
+    elif method == "morton":
+        perm = morton_permutation(mesh.points)
+    else:
+        raise ValueError(f"Bilinmeyen numaralandırma yöntemi: {method}")
+    iperm = inverse_permutation(perm)
+    new_mesh = permute_mesh(mesh, perm, iperm)
+    seconds = time.perf_counter() - start
+
+    bandwidth_before, profile_before = bandwidth_and_profile(graph)
+    bandwidth_after, profile_after = bandwidth_and_profile(graph, iperm)
+    spmv_before = _spmv_time(graph)
+    spmv_after = _spmv_time(graph[perm][:, perm])
+    info = Renumbering(method, perm, iperm, bandwidth_before, bandwidth_after, profile_before, profile_after,
+                       spmv_before, spmv_after, seconds)
+    return new_mesh, info
+
+
+def describe(info):
+    return (f"{info.method.upper()}: bant genişliği {info.bandwidth_before} -> {info.bandwidth_after}, "
+            f"profil {info.profile_before} -> {info.profile_after}, "
+            f"SpMV {info.spmv_before * 1e3:.2f} -> {info.spmv_after * 1e3:.2f} ms ({info.seconds:.2f} s)")
@@ -0,0 +1,105 @@
+# selection.py
+# Bölgesel toplu düğüm seçimi. Her seçici tüm düğüm koordinatları üzerinde tek bir
+# vektörel işlemle çözülür ve sıralı düğüm indeks dizisi döner. Küre seçimi, verilmişse
+# düğüm indeksinin (spatial_index.NodeIndex) yarıçap sorgusunu kullanır.
+import numpy as np
+import pyvista as pv
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def _as_points(points):
+    return np.asarray(points, dtype=float)
+
+
+def nodes_in_box(points, lower, upper):
+    points = _as_points(points)
+    lower, upper = np.minimum(lower, upper), np.maximum(lower, upper)
+    return np.flatnonzero(np.all((points >= lower) & (points <= upper), axis=1))
+
+
+def nodes_in_sphere(points, center, radius, index=None):
+    # index: aynı noktalar üzerinde kurulmuş NodeIndex; yalnızca kürenin çevresindeki ağaç düğümleri dolaşılır
+    if index is not None:
+        return index.within_radius(center, radius)
+    offsets = _as_points(points) - np.asarray(center, dtype=float)
+    return np.flatnonzero(np.einsum("ij,ij->i", offsets, offsets) <= radius * radius)
+
+
+def nodes_near_plane(points, origin, normal, tolerance):
+    normal = np.asarray(normal, dtype=float)
+    length = np.linalg.norm(normal)
+    if length == 0:
+        raise ValueError("Düzlem normali sıfır vektör olamaz.")
+    distances = (_as_points(points) - np.asarray(origin, dtype=float)) @ (normal / length)
+    return np.flatnonzero(np.abs(distances) <= tolerance)
+
+
+def project_to_display(points, renderer):
+    # Dünya koordinatlarını renderer'ın kamera matrisiyle toplu olarak ekran piksellerine çevirir
+    points = _as_points(points)
+    matrix = pv.array_from_vtkmatrix(
+        renderer.GetActiveCamera().GetCompositeProjectionTransformMatrix(renderer.GetTiledAspectRatio(), -1, 1)
+    )
+    clip = points @ matrix[:3, :3].T + matrix[:3, 3]
+    w = points @ matrix[3, :3] + matrix[3, 3]
+    in_front = w > 0
+    ndc = clip[:, :2] / np.where(in_front, w, 1.0)[:, None]
+    width, height = renderer.GetSize()
+    origin_x, origin_y = renderer.GetOrigin()
+    display = np.empty((points.shape[0], 2))
+    display[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * width + origin_x
+    display[:, 1] = (ndc[:, 1] + 1.0) * 0.5 * height + origin_y
+    return display, in_front
+
+
+def nodes_in_screen_rect(points, renderer, rect, candidates=None):
+    # rect: ekran pikseli olarak (x0, y0, x1, y1). Seçim görünür olup olmamaya bakmadan derinlik boyunca yapılır.
+    candidates = np.arange(len(points)) if candidates is None else np.asarray(candidates, dtype=np.int64)
+    display, in_front = project_to_display(_as_points(points)[candidates], renderer)
+    x0, x1 = sorted((rect[0], rect[2]))
+    y0, y1 = sorted((rect[1], rect[3]))
+    inside = in_front & (display[:, 0] >= x0) & (display[:, 0] <= x1) & (display[:, 1] >= y0) & (display[:, 1] <= y1)
+    return np.sort(candidates[inside])
+
+
+def surface_patch(surface, seed_node, feature_angle=30.0):
+    # surface: vtkOriginalPointIds taşıyan yüzey. Normal açısı feature_angle'dan küçük komşu yüzlerden
+    # oluşan, seed_node'u içeren bağlantılı yamanın orijinal düğüm indekslerini döner.
+    surface = surface.triangulate()
+    if "vtkOriginalPointIds" in surface.point_data:
+        original_ids = np.asarray(surface.point_data["vtkOriginalPointIds"], dtype=np.int64)
+    else:
+        original_ids = np.arange(surface.n_points)
+    faces = surface.regular_faces
+    if faces.size == 0:
+        return np.empty(0, dtype=np.int64)
+    normals = np.asarray(surface.cell_normals)
+
+    n_faces = faces.shape[0]
+    n_points = surface.n_points
+    edges = np.stack([faces, np.roll(faces, -1, axis=1)], axis=2).reshape(-1, 2)
+    edges.sort(axis=1)
+    edge_keys = edges[:, 0] * n_points + edges[:, 1]
+    edge_faces = np.repeat(np.arange(n_faces), 3)
+    order = np.argsort(edge_keys, kind="stable")
+    sorted_keys = edge_keys[order]
+    # Aynı kenarı paylaşan ardışık yüz çiftleri (manifold olmayan kenarlarda her ardışık çift)
+    shared = np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1])
+    face_a, face_b = edge_faces[order[shared]], edge_faces[order[shared + 1]]
+    smooth = np.einsum("ij,ij->i", normals[face_a], normals[face_b]) >= np.cos(np.radians(feature_angle))
+    graph = coo_matrix((np.ones(int(smooth.sum())), (face_a[smooth], face_b[smooth])), shape=(n_faces, n_faces))
+    _, labels = connected_components(graph, directed=False)
+
+    seed_points = np.flatnonzero(original_ids == seed_node)
+    seed_faces = np.flatnonzero(np.isin(faces, seed_points).any(axis=1))
+    if seed_faces.size == 0:
+        return np.empty(0, dtype=np.int64)
+    patch_faces = labels == labels[seed_faces[0]]
+    return np.unique(original_ids[faces[patch_faces]])
+
+
+def distribute_force(nodes, total_force):
+    # Toplam kuvvet seçili düğümlere eşit paylaştırılır; (len(nodes), 3) dizi döner
+    total_force = np.asarray(total_force, dtype=float)
+    return np.broadcast_to(total_force / max(len(nodes), 1), (len(nodes), 3))
@@ -0,0 +1,553 @@
+# solver.py
+# Başsız (Qt'siz) lineer elastik statik çözücü. Eleman matrisleri her hücre tipi için
+# NumPy ile toplu hesaplanır ve doğrudan scipy sparse COO -> CSR matrisine aktarılır.
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+import numpy as np
+import pyvista as pv
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, aslinearoperator, cg, spilu, splu
+
+from profiling import span
+
+VTK_TETRA = 10
+VTK_HEXAHEDRON = 12
+VTK_QUADRATIC_TETRA = 24
+
+# Aynı anda işlenecek eleman sayısı; ara dizilerin belleğini sınırlar
+ELEMENT_CHUNK_SIZE = 20000
+
+SOLVER_METHODS = ("auto", "direct", "iterative")
+PRECONDITIONERS = ("jacobi", "block_jacobi", "ilu")
+# splu (COLAMD) çarpanlarının dolgusu 3B elastisite mesh'lerinde nnz(L + U) ~ 10 * n^1.5 olarak ölçüldü
+DIRECT_FILL_COEFFICIENT = 10.0
+# ILU dolgu sınırına takılırsa ön koşullandırıcı bozulur ve CG durur; sınır yalnızca bellek koruması olarak geniş tutulur
+ILU_DROP_TOLERANCE = 1e-3
+ILU_FILL_FACTOR = 30
+# Her bu kadar CG yinelemesinde bir gerçek artık hesaplanıp raporlanır
+RESIDUAL_REPORT_INTERVAL = 10
+
+
+def _tet4_gradients(xi):
+    return np.array([[-1.0, -1.0, -1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+
+def _tet10_gradients(xi):
+    # VTK sırası: 0-3 köşeler, 4:(0,1) 5:(1,2) 6:(2,0) 7:(0,3) 8:(1,3) 9:(2,3)
+    L = np.array([1.0 - xi.sum(), xi[0], xi[1], xi[2]])
+    dL = _tet4_gradients(xi)
+    dN = np.empty((10, 3))
+    for a in range(4):
+        dN[a] = (4.0 * L[a] - 1.0) * dL[a]
+    for a, (i, j) in enumerate([(0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)], start=4):
+        dN[a] = 4.0 * (L[i] * dL[j] + L[j] * dL[i])
+    return dN
+
+
+_HEX8_CORNERS = np.array([
+    [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+    [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1],
+], dtype=float)
+
+
+def _hex8_gradients(xi):
+    c = _HEX8_CORNERS
+    terms = 1.0 + c * xi
+    dN = np.empty((8, 3))
+    dN[:, 0] = c[:, 0] * terms[:, 1] * terms[:, 2]
+    dN[:, 1] = c[:, 1] * terms[:, 0] * terms[:, 2]
+    dN[:, 2] = c[:, 2] * terms[:, 0] * terms[:, 1]
+    return dN / 8.0
+
+
+_TET4_POINT_A = 0.5854101966249685
+_TET4_POINT_B = 0.1381966011250105
+_GAUSS_2 = 1.0 / np.sqrt(3.0)
+
+# celltype -> (düğüm sayısı, türev fonksiyonu, integrasyon noktaları, ağırlıklar, ağırlık merkezi)
+ELEMENT_TYPES = {
+    VTK_TETRA: (
+        4, _tet4_gradients,
+        np.array([[0.25, 0.25, 0.25]]), np.array([1.0 / 6.0]),
+        np.array([0.25, 0.25, 0.25]),
+    ),
+    VTK_QUADRATIC_TETRA: (
+        10, _tet10_gradients,
+        np.array([
+            [_TET4_POINT_B, _TET4_POINT_B, _TET4_POINT_B],
+            [_TET4_POINT_A, _TET4_POINT_B, _TET4_POINT_B],
+            [_TET4_POINT_B, _TET4_POINT_A, _TET4_POINT_B],
+            [_TET4_POINT_B, _TET4_POINT_B, _TET4_POINT_A],
+        ]),
+        np.full(4, 1.0 / 24.0),
+        np.array([0.25, 0.25, 0.25]),
+    ),
+    VTK_HEXAHEDRON: (
+        8, _hex8_gradients,
+        _HEX8_CORNERS * _GAUSS_2, np.ones(8),
+        np.zeros(3),
+    ),
+}
+
+
+@dataclass
+class LinearElasticResult:
+    displacements: np.ndarray  # (n_points, 3)
+    stresses: np.ndarray       # (n_cells, 6) Voigt: xx, yy, zz, xy, yz, zx
+    residual_history: list = field(default_factory=list)  # yinelemeli çözümde [(yineleme, göreli artık), ...]
+
+
+@dataclass
+class SolverOptions:
+    method: str = "auto"                  # "auto" (tahmini LU belleğine göre), "direct" veya "iterative"
+    preconditioner: str = "block_jacobi"  # "jacobi", "block_jacobi" veya "ilu"
+    matrix_free: bool = False             # eleman bazlı operatör; global matris kurulmaz
+    tolerance: float = 1e-8               # göreli artık
+    max_iterations: int = None
+    memory_budget: int = None             # bayt; None ise fiziksel belleğin yarısı
+
+
+def _no_progress(message):
+    pass
+
+
+def elasticity_matrix(E, nu):
+    lam = E * nu / ((1.0 + nu) * (1.0 - 2.0 * nu))
+    mu = E / (2.0 * (1.0 + nu))
+    D = np.zeros((6, 6))
+    D[:3, :3] = lam
+    D[np.arange(3), np.arange(3)] += 2.0 * mu
+    D[np.arange(3, 6), np.arange(3, 6)] = mu
+    return D
+
+
+def check_material(material_properties):
+    E, nu = material_properties.get("E"), material_properties.get("nu")
+    if E is None or nu is None:
+        raise ValueError("Young modülü (E) ve Poisson oranı (ν) girilmelidir.")
+    if E <= 0 or not -1.0 < nu < 0.5:
+        raise ValueError(f"Geçersiz malzeme özellikleri: E={E}, ν={nu} (E > 0 ve -1 < ν < 0.5 olmalı).")
+    return float(E), float(nu)
+
+
+def element_groups(mesh):
+    # Desteklenen her hücre tipi için (hücre id'leri, bağlantı dizisi (n_elem, n_düğüm)) döner
+    if not isinstance(mesh, pv.UnstructuredGrid):
+        raise ValueError("Çözücü yalnızca hacimsel UnstructuredGrid mesh'lerle çalışır (tet4/tet10/hex8).")
+    celltypes = np.asarray(mesh.celltypes)
+    unsupported = np.setdiff1d(np.unique(celltypes), list(ELEMENT_TYPES))
+    if unsupported.size:
+        raise ValueError(f"Desteklenmeyen hücre tipleri: {unsupported.tolist()} (yalnızca tet4/tet10/hex8).")
+    connectivity = np.asarray(mesh.cell_connectivity)
+    offsets = np.asarray(mesh.offset)
+    groups = []
+    for celltype, (n_nodes, *_) in ELEMENT_TYPES.items():
+        cell_ids = np.flatnonzero(celltypes == celltype)
+        if cell_ids.size:
+            conn = connectivity[offsets[cell_ids][:, None] + np.arange(n_nodes)]
+            groups.append((celltype, cell_ids, conn))
+    if not groups:
+        raise ValueError("Mesh çözülebilecek hiçbir eleman içermiyor.")
+    return groups
+
+
+def _gradient_table(gradient_fn, natural_points):
+    return np.stack([gradient_fn(xi) for xi in natural_points])
+
+
+def shape_gradients(points, conn, dN):
+    # dN: (q, a, 3) doğal türevler -> (e, q, a, 3) global türevler ve (e, q) Jacobian determinantları
+    X = points[conn]
+    J = np.einsum("qai,eaj->eqij", dN, X)
+    detJ = np.linalg.det(J)
+    if np.any(np.abs(detJ) < 1e-300):
+        raise ValueError("Mesh dejenere (sıfır hacimli) elemanlar içeriyor.")
+    G = np.einsum("eqji,qai->eqaj", np.linalg.inv(J), dN)
+    return G, detJ
+
+
+def strain_displacement(G):
+    # (..., a, 3) -> (..., 6, 3a) B matrisi; mühendislik kayma şekil değiştirmeleri
+    shape = G.shape[:-2]
+    n_nodes = G.shape[-2]
+    B = np.zeros(shape + (6, n_nodes, 3))
+    gx, gy, gz = G[..., 0], G[..., 1], G[..., 2]
+    B[..., 0, :, 0] = gx
+    B[..., 1, :, 1] = gy
+    B[..., 2, :, 2] = gz
+    B[..., 3, :, 0] = gy
+    B[..., 3, :, 1] = gx
+    B[..., 4, :, 1] = gz
+    B[..., 4, :, 2] = gy
+    B[..., 5, :, 0] = gz
+    B[..., 5, :, 2] = gx
+    return B.reshape(shape + (6, 3 * n_nodes))
+
+
+def element_dofs(conn):
+    return (3 * conn[:, :, None] + np.arange(3)).reshape(conn.shape[0], -1)
+
+
+def element_stiffness(points, celltype, conn, D):
+    _, gradient_fn, quad_points, quad_weights, _ = ELEMENT_TYPES[celltype]
+    G, detJ = shape_gradients(points, conn, _gradient_table(gradient_fn, quad_points))
+    B = strain_displacement(G)
+    weights = np.abs(detJ) * quad_weights
+    return np.einsum("eqki,kl,eqlj,eq->eij", B, D, B, weights, optimize=True)
+
+
+def assemble_stiffness(mesh, E, nu, groups=None):
+    # Tüm eleman katkıları tek bir COO üçlüsüne yazılır, tekrar eden girdiler CSR'ye geçerken toplanır
+    points = np.asarray(mesh.points, dtype=float)
+    n_dofs = 3 * mesh.n_points
+    groups = groups or element_groups(mesh)
+    D = elasticity_matrix(E, nu)
+    n_entries = sum(conn.shape[0] * (3 * conn.shape[1]) ** 2 for _, _, conn in groups)
+    index_dtype = np.int32 if n_dofs < np.iinfo(np.int32).max else np.int64
+    data = np.empty(n_entries)
+    rows = np.empty(n_entries, dtype=index_dtype)
+    cols = np.empty(n_entries, dtype=index_dtype)
+    pos = 0
+    for celltype, _, conn in groups:
+        for start in range(0, conn.shape[0], ELEMENT_CHUNK_SIZE):
+            chunk = conn[start:start + ELEMENT_CHUNK_SIZE]
+            Ke = element_stiffness(points, celltype, chunk, D)
+            dofs = element_dofs(chunk)
+            end = pos + Ke.size
+            data[pos:end] = Ke.ravel()
+            rows[pos:end] = np.broadcast_to(dofs[:, :, None], Ke.shape).ravel()
+            cols[pos:end] = np.broadcast_to(dofs[:, None, :], Ke.shape).ravel()
+            pos = end
+    return sp.coo_matrix((data, (rows, cols)), shape=(n_dofs, n_dofs)).tocsr()
+
+
+def compute_element_stresses(mesh, displacements, E, nu, groups=None):
+    # Gerilmeler eleman ağırlık merkezinde değerlendirilir
+    points = np.asarray(mesh.points, dtype=float)
+    u = np.asarray(displacements, dtype=float).ravel()
+    D = elasticity_matrix(E, nu)
+    stresses = np.full((mesh.n_cells, 6), np.nan)
+    for celltype, cell_ids, conn in groups or element_groups(mesh):
+        _, gradient_fn, _, _, centroid = ELEMENT_TYPES[celltype]
+        dN = _gradient_table(gradient_fn, [centroid])
+        for start in range(0, conn.shape[0], ELEMENT_CHUNK_SIZE):
+            chunk = conn[start:start + ELEMENT_CHUNK_SIZE]
+            G, _ = shape_gradients(points, chunk, dN)
+            B = strain_displacement(G[:, 0])
+            strains = np.einsum("ekj,ej->ek", B, u[element_dofs(chunk)])
+            stresses[cell_ids[start:start + ELEMENT_CHUNK_SIZE]] = strains @ D.T
+    return stresses
+
+
+def model_key(mesh, E, nu, constrained_dofs):
+    # Mesh geometrisi + topolojisi, malzeme ve kısıtların özeti; yalnızca yükler değişince aynı kalır
+    digest = hashlib.blake2b(digest_size=20)
+    for array in (mesh.points, mesh.celltypes, mesh.offset, mesh.cell_connectivity, constrained_dofs):
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.dtype, array.shape)).encode("ascii"))
+        digest.update(memoryview(array).cast("B"))
+    digest.update(np.array([E, nu], dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _fixed_mask(n_dofs, constrained_dofs, diagonal):
+    # Hiçbir elemana bağlı olmayan düğümlerin serbestlik dereceleri de sabitlenir
+    fixed = np.zeros(n_dofs, dtype=bool)
+    fixed[constrained_dofs] = True
+    fixed |= diagonal == 0.0
+    return fixed
+
+
+def _single_history(load_matrix):
+    return [[] for _ in range(1 if load_matrix.ndim == 1 else load_matrix.shape[1])]
+
+
+class FactorizedSystem:
+    # Sabit serbestlik dereceleri elenmiş rijitlik matrisinin LU çarpanlarına ayrılmış hali
+    def __init__(self, mesh, E, nu, constrained_dofs, groups=None):
+        self.E, self.nu = E, nu
+        self.groups = groups or element_groups(mesh)
+        with span("solve.assemble", n_cells=mesh.n_cells):
+            K = assemble_stiffness(mesh, E, nu, self.groups)
+        self.n_dofs = K.shape[0]
+        self.free = np.flatnonzero(~_fixed_mask(self.n_dofs, constrained_dofs, K.diagonal()))
+        with span("solve.factorize", n_dofs=int(self.free.size)):
+            self.lu = splu(K[self.free][:, self.free].tocsc())
+
+    def solve(self, load_matrix, progress_callback=_no_progress):
+        # load_matrix: (n_dofs,) veya (n_dofs, n_durum); tüm durumlar tek geri yerine koyma ile çözülür.
+        # (U, durum başına artık geçmişi) döner; doğrudan çözümde geçmişler boştur.
+        load_matrix = np.asarray(load_matrix, dtype=float)
+        U = np.zeros(load_matrix.shape)
+        with span("solve.substitute"):
+            U[self.free] = self.lu.solve(np.ascontiguousarray(load_matrix[self.free]))
+        return U, _single_history(load_matrix)
+
+
+class ElementStiffnessOperator:
+    # Global matris kurulmadan K @ u. Eleman matrisleri saklanmaz (birleştirilmiş CSR'den büyük olurlardı);
+    # yalnızca integrasyon noktalarındaki global şekil fonksiyonu türevleri ve ağırlıkları tutulur.
+    # Çarpım her parçada σ = D ε(u) üzerinden yapılıp np.bincount ile serbestlik derecelerine toplanır.
+    def __init__(self, mesh, E, nu, groups):
+        points = np.asarray(mesh.points, dtype=float)
+        self.D = elasticity_matrix(E, nu)
+        self.n_dofs = 3 * mesh.n_points
+        self.blocks = []  # (bağlantı (e, a), türevler (e, q, a, 3), ağırlıklar (e, q))
+        for celltype, _, conn in groups:
+            _, gradient_fn, quad_points, quad_weights, _ = ELEMENT_TYPES[celltype]
+            dN = _gradient_table(gradient_fn, quad_points)
+            for start in range(0, conn.shape[0], ELEMENT_CHUNK_SIZE):
+                chunk = conn[start:start + ELEMENT_CHUNK_SIZE]
+                G, detJ = shape_gradients(points, chunk, dN)
+                self.blocks.append((chunk, G, np.abs(detJ) * quad_weights))
+
+    @property
+    def nbytes(self):
+        return sum(conn.nbytes + G.nbytes + weights.nbytes for conn, G, weights in self.blocks)
+
+    def matvec(self, u):
+        y = np.zeros(self.n_dofs)
+        u = np.asarray(u, dtype=float)
+        for conn, G, weights in self.blocks:
+            dofs = element_dofs(conn)
+            # grad[e, q, i, j] = ∂u_i/∂x_j; küçük boyutlu yığın çarpımlarında matmul einsum'dan belirgin hızlı
+            grad = np.matmul(u[dofs].reshape(conn.shape + (3,)).transpose(0, 2, 1)[:, None], G)
+            strain = np.stack([grad[..., 0, 0], grad[..., 1, 1], grad[..., 2, 2], grad[..., 0, 1] + grad[..., 1, 0],
+                               grad[..., 1, 2] + grad[..., 2, 1], grad[..., 0, 2] + grad[..., 2, 0]], axis=-1)
+            stress = (strain @ self.D.T) * weights[..., None]
+            sxx, syy, szz, sxy, syz, szx = np.moveaxis(stress, -1, 0)
+            tensor = np.stack([np.stack([sxx, sxy, szx], -1), np.stack([sxy, syy, syz], -1),
+                               np.stack([szx, syz, szz], -1)], -2)
+            forces = np.matmul(G, tensor).sum(axis=1)  # gerilme tensörü simetrik
+            y += np.bincount(dofs.ravel(), forces.ravel(), minlength=self.n_dofs)
+        return y
+
+    def _element_node_blocks(self, G, weights):
+        # K_aa (e, a, 3, 3): her eleman düğümünün kendi 3x3 köşegen bloğu
+        n_nodes = G.shape[2]
+        B = strain_displacement(G).reshape(G.shape[:2] + (6, n_nodes, 3))
+        return np.einsum("eqkai,kl,eqlaj,eq->eaij", B, self.D, B, weights, optimize=True)
+
+    def diagonal(self):
+        diagonal = np.zeros(self.n_dofs)
+        for conn, G, weights in self.blocks:
+            blocks = self._element_node_blocks(G, weights)
+            diagonal += np.bincount(element_dofs(conn).ravel(), np.einsum("eaii->eai", blocks).ravel(),
+                                    minlength=self.n_dofs)
+        return diagonal
+
+    def node_blocks(self):
+        # Düğüm başına 3x3 köşegen bloklar: (n_nodes, 3, 3)
+        n_nodes = self.n_dofs // 3
+        blocks = np.zeros((n_nodes, 9))
+        for conn, G, weights in self.blocks:
+            element_blocks = self._element_node_blocks(G, weights).reshape(-1, 9)
+            nodes = conn.ravel()
+            for c in range(9):
+                blocks[:, c] += np.bincount(nodes, element_blocks[:, c], minlength=n_nodes)
+        return blocks.reshape(n_nodes, 3, 3)
+
+
+def _csr_node_blocks(K):
+    base = 3 * np.arange(K.shape[0] // 3)
+    blocks = np.empty((base.size, 3, 3))
+    for a in range(3):
+        for b in range(3):
+            blocks[:, a, b] = np.asarray(K[base + a, base + b]).ravel()
+    return blocks
+
+
+def block_jacobi_preconditioner(node_blocks, fixed, free):
+    # Sabit bileşenlerin satır/sütunları birim yapılır; böylece serbest alt blokların tersi tek seferde alınır
+    fixed = fixed.reshape(-1, 3)
+    blocks = np.where(fixed[:, :, None] | fixed[:, None, :], 0.0, node_blocks)
+    diagonal = np.arange(3)
+    blocks[:, diagonal, diagonal] = np.where(fixed, 1.0, blocks[:, diagonal, diagonal])
+    inverse = np.linalg.inv(blocks)
+    dofs = 3 * np.arange(blocks.shape[0])[:, None] + diagonal
+    rows = np.broadcast_to(dofs[:, :, None], inverse.shape).ravel()
+    cols = np.broadcast_to(dofs[:, None, :], inverse.shape).ravel()
+    n_dofs = fixed.size
+    P = sp.csr_matrix((inverse.ravel(), (rows, cols)), shape=(n_dofs, n_dofs))
+    return aslinearoperator(P[free][:, free])
+
+
+class IterativeSystem:
+    # Ön koşullandırılmış eşlenik gradyan (CG). matrix_free=True ise global rijitlik matrisi hiç kurulmaz.
+    def __init__(self, mesh, E, nu, constrained_dofs, options, groups=None):
+        self.E, self.nu = E, nu
+        self.groups = groups or element_groups(mesh)
+        self.options = options
+        if options.matrix_free:
+            if options.preconditioner == "ilu":
+                raise ValueError("Eksik LU (ILU) ön koşullandırıcı matris içermeyen modda kullanılamaz.")
+            with span("solve.element_gradients", n_cells=mesh.n_cells):
+                element_operator = ElementStiffnessOperator(mesh, E, nu, self.groups)
+            self.n_dofs = element_operator.n_dofs
+            diagonal = element_operator.diagonal()
+        else:
+            with span("solve.assemble", n_cells=mesh.n_cells):
+                K = assemble_stiffness(mesh, E, nu, self.groups)
+            self.n_dofs = K.shape[0]
+            diagonal = K.diagonal()
+        fixed = _fixed_mask(self.n_dofs, constrained_dofs, diagonal)
+        self.free = np.flatnonzero(~fixed)
+        n_free = self.free.size
+
+        if options.matrix_free:
+            def matvec(x):
+                u = np.zeros(self.n_dofs)
+                u[self.free] = np.ravel(x)
+                return element_operator.matvec(u)[self.free]
+            self.operator = LinearOperator((n_free, n_free), matvec=matvec, dtype=float)
+        else:
+            K_free = K[self.free][:, self.free]
+            self.operator = K_free
+
+        with span("solve.preconditioner", kind=options.preconditioner):
+            if options.preconditioner == "jacobi":
+                inverse_diagonal = 1.0 / diagonal[self.free]
+                self.preconditioner = LinearOperator((n_free, n_free), matvec=lambda x: inverse_diagonal * np.ravel(x),
+                                                     dtype=float)
+            elif options.preconditioner == "block_jacobi":
+                node_blocks = element_operator.node_blocks() if options.matrix_free else _csr_node_blocks(K)
+                self.preconditioner = block_jacobi_preconditioner(node_blocks, fixed, self.free)
+            elif options.preconditioner == "ilu":
+                # Köşegen pivotlama ve simetrik sıralama. Eksik L ve U birbirinin devriği olmadığından uygulama
+                # (U⁻¹L⁻¹ + L⁻ᵀU⁻ᵀ) / 2 ile simetrikleştirilir; aksi halde CG küçük mesh'lerde bile durabiliyor
+                ilu = spilu(K_free.tocsc(), drop_tol=ILU_DROP_TOLERANCE, fill_factor=ILU_FILL_FACTOR,
+                            diag_pivot_thresh=0.0, permc_spec="MMD_AT_PLUS_A")
+                self.preconditioner = LinearOperator(
+                    (n_free, n_free), matvec=lambda x: 0.5 * (ilu.solve(np.ravel(x)) + ilu.solve(np.ravel(x), "T")),
+                    dtype=float)
+            else:
+                raise ValueError(f"Bilinmeyen ön koşullandırıcı: {options.preconditioner}")
+
+    def _solve_one(self, b, label, progress_callback):
+        norm_b = np.linalg.norm(b)
+        if norm_b == 0.0:
+            return np.zeros_like(b), [(0, 0.0)]
+        history = []
+        iteration = 0
+
+        def callback(xk):
+            nonlocal iteration
+            iteration += 1
+            if iteration % RESIDUAL_REPORT_INTERVAL == 0:
+                residual = float(np.linalg.norm(b - self.operator @ xk)) / norm_b
+                history.append((iteration, residual))
+                progress_callback(f"{label}yineleme {iteration}, göreli artık {residual:.2e}")
+
+        with span("solve.pcg", n_dofs=int(b.size)):
+            x, info = cg(self.operator, b, rtol=self.options.tolerance, atol=0.0,
+                         maxiter=self.options.max_iterations, M=self.preconditioner, callback=callback)
+        residual = float(np.linalg.norm(b - self.operator @ x)) / norm_b
+        history.append((iteration, residual))
+        if info > 0:
+            raise ValueError(f"Yinelemeli çözüm {iteration} yinelemede yakınsamadı (göreli artık {residual:.2e}). "
+                             "Farklı bir ön koşullandırıcı veya doğrudan çözücü deneyin.")
+        return x, history
+
+    def solve(self, load_matrix, progress_callback=_no_progress):
+        # Her yük durumu ayrı CG ile çözülür; (U, durum başına [(yineleme, göreli artık), ...]) döner
+        load_matrix = np.asarray(load_matrix, dtype=float)
+        columns = load_matrix.reshape(load_matrix.shape[0], -1)
+        U = np.zeros(columns.shape)
+        histories = []
+        for j in range(columns.shape[1]):
+            label = f"durum {j + 1}/{columns.shape[1]}: " if columns.shape[1] > 1 else ""
+            U[self.free, j], history = self._solve_one(columns[self.free, j], label, progress_callback)
+            histories.append(history)
+        return U.reshape(load_matrix.shape), histories
+
+
+def estimated_direct_memory(n_free_dofs):
+    # LU çarpanlarının tahmini boyutu (bayt): float64 değer + int32 indeks başına 12 bayt
+    return DIRECT_FILL_COEFFICIENT * float(n_free_dofs) ** 1.5 * 12
+
+
+def default_memory_budget():
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2
+    except (AttributeError, ValueError, OSError):
+        return 8 * 1024 ** 3
+
+
+def choose_method(n_free_dofs, options):
+    if options.method != "auto":
+        return options.method
+    budget = options.memory_budget or default_memory_budget()
+    return "direct" if estimated_direct_memory(n_free_dofs) <= budget else "iterative"
+
+
+_SYSTEM_CACHE_SIZE = 2
+_system_cache = OrderedDict()
+_system_lock = threading.Lock()
+
+
+def clear_factorization_cache():
+    with _system_lock:
+        _system_cache.clear()
+
+
+def prepare_system(mesh, material_properties, constrained_dofs, options=None):
+    # Doğrudan (LU) veya yinelemeli sistem; aynı model ve ayarlar için önbellekten döner
+    options = options or SolverOptions()
+    E, nu = check_material(material_properties)
+    if len(constrained_dofs) == 0:
+        raise ValueError("Çözüm için en az bir sabitlenmiş düğüm gereklidir.")
+    if options.method not in SOLVER_METHODS:
+        raise ValueError(f"Bilinmeyen çözücü yöntemi: {options.method}")
+    # Mesh tipi anahtar hesaplanmadan önce denetlenir (yüzey mesh'lerinde celltypes yoktur)
+    groups = element_groups(mesh)
+    constrained_dofs = np.asarray(constrained_dofs, dtype=np.int64)
+    n_free_dofs = 3 * mesh.n_points - constrained_dofs.size
+    method = choose_method(n_free_dofs, options)
+    key = model_key(mesh, E, nu, constrained_dofs)
+    if method == "iterative":
+        key += repr((options.preconditioner, options.matrix_free, options.tolerance, options.max_iterations))
+    with _system_lock:
+        system = _system_cache.get(key)
+        if system is not None:
+            _system_cache.move_to_end(key)
+            return system
+    # Kurulum süresi ve boyutu profil olayına yazılır; kütüphane stdout'a yazmaz
+    if method == "direct":
+        with span("solve.prepare", method=method, n_free_dofs=n_free_dofs):
+            system = FactorizedSystem(mesh, E, nu, constrained_dofs, groups)
+    else:
+        with span("solve.prepare", method=method, n_free_dofs=n_free_dofs,
+                  preconditioner=options.preconditioner, matrix_free=options.matrix_free):
+            system = IterativeSystem(mesh, E, nu, constrained_dofs, options, groups)
+    with _system_lock:
+        _system_cache[key] = system
+        while len(_system_cache) > _SYSTEM_CACHE_SIZE:
+            _system_cache.popitem(last=False)
+    return system
+
+
+def solve_load_cases(mesh, material_properties, constrained_dofs, load_vectors, options=None,
+                     progress_callback=_no_progress):
+    # load_vectors: {durum adı: (3 * n_points,) yük vektörü} -> {durum adı: LinearElasticResult}
+    system = prepare_system(mesh, material_properties, constrained_dofs, options)
+    names = list(load_vectors)
+    if not names:
+        return {}
+    U, histories = system.solve(np.column_stack([np.asarray(load_vectors[name], dtype=float) for name in names]),
+                                progress_callback)
+    results = {}
+    for i, name in enumerate(names):
+        displacements = U[:, i].reshape(-1, 3)
+        with span("solve.stresses"):
+            stresses = compute_element_stresses(mesh, displacements, system.E, system.nu, system.groups)
+        results[name] = LinearElasticResult(displacements, stresses, histories[i])
+    return results
+
+
+def solve_linear_elastic(mesh, material_properties, constrained_dofs, load_vector, options=None):
+    # constrained_dofs: sabit serbestlik derecesi indeksleri (3 * düğüm + bileşen), load_vector: (3 * n_points,)
+    return solve_load_cases(mesh, material_properties, constrained_dofs, {None: load_vector}, options)[None]
@@ -0,0 +1,30 @@
+# spatial_index.py
+import numpy as np
+from scipy.spatial import cKDTree
+
+from profiling import span
+
+
+class NodeIndex:
+    # Mesh düğümleri üzerinde KD-tree; bir kez kurulur, mesh değişince yenisi kurulur.
+    def __init__(self, points):
+        points = np.asarray(points)
+        with span("pick.index_build", n_points=len(points)):
+            self.tree = cKDTree(points)
+
+    @property
+    def n_points(self):
+        return self.tree.n
+
+    def nearest(self, point):
+        distance, node_index = self.tree.query(np.asarray(point, dtype=float), k=1)
+        return int(node_index), float(distance)
+
+    def k_nearest(self, point, k):
+        k = min(int(k), self.n_points)
+        distances, node_indices = self.tree.query(np.asarray(point, dtype=float), k=k)
+        return np.atleast_1d(node_indices), np.atleast_1d(distances)
+
+    def within_radius(self, point, radius):
+        node_indices = self.tree.query_ball_point(np.asarray(point, dtype=float), r=radius)
+        return np.sort(np.asarray(node_indices, dtype=np.int64))
@@ -0,0 +1,29 @@
+import os
+
+from batch import BLAS_THREAD_VARIABLES, run_batch, solver_options
+from benchmark import synthetic_mesh
+
+
+def test_solver_block_without_method_defaults_to_auto():
+    assert solver_options({}).method == "auto"
+    options = solver_options({"solver": {"tolerance": 1e-6}})
+    assert (options.method, options.tolerance) == ("auto", 1e-6)
+    assert solver_options({"solver": {"method": "iterative"}}).method == "iterative"
+
+
+def test_run_batch_restores_thread_environment(tmp_path, monkeypatch):
+    mesh_path = str(tmp_path / "cube.vtu")
+    synthetic_mesh(200).save(mesh_path)
+    monkeypatch.setenv("OMP_NUM_THREADS", "7")
+    for variable in BLAS_THREAD_VARIABLES[1:]:
+        monkeypatch.delenv(variable, raising=False)
+    job = {"name": "kup", "mesh": mesh_path, "material": {"E": 210e9, "nu": 0.3},
+           "fixed": [{"plane": {"origin": [0, 0, 0], "normal": [0, 0, 1], "tolerance": 1e-6}}],
+           "loads": {"Yük 1": [{"plane": {"origin": [0, 0, 1], "normal": [0, 0, 1], "tolerance": 1e-6},
+                                "total_force": [0, 0, -1000]}]}}
+
+    summaries, failures = run_batch({"jobs": [job]}, str(tmp_path / "out"), workers=1, blas_threads=2)
+
+    assert not failures and summaries[0]["max_displacement"] > 0
+    assert os.environ["OMP_NUM_THREADS"] == "7"
+    assert all(variable not in os.environ for variable in BLAS_THREAD_VARIABLES[1:])
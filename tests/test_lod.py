@@ -0,0 +1,31 @@
+import numpy as np
+import pyvista as pv
+from vtkmodules.vtkCommonCore import reference
+from vtkmodules.vtkRenderingCore import vtkAbstractMapper
+
+from benchmark import synthetic_mesh
+from lod import build_lod_levels
+from mesh_io import build_render_mesh
+from postprocessing import RESULT_ARRAY, show_result_scalars, surface_source_ids
+
+
+def test_lod_levels_map_result_fields_to_source_mesh():
+    mesh = synthetic_mesh(80000, "unstructured")
+    levels = build_lod_levels(build_render_mesh(mesh))
+    assert levels
+
+    point_values = np.asarray(mesh.points)[:, 0]
+    cell_values = np.asarray(mesh.cell_centers().points)[:, 0]
+    for level in levels:
+        point_ids = surface_source_ids(level, "point")
+        cell_ids = surface_source_ids(level, "cell")
+        # Vekil düğüm/hücre konumundaki değer, eşlendiği asıl düğüm/hücrenin değerine yakın olmalı
+        assert np.abs(point_values[point_ids] - level.points[:, 0]).max() < 0.1
+        assert np.abs(cell_values[cell_ids] - level.cell_centers().points[:, 0]).max() < 0.1
+
+        for location, values, ids in (("point", point_values, point_ids), ("cell", cell_values, cell_ids)):
+            mapper = pv.DataSetMapper(level)
+            show_result_scalars(mapper, values, location, "viridis", (0.0, 1.0), ids)
+            colored = vtkAbstractMapper.GetScalars(level, mapper.GetScalarMode(), mapper.GetArrayAccessMode(),
+                                                   mapper.GetArrayId(), mapper.GetArrayName(), reference(0))
+            assert colored.GetName() == RESULT_ARRAY
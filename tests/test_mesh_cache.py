@@ -0,0 +1,59 @@
+import os
+
+import mesh_cache
+from bc_store import BoundaryConditionStore
+from benchmark import synthetic_mesh
+from mesh_cache import MeshCache, file_fingerprint
+from mesh_io import load_mesh_file
+from project import ProjectState, is_project, save_project
+
+
+def test_cache_only_removes_its_own_entries(tmp_path):
+    # Önbellek kökü olarak seçilen klasördeki proje ve diğer dizinler temizleme/boşaltmadan etkilenmez
+    mesh = synthetic_mesh(500, "unstructured")
+    mesh_path = str(tmp_path / "beam.vtu")
+    mesh.save(mesh_path)
+    project_path = str(tmp_path / "model.feaproj")
+    save_project(project_path, ProjectState(mesh_path, mesh, {"E": 1.0, "nu": 0.3}, BoundaryConditionStore(mesh.n_points)),
+                 embed_mesh=True)
+    os.makedirs(tmp_path / "notlar")
+
+    cache = MeshCache(str(tmp_path), max_bytes=0)
+    cache.put(mesh_path, mesh)
+    os.makedirs(os.path.join(cache.directory, "kullanici"))
+    assert len(cache.entries()) == 1
+    cache.evict()  # boyut sınırı 0: tüm kayıtlar boşaltılır
+    assert cache.entries() == []
+    cache.put(mesh_path, mesh)
+    cache.clear()
+
+    assert cache.entries() == []
+    assert is_project(project_path)
+    assert os.path.isdir(tmp_path / "notlar")
+    assert os.path.isdir(os.path.join(cache.directory, "kullanici"))
+
+
+def test_corrupt_entry_is_reported_to_caller(tmp_path):
+    mesh_path = str(tmp_path / "beam.vtu")
+    synthetic_mesh(500, "unstructured").save(mesh_path)
+    cache = MeshCache(str(tmp_path / "cache"))
+    load_mesh_file(mesh_path, cache=cache)
+    (_, _, entry), = cache.entries()
+    os.remove(os.path.join(entry, "points.npy"))
+
+    mesh, cache_error = load_mesh_file(mesh_path, cache=cache)
+    assert mesh.n_points == 512 and "okunamadı" in cache_error
+    # Bozuk kayıt silinip yeniden yazılır; sonraki açılış önbellekten hatasız okunur
+    assert load_mesh_file(mesh_path, cache=cache)[1] is None
+
+
+def test_cold_load_hashes_file_once(tmp_path, monkeypatch):
+    mesh_path = str(tmp_path / "beam.vtu")
+    synthetic_mesh(500, "unstructured").save(mesh_path)
+    calls = []
+    monkeypatch.setattr(mesh_cache, "file_fingerprint", lambda *args: calls.append(args) or file_fingerprint(*args))
+    cache = MeshCache(str(tmp_path / "cache"), hash_content=True)
+
+    load_mesh_file(mesh_path, cache=cache)
+    assert calls == [(mesh_path, True)]
+    assert len(cache.entries()) == 1
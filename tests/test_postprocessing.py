@@ -0,0 +1,47 @@
+import numpy as np
+import pyvista as pv
+from vtkmodules.vtkCommonCore import reference
+from vtkmodules.vtkRenderingCore import vtkAbstractMapper
+
+from benchmark import synthetic_mesh
+from postprocessing import (
+    RESULT_ARRAY, node_cell_incidence, nodal_average, show_result_scalars, surface_source_ids, von_mises
+)
+
+
+def colored_array(mapper):
+    # Eşleyicinin çizimde renklendirmek için seçeceği dizi
+    cell_flag = reference(0)
+    return vtkAbstractMapper.GetScalars(mapper.dataset, mapper.GetScalarMode(), mapper.GetArrayAccessMode(),
+                                        mapper.GetArrayId(), mapper.GetArrayName(), cell_flag)
+
+
+def test_nodal_average_matches_cell_loop():
+    mesh = synthetic_mesh(500, "unstructured")
+    values = np.random.default_rng(0).random(mesh.n_cells)
+    averaged = nodal_average(node_cell_incidence(mesh), values)
+    node = 7
+    cells = [c for c in range(mesh.n_cells) if node in mesh.get_cell(c).point_ids]
+    assert np.isclose(averaged[node], values[cells].mean())
+
+
+def test_von_mises_uniaxial():
+    assert np.allclose(von_mises(np.array([[3.0, 0, 0, 0, 0, 0], [0, 0, 0, 2.0, 0, 0]])), [3.0, 2.0 * np.sqrt(3.0)])
+
+
+def test_result_scalars_override_active_scalars():
+    mesh = synthetic_mesh(500, "unstructured")
+    mesh.cell_data["sample_cell_scalars"] = np.arange(mesh.n_cells, dtype=float)
+    mesh.point_data["sample_point_scalars"] = np.arange(mesh.n_points, dtype=float)
+    surface = mesh.extract_surface(pass_pointid=True, pass_cellid=True)
+    plotter = pv.Plotter(off_screen=True)
+    actor = plotter.add_mesh(surface, scalars="sample_cell_scalars")
+    values = np.random.default_rng(1).random(mesh.n_cells)
+    for location in ("cell", "point"):
+        location_values = values if location == "cell" else values[:mesh.n_points]
+        ids = surface_source_ids(surface, location)
+        show_result_scalars(actor.mapper, location_values, location, "viridis", (0.0, 1.0), ids)
+        array = colored_array(actor.mapper)
+        assert array.GetName() == RESULT_ARRAY
+        assert np.allclose(pv.convert_array(array), location_values[ids])
+    plotter.close()
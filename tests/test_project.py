@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+import pytest
+
+from bc_store import BoundaryConditionStore
+from benchmark import synthetic_mesh
+from project import DATA_DIR_PREFIX, ProjectState, open_project, save_project
+from solver import LinearElasticResult
+
+
+@pytest.mark.parametrize("embed_mesh", [True, False])
+def test_resave_open_project_to_same_path(tmp_path, embed_mesh):
+    # Açık projenin sonuçları bellek eşlemeliyken aynı yola yeniden kayıt (Ctrl+S)
+    mesh_path = str(tmp_path / "beam.vtu")
+    mesh = synthetic_mesh(500, "unstructured")
+    mesh.save(mesh_path)
+    bcs = BoundaryConditionStore(mesh.n_points)
+    bcs.fix(np.arange(10))
+    rng = np.random.default_rng(0)
+    result = LinearElasticResult(rng.random((mesh.n_points, 3)), rng.random((mesh.n_cells, 6)), [(1, 0.5)])
+    path = str(tmp_path / "model.feaproj")
+    save_project(path, ProjectState(mesh_path, mesh, {"E": 1.0, "nu": 0.3}, bcs, {"Yük 1": result}, "Yük 1"),
+                 embed_mesh=embed_mesh)
+
+    opened = open_project(path)
+    assert isinstance(opened.results["Yük 1"].displacements, np.memmap)
+    save_project(path, opened, embed_mesh=embed_mesh)
+
+    # İlk oturumun dizileri okunabilir kalır, yeniden açılan proje aynı veriyi taşır
+    assert np.array_equal(opened.results["Yük 1"].displacements, result.displacements)
+    reopened = open_project(path)
+    assert np.array_equal(reopened.results["Yük 1"].stresses, result.stresses)
+    assert np.array_equal(reopened.bcs.fixity, bcs.fixity)
+    assert reopened.mesh.n_points == mesh.n_points
+    data_dirs = [name for name in os.listdir(path) if name.startswith(DATA_DIR_PREFIX)]
+    assert len(data_dirs) == 1
@@ -0,0 +1,29 @@
+import gc
+
+import numpy as np
+
+from benchmark import synthetic_mesh
+from mesh_cache import MeshCache
+from renumbering import ORIGINAL_IDS, renumber
+from solver import model_key
+
+
+def test_renumbered_mesh_outlives_memory_mapped_source(tmp_path):
+    # Önbellekten (mmap) okunan mesh bırakıldıktan sonra yeniden numaralanmış mesh geçerli kalmalı
+    source_path = str(tmp_path / "beam.vtu")
+    synthetic_mesh(2000, "unstructured").save(source_path)
+    cache = MeshCache(str(tmp_path / "cache"))
+    cache.put(source_path, synthetic_mesh(2000, "unstructured"))
+    cached = cache.get(source_path)
+    cached.cell_data["material_id"] = np.arange(cached.n_cells)
+
+    renumbered, info = renumber(cached, "rcm")
+    expected_offsets = np.array(cached.offset)
+    expected_key = model_key(renumbered, 1.0, 0.3, np.arange(3))
+    del cached
+    gc.collect()
+
+    assert np.array_equal(renumbered.offset, expected_offsets)
+    assert np.array_equal(renumbered.cell_data["material_id"], np.arange(renumbered.n_cells))
+    assert np.array_equal(renumbered.point_data[ORIGINAL_IDS], info.perm)
+    assert model_key(renumbered, 1.0, 0.3, np.arange(3)) == expected_key
@@ -0,0 +1,14 @@
+import numpy as np
+
+from selection import nodes_in_sphere
+from spatial_index import NodeIndex
+
+
+def test_sphere_selection_with_index_matches_scan():
+    points = np.random.default_rng(0).random((5000, 3))
+    index = NodeIndex(points)
+    for center, radius in (((0.5, 0.5, 0.5), 0.2), ((0.0, 0.0, 0.0), 0.3), ((2.0, 2.0, 2.0), 0.1)):
+        expected = nodes_in_sphere(points, center, radius)
+        selected = nodes_in_sphere(points, center, radius, index)
+        assert np.array_equal(selected, expected)
+        assert selected.dtype == np.int64
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+import pyvista as pv
+
+from benchmark import synthetic_mesh
+from solver import (
+    ELEMENT_TYPES, VTK_HEXAHEDRON, VTK_QUADRATIC_TETRA, VTK_TETRA, ElementStiffnessOperator, SolverOptions,
+    assemble_stiffness, choose_method, elasticity_matrix, element_groups, element_stiffness, solve_linear_elastic,
+    solve_load_cases
+)
+
+E, NU = 200.0, 0.3
+MATERIAL = {"E": E, "nu": NU}
+TET4_FACES = ((0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3))
+TET10_EDGES = ((0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3))
+
+
+def tet10_mesh(n_nodes):
+    # Dörtyüzlü mesh'in her kenarına orta düğüm eklenir (VTK tet10 sırası)
+    tet4 = synthetic_mesh(n_nodes, "unstructured")
+    corners = np.asarray(tet4.cell_connectivity).reshape(-1, 4)
+    edges = np.sort(corners[:, TET10_EDGES], axis=2)
+    unique_edges, edge_ids = np.unique(edges.reshape(-1, 2), axis=0, return_inverse=True)
+    points = np.vstack([tet4.points, tet4.points[unique_edges].mean(axis=1)])
+    cells = np.hstack([corners, tet4.n_points + edge_ids.reshape(-1, 6)])
+    return pv.UnstructuredGrid({VTK_QUADRATIC_TETRA: cells}, points)
+
+
+def end_face_loads(mesh, total_force):
+    # x = 1 yüzüne düzgün yayılı çekme kuvvetinin tutarlı düğüm yükleri (birim kare kesit)
+    points = np.asarray(mesh.points)
+    loads = np.zeros(mesh.n_points)
+    if mesh.celltypes[0] == VTK_QUADRATIC_TETRA:
+        # 6 düğümlü üçgen yüzde köşelerin payı sıfır, her kenar ortası alanın 1/3'ünü alır
+        conn = np.asarray(mesh.cell_connectivity).reshape(-1, 10)
+        for face in TET4_FACES:
+            on_face = np.all(points[conn[:, face], 0] > 1.0 - 1e-9, axis=1)
+            corners = points[conn[on_face][:, face]]
+            areas = 0.5 * np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+            mids = [4 + TET10_EDGES.index(edge if edge in TET10_EDGES else edge[::-1])
+                    for edge in ((face[0], face[1]), (face[1], face[2]), (face[2], face[0]))]
+            for mid in mids:
+                np.add.at(loads, conn[on_face, mid], areas / 3.0)
+    else:
+        # Düzgün hex ızgarasında çift doğrusal yüzün payları yamuk kuralı ağırlıklarının çarpımıdır
+        axis = np.unique(points[:, 1])
+        weights = np.diff(axis, prepend=axis[0]) / 2.0 + np.diff(axis, append=axis[-1]) / 2.0
+        face = np.flatnonzero(points[:, 0] > 1.0 - 1e-9)
+        iy = np.searchsorted(axis, points[face, 1])
+        iz = np.searchsorted(axis, points[face, 2])
+        loads[face] = weights[iy] * weights[iz]
+    vector = np.zeros((mesh.n_points, 3))
+    vector[:, 0] = total_force * loads
+    return vector.ravel()
+
+
+def roller_dofs(mesh):
+    # x = 0, y = 0, z = 0 yüzlerinde yalnızca normal bileşen sabit: tek eksenli gerilme durumu tam temsil edilir
+    points = np.asarray(mesh.points)
+    return np.concatenate([3 * np.flatnonzero(points[:, axis] < 1e-9) + axis for axis in range(3)])
+
+
+@pytest.mark.parametrize("mesh", [synthetic_mesh(600, "structured"), tet10_mesh(100)], ids=["hex8", "tet10"])
+def test_uniaxial_bar_tip_displacement(mesh):
+    # Birim küp çubuk (L = 1, A = 1), uçta toplam F: u_x(L) = F L / (E A), enine daralma -ν F y / (E A)
+    F = 3.0
+    result = solve_linear_elastic(mesh, MATERIAL, roller_dofs(mesh), end_face_loads(mesh, F),
+                                  SolverOptions(method="direct"))
+    points = np.asarray(mesh.points)
+    expected = np.column_stack([F * points[:, 0], -NU * F * points[:, 1], -NU * F * points[:, 2]]) / E
+    tip = points[:, 0] > 1.0 - 1e-9
+    assert np.allclose(result.displacements[tip, 0], F / E, rtol=1e-8)
+    assert np.allclose(result.displacements, expected, atol=1e-10)
+    assert np.allclose(result.stresses, [F, 0, 0, 0, 0, 0], atol=1e-8)
+
+
+@pytest.mark.parametrize("celltype", sorted(ELEMENT_TYPES))
+def test_element_stiffness_is_symmetric_with_rigid_body_null_space(celltype):
+    # Çarpıtılmış tek eleman: Ke simetrik, rijit cisim hareketleri (3 öteleme + 3 dönme) şekil değiştirme enerjisi üretmez
+    mesh = {VTK_HEXAHEDRON: synthetic_mesh(8, "structured"), VTK_TETRA: synthetic_mesh(8, "unstructured"),
+            VTK_QUADRATIC_TETRA: tet10_mesh(8)}[celltype]
+    points = np.asarray(mesh.points) + 0.05 * np.random.default_rng(1).standard_normal((mesh.n_points, 3))
+    n_nodes = ELEMENT_TYPES[celltype][0]
+    conn = np.asarray(mesh.cell_connectivity)[:n_nodes][None]
+    Ke = element_stiffness(points, celltype, conn, elasticity_matrix(E, NU))[0]
+    assert np.allclose(Ke, Ke.T, atol=1e-12 * np.abs(Ke).max())
+
+    x = points[conn[0]]
+    modes = [np.tile(np.eye(3)[i], (n_nodes, 1)) for i in range(3)]
+    modes += [np.cross(np.eye(3)[i], x) for i in range(3)]
+    for mode in modes:
+        assert abs(mode.ravel() @ Ke @ mode.ravel()) < 1e-10 * np.abs(Ke).max()
+    assert np.linalg.matrix_rank(Ke, tol=1e-8 * np.abs(Ke).max()) == 3 * n_nodes - 6
+
+
+@pytest.mark.parametrize("options", [
+    SolverOptions(method="iterative", preconditioner="jacobi", tolerance=1e-10),
+    SolverOptions(method="iterative", preconditioner="block_jacobi", tolerance=1e-10),
+    SolverOptions(method="iterative", preconditioner="ilu", tolerance=1e-10),
+    SolverOptions(method="iterative", preconditioner="block_jacobi", matrix_free=True, tolerance=1e-10),
+], ids=["jacobi", "block_jacobi", "ilu", "matrix_free"])
+def test_iterative_solution_matches_direct_for_all_load_cases(options):
+    # Konsol kiriş, iki yük durumu tek çağrıda (çoklu sağ taraf)
+    mesh = synthetic_mesh(1500, "unstructured")
+    points = np.asarray(mesh.points)
+    fixed = np.flatnonzero(points[:, 0] < 1e-9)
+    tip = np.flatnonzero(points[:, 0] > 1.0 - 1e-9)
+    bending, torsion = np.zeros((mesh.n_points, 3)), np.zeros((mesh.n_points, 3))
+    bending[tip, 2] = -1.0
+    torsion[tip] = np.cross([1.0, 0.0, 0.0], points[tip] - [1.0, 0.5, 0.5])
+    loads = {"eğilme": bending.ravel(), "burulma": torsion.ravel()}
+    constrained = (3 * fixed[:, None] + np.arange(3)).ravel()
+
+    direct = solve_load_cases(mesh, MATERIAL, constrained, loads, SolverOptions(method="direct"))
+    iterative = solve_load_cases(mesh, MATERIAL, constrained, loads, options)
+    for case in loads:
+        scale = np.abs(direct[case].displacements).max()
+        assert np.allclose(iterative[case].displacements, direct[case].displacements, atol=1e-6 * scale)
+        assert iterative[case].residual_history[-1][1] < 1e-9
+    single = solve_linear_elastic(mesh, MATERIAL, constrained, loads["burulma"], SolverOptions(method="direct"))
+    assert np.allclose(single.displacements, direct["burulma"].displacements)
+
+
+def test_surface_mesh_is_rejected_with_message():
+    with pytest.raises(ValueError, match="UnstructuredGrid"):
+        solve_linear_elastic(pv.Sphere(), {"E": 1.0, "nu": 0.3}, np.arange(3), np.zeros(3 * pv.Sphere().n_points))
+
+
+@pytest.mark.parametrize("kind", ["structured", "unstructured"])
+def test_matrix_free_operator_is_smaller_than_assembled_matrix(kind):
+    mesh = synthetic_mesh(3000, kind)
+    groups = element_groups(mesh)
+    K = assemble_stiffness(mesh, 200.0, 0.3, groups)
+    operator = ElementStiffnessOperator(mesh, 200.0, 0.3, groups)
+
+    u = np.random.default_rng(0).random(K.shape[0])
+    assert np.allclose(operator.matvec(u), K @ u, rtol=1e-12, atol=1e-12 * np.abs(K @ u).max())
+    assert np.allclose(operator.diagonal(), K.diagonal())
+    assert operator.nbytes < K.data.nbytes + K.indices.nbytes
+
+
+def test_default_method_is_auto():
+    assert SolverOptions().method == "auto"
+    assert choose_method(3000, SolverOptions()) == "direct"
+    assert choose_method(3000, SolverOptions(memory_budget=1)) == "iterative"
@@ -0,0 +1,55 @@
+# workers.py
+import threading
+import traceback
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+
+class WorkerCancelled(Exception):
+    pass
+
+
+class WorkerSignals(QObject):
+    finished = Signal(object)
+    error = Signal(str)
+    progress = Signal(str)
+    cancelled = Signal()
+
+
+class Worker(QRunnable):
+    # Uzun süren işleri QThreadPool üzerinde çalıştırır; sonuç sinyallerle UI thread'ine döner.
+    # progress=True ise fn'e progress_callback verilir; iptal edilmiş bir işte bu çağrı WorkerCancelled fırlatır.
+    def __init__(self, fn, *args, progress=False, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+        if progress:
+            self.kwargs["progress_callback"] = self.report_progress
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def report_progress(self, message):
+        if self.is_cancelled():
+            raise WorkerCancelled()
+        self.signals.progress.emit(message)
+
+    @Slot()
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+            if self.is_cancelled():
+                raise WorkerCancelled()
+        except WorkerCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)